@@ -0,0 +1,72 @@
+"""Quantifier instantiations of the free-variable tableau with and without preprocessing.
+
+Run from the repository root with ``python -m benchmarks.bench_first_order``.
+The problems are first-order theorems, most of them from Pelletier's
+"Seventy-five problems for testing automatic theorem provers".
+"""
+import time
+
+from symlogos.connectives import And, Implication, Not, Or
+from symlogos.expressions_and_terms import Term
+from symlogos.free_variable_tableau import FreeVariableTableau
+from symlogos.functions_and_predicates import Predicate
+from symlogos.quantifiers import Exists, Forall
+
+x, y, z = Term("x"), Term("y"), Term("z")
+a = Term("a")
+
+
+def F(term):
+    return Predicate("F", term)
+
+
+def G(term):
+    return Predicate("G", term)
+
+
+def R(left, right):
+    return Predicate("R", left, right)
+
+
+def Iff(left, right):
+    return And(Implication(left, right), Implication(right, left))
+
+
+PROBLEMS = {
+    "distribute forall": ([Forall(x, And(F(x), G(x)))], And(Forall(x, F(x)), Forall(x, G(x)))),
+    "distribute exists": ([Or(Exists(x, F(x)), Exists(x, G(x)))], Exists(x, Or(F(x), G(x)))),
+    "pelletier 18": ([], Exists(y, Forall(x, Implication(F(y), F(x))))),
+    "pelletier 19": ([], Exists(x, Forall(y, Forall(z, Implication(Implication(F(y), G(z)), Implication(F(x), G(x))))))),
+    "pelletier 20": ([Forall(x, Forall(y, Exists(z, Forall(Term("w"), Implication(And(F(x), F(y)), And(G(z), R(Term("w"), Term("w")))))))),
+                      Forall(x, Forall(y, And(F(x), F(y))))],
+                     Exists(z, G(z))),
+    "pelletier 21": ([Exists(x, Implication(Predicate("P"), F(x))), Exists(x, Implication(F(x), Predicate("P")))],
+                     Exists(x, Iff(Predicate("P"), F(x)))),
+    "pelletier 22": ([], Implication(Forall(x, Iff(Predicate("P"), F(x))), Iff(Predicate("P"), Forall(x, F(x))))),
+    "pelletier 23": ([], Iff(Forall(x, Or(Predicate("P"), F(x))), Or(Predicate("P"), Forall(x, F(x))))),
+    "pelletier 30": ([Forall(x, Implication(Or(F(x), G(x)), Not(Predicate("H", x)))),
+                      Forall(x, Implication(Implication(G(x), Not(Predicate("I", x))), And(F(x), Predicate("H", x))))],
+                     Forall(x, Predicate("I", x))),
+    "scoped chain": ([Forall(x, Forall(y, And(Implication(F(x), G(x)), R(y, y)))), F(a)], And(G(a), R(a, a))),
+}
+
+
+def main(max_instances=4):
+    totals = {False: 0, True: 0}
+    print(f"{'problem':20s} {'raw':>14s} {'preprocessed':>14s}")
+    for name, (premises, conclusion) in PROBLEMS.items():
+        cells = []
+        for preprocess in (False, True):
+            tableau = FreeVariableTableau(max_instances=max_instances, preprocess=preprocess)
+            start = time.perf_counter()
+            result = tableau.prove(premises, conclusion)
+            elapsed = time.perf_counter() - start
+            totals[preprocess] += tableau.instantiations
+            cells.append(f"{tableau.instantiations:5d} {result.name[0]} {elapsed * 1e3:5.1f}ms")
+        print(f"{name:20s} {cells[0]:>14s} {cells[1]:>14s}")
+    saved = totals[False] - totals[True]
+    print(f"instantiations: {totals[False]} raw, {totals[True]} preprocessed, {saved} saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cold-start cost of importing the prover.
+
+Run from the repository root with ``python -m benchmarks.bench_import``.
+Each measurement imports the modules in a fresh interpreter. The script
+exits with status 1 when the best time exceeds the budget or when sympy
+is imported along the way, so it can gate CI.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = [
+    "symlogos.tableau_prover",
+    "symlogos.tableau_engine",
+    "symlogos.classical_propositional_logic",
+    "symlogos.modal_logic",
+    "symlogos.quantified_logic",
+]
+
+BUDGET_MS = 60.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "sympy": "sympy" in sys.modules}}))
+"""
+
+
+def measure(modules=MODULES):
+    """Import ``modules`` in a fresh interpreter; return (seconds, sympy_loaded)."""
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(modules=modules)],
+                            check=True, capture_output=True, text=True).stdout
+    result = json.loads(output)
+    return result["seconds"], result["sympy"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(args.repeat)]
+    best = min(seconds for seconds, _ in runs) * 1e3
+    sympy_loaded = any(loaded for _, loaded in runs)
+    print(f"{'import prover':32s} {best:10.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    if sympy_loaded:
+        print("regression: importing the prover imported sympy")
+        return 1
+    if best > args.budget_ms:
+        print("regression: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
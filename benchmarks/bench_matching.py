@@ -0,0 +1,38 @@
+"""Time and memory of matching patterns against deep formulas.
+
+Run from the repository root with ``python -m benchmarks.bench_matching``.
+"""
+import timeit
+import tracemalloc
+
+from symlogos.connectives import Not
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.quantifiers import Forall
+
+
+def deep_pair(depth):
+    """A pattern over variables and an instance of it over constants, ``depth`` operators deep."""
+    variables = [Term(f"x{i}") for i in range(depth)]
+    constants = [Term(f"C{i}") for i in range(depth)]
+    pattern, instance = Predicate("P", *variables), Predicate("P", *constants)
+    for level in range(depth):
+        operator = (Necessity, Possibility, Not)[level % 3]
+        pattern, instance = Forall(variables[level], operator(pattern)), Forall(constants[level], operator(instance))
+    return pattern, instance
+
+
+def main(depths=(10, 100, 250), number=100):
+    for depth in depths:
+        pattern, instance = deep_pair(depth)
+        best = min(timeit.repeat(lambda: pattern.match(instance), repeat=5, number=number)) / number
+        tracemalloc.start()
+        pattern.match(instance)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"depth {depth:4d}: {best * 1e6:10.1f} us/match, peak {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
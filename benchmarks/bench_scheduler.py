@@ -0,0 +1,68 @@
+"""Rules applied and branches created by the worklist tableau with and without rule scheduling.
+
+Run from the repository root with ``python -m benchmarks.bench_scheduler``.
+"""
+from symlogos.connectives import And, Or, Implication, Not
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.tableau_engine import RULE_CLASSES, WorklistTableau
+
+
+def chain(count):
+    """p0, p0 → p1, ..., p(n-1) → pn entail pn."""
+    atoms = [Proposition(f"p{i}") for i in range(count + 1)]
+    premises = [atoms[0]] + [Implication(atoms[i], atoms[i + 1]) for i in range(count)]
+    return "K", premises, atoms[-1]
+
+
+def dilemmas(count):
+    """(a_i ∨ b_i) for every i and ¬a_0 ∧ ¬b_0 are inconsistent."""
+    premises = [Or(Proposition(f"a{i}"), Proposition(f"b{i}")) for i in range(count)]
+    premises.append(And(Not(Proposition("a0")), Not(Proposition("b0"))))
+    return "K", premises, Proposition("c")
+
+
+def modal_distribution(count):
+    """□(p0 ∧ ... ∧ pn) entails □p0 ∧ ... ∧ □pn."""
+    atoms = [Proposition(f"p{i}") for i in range(count)]
+    conjunction, boxes = atoms[0], Necessity(atoms[0])
+    for atom in atoms[1:]:
+        conjunction, boxes = And(conjunction, atom), And(boxes, Necessity(atom))
+    return "K", [Necessity(conjunction)], boxes
+
+
+def quantified():
+    x = Term("x")
+    P, Q = Predicate("P", x), Predicate("Q", x)
+    return "K", [Or(Exists(x, P), Exists(x, Q)), Forall(x, Implication(P, Q)), Not(Exists(x, Q))], Proposition("r")
+
+
+def s4_schema():
+    p, q = Proposition("p"), Proposition("q")
+    return "S4", [Or(Necessity(p), Necessity(q)), Possibility(Not(p))], Or(Necessity(q), Possibility(And(p, q)))
+
+
+PROBLEMS = {
+    "implication chain": chain(12),
+    "dilemmas": dilemmas(8),
+    "modal distribution": modal_distribution(6),
+    "quantifiers": quantified(),
+    "S4 schema": s4_schema(),
+}
+
+
+def main():
+    print(f"{'problem':20s} {'order':10s} {'branches':>8s} " + " ".join(f"{name:>6s}" for name in RULE_CLASSES))
+    for name, (logic, premises, conclusion) in PROBLEMS.items():
+        for schedule in (False, True):
+            engine = WorklistTableau(logic, schedule=schedule)
+            engine.prove(premises, conclusion)
+            counts = " ".join(f"{engine.expansions[rule]:6d}" for rule in RULE_CLASSES)
+            print(f"{name:20s} {'priority' if schedule else 'derived':10s} {engine.branches:8d} {counts}")
+
+
+if __name__ == "__main__":
+    main()
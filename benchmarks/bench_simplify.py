@@ -0,0 +1,49 @@
+"""Size of the SAT solver's input with and without whole-problem simplification.
+
+Run from the repository root with ``python -m benchmarks.bench_simplify``.
+The problems mimic generated premises: an implication chain stated twice,
+atoms that only occur positively, pairs of atoms that imply each other and
+conjunctions that repeat their conjuncts. The chain's last atom follows from
+them; ``q0`` does not.
+"""
+import time
+
+from symlogos.connectives import And, Implication, Or
+from symlogos.proposition import Proposition
+from symlogos.tableau_prover import TableauProver
+
+
+def redundant_premises(size):
+    p = [Proposition(f"p{i}") for i in range(size + 1)]
+    q = [Proposition(f"q{i}") for i in range(size)]
+    s = [Proposition(f"s{i}") for i in range(size)]
+    premises = [p[0]]
+    for i in range(size):
+        link = Implication(p[i], p[i + 1])
+        premises += [link, link, Or(q[i], Implication(s[i], p[i])), Implication(p[i], s[i]), Implication(s[i], p[i])]
+        premises.append(And(link, And(Or(p[i], q[i]), link)))
+    return premises
+
+
+def main(sizes=(10, 100, 500), repeat=3):
+    print(f"{'problem':>14s} {'literals':>9s} {'simplified':>12s} {'raw ms':>8s} {'simplified ms':>14s}")
+    for size in sizes:
+        premises = redundant_premises(size)
+        for conclusion in (Proposition(f"p{size}"), Proposition("q0")):
+            times = {}
+            for simplify in (False, True):
+                prover = TableauProver(simplify=simplify)
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    prover.prove(premises, conclusion)
+                    best = min(best, time.perf_counter() - start)
+                times[simplify] = best
+            simplifier = prover.simplifier
+            after = "empty clause" if simplifier.unsatisfiable else str(simplifier.literals_after)
+            print(f"{f'{size} -> {conclusion}':>14s} {simplifier.literals_before:9d} {after:>12s}"
+                  f" {times[False] * 1e3:8.1f} {times[True] * 1e3:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
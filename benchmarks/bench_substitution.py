@@ -0,0 +1,66 @@
+"""Time and allocations of substituting into formulas that the mapping mostly leaves alone.
+
+Run from the repository root with ``python -m benchmarks.bench_substitution``.
+``instance`` is the gamma rule's job: the body of a universal formula with
+its variable replaced by a constant, where only one conjunct mentions the
+variable. ``chain`` replaces one atom at the bottom of ``depth`` nested
+implications. ``new nodes`` counts the nodes of the result that are not
+nodes of the input; the rest of the result is shared with it.
+"""
+import timeit
+import tracemalloc
+
+from symlogos.connectives import And, Implication, Not
+from symlogos.expressions_and_terms import Node, Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Forall
+from symlogos.transform import substitute
+
+x, c = Term("x"), Term("C")
+
+
+def instance(width):
+    """``∀x: P(x) ∧ Q(f(A0)) ∧ ... ∧ Q(f(A<width>))`` and the mapping that instantiates it."""
+    body = Predicate("P", x)
+    for i in range(width):
+        body = And(body, Predicate("Q", FunctionApplication("f", Term(f"A{i}"))))
+    return Forall(x, body).predicate, {x: c}
+
+
+def chain(depth):
+    formula = Proposition("p")
+    for i in range(depth):
+        formula = Implication(Proposition(f"a{i}"), Not(formula))
+    return formula, {Proposition("p"): Proposition("q")}
+
+
+def nodes(formula):
+    seen, stack = {}, [formula]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Node) and id(node) not in seen:
+            seen[id(node)] = node
+            for name in node._fields:
+                value = getattr(node, name)
+                stack.extend(value if isinstance(value, tuple) else (value,))
+    return seen
+
+
+def main(sizes=(10, 100, 1000), number=20):
+    print(f"{'workload':>16s} {'ms':>8s} {'KiB allocated':>14s} {'new nodes':>10s}")
+    for name, build in (("instance", instance), ("chain", chain)):
+        for size in sizes:
+            formula, mapping = build(size)
+            formula.metadata
+            best = min(timeit.repeat(lambda: substitute(formula, mapping), repeat=3, number=number)) / number
+            tracemalloc.start()
+            result = substitute(formula, mapping)
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            new = len(nodes(result).keys() - nodes(formula).keys())
+            print(f"{f'{name} {size}':>16s} {best * 1e3:8.2f} {allocated / 1024:14.1f} {new:10d}")
+
+
+if __name__ == "__main__":
+    main()
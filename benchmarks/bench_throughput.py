@@ -0,0 +1,64 @@
+"""Throughput of the workloads exercised by the test suite.
+
+Run from the repository root with ``python -m benchmarks.bench_throughput``.
+"""
+import timeit
+
+from symlogos.classical_propositional_logic import ClassicalPropositionalLogic
+from symlogos.connectives import And, Or, Implication, Not
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_logic import ModalLogic
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Forall
+from symlogos.rules import Rule
+from symlogos.tableau_prover import TableauProver
+
+
+def formula_construction():
+    x = Term("x")
+    for i in range(100):
+        p, q = Proposition("p"), Proposition("q")
+        And(Implication(Necessity(p), Not(q)), Or(Forall(x, Predicate("P", x)), q))
+
+
+def rule_applications():
+    p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+    ClassicalPropositionalLogic.modus_ponens().apply(p, Implication(p, q))
+    ClassicalPropositionalLogic.modus_tollens().apply(Implication(p, q), Not(q))
+    ClassicalPropositionalLogic.disjunction_elimination().apply(Or(p, q), Implication(p, r), Implication(q, r))
+    ClassicalPropositionalLogic.distribution_and_over_or().apply(And(p, Or(q, r)))
+    ModalLogic.modal_modus_ponens().apply(Necessity(Implication(p, q)), Necessity(p))
+
+    x, y, a, b = Term("x"), Term("y"), Term("a"), Term("b")
+    Rule("TestRule", [Predicate("P", x), Predicate("Q", y)], Predicate("R", x, y)).apply(Predicate("P", a), Predicate("Q", b))
+    Rule("Universal Instantiation", [Forall(x, Predicate("P", x))], Predicate("P", a)).apply(Forall(x, Predicate("P", x)))
+
+
+def tableau_proofs(engine):
+    A, B, C = Proposition("A"), Proposition("B"), Proposition("C")
+    prover = TableauProver(engine=engine)
+    prover.is_sound([], Implication(A, Implication(B, A)))
+    prover.is_sound([Implication(A, B), Implication(B, C), A], C)
+    prover.is_sound([], Implication(And(A, B), And(B, A)))
+    prover.is_sound([], Implication(Or(A, B), Or(B, A)))
+    prover.is_sound([], Implication(Implication(Necessity(A), A), A))
+
+
+WORKLOADS = {
+    "formula construction": formula_construction,
+    "rule applications": rule_applications,
+    "tableau proofs (recursive)": lambda: tableau_proofs("recursive"),
+    "tableau proofs (worklist)": lambda: tableau_proofs("worklist"),
+}
+
+
+def main(repeat=5, number=200):
+    for name, workload in WORKLOADS.items():
+        best = min(timeit.repeat(workload, repeat=repeat, number=number)) / number
+        print(f"{name:32s} {best * 1e6:10.1f} us/iteration")
+
+
+if __name__ == "__main__":
+    main()
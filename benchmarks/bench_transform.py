@@ -0,0 +1,61 @@
+"""Time of ``to_nnf``, ``simplify`` and ``substitute`` on deep and on shared formulas.
+
+Run from the repository root with ``python -m benchmarks.bench_transform``.
+A chain is ``depth`` implications nested in each other. A shared formula
+``And(f, f)`` repeated ``depth`` times has only ``depth`` nodes but ``2 **
+depth`` paths; a pass that does not memoise walks all of them, as
+``recursive_nnf`` below does.
+"""
+import timeit
+
+from symlogos.connectives import And, Implication, Not, Or
+from symlogos.proposition import Proposition
+from symlogos.transform import simplify, substitute, to_nnf
+
+p, q = Proposition("p"), Proposition("q")
+
+
+def chain(depth):
+    formula = p
+    for i in range(depth):
+        formula = Implication(Proposition(f"a{i}"), Not(formula))
+    return formula
+
+
+def shared(depth):
+    formula = p
+    for _ in range(depth):
+        formula = And(formula, formula)
+    return formula
+
+
+def recursive_nnf(formula, negated=False):
+    """Negation normal form by plain recursion, without a memo."""
+    if isinstance(formula, Not):
+        return recursive_nnf(formula.expr, not negated)
+    if isinstance(formula, (And, Or)):
+        cls = type(formula) if not negated else (Or if isinstance(formula, And) else And)
+        return cls(recursive_nnf(formula.left, negated), recursive_nnf(formula.right, negated))
+    return Not(formula) if negated else formula
+
+
+def best(function, number=3):
+    return min(timeit.repeat(function, repeat=3, number=number)) / number
+
+
+def main(depths=(100, 1000, 10000), shared_depths=(10, 16, 200)):
+    print(f"{'chain depth':>12s} {'to_nnf ms':>10s} {'simplify ms':>12s} {'substitute ms':>14s}")
+    for depth in depths:
+        formula = chain(depth)
+        print(f"{depth:12d} {best(lambda: to_nnf(formula)) * 1e3:10.2f}"
+              f" {best(lambda: simplify(formula)) * 1e3:12.2f}"
+              f" {best(lambda: substitute(formula, {p: q})) * 1e3:14.2f}")
+    print(f"{'shared depth':>12s} {'to_nnf ms':>10s} {'recursive ms':>13s}")
+    for depth in shared_depths:
+        formula = Not(shared(depth))
+        recursive = f"{best(lambda: recursive_nnf(formula), 1) * 1e3:13.2f}" if depth <= 20 else f"{'-':>13s}"
+        print(f"{depth:12d} {best(lambda: to_nnf(formula)) * 1e3:10.2f} {recursive}")
+
+
+if __name__ == "__main__":
+    main()
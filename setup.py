@@ -9,6 +9,8 @@ setup(
     ],
     extras_require={
         "tests": ["pytest"],
+        "numpy": ["numpy"],
+        "kripke": ["numpy", "scipy"],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
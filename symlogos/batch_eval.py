@@ -0,0 +1,182 @@
+from __future__ import annotations
+import os
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from symlogos.bdd import variable_order
+from symlogos.cnf import PROPOSITIONAL_TYPES, _open
+from symlogos.connectives import And, Conjunction, Not, Implication
+from symlogos.proposition import Proposition
+
+# Assignments are evaluated with their rows packed eight to a byte, so one
+# bitwise NumPy operation decides a connective for eight rows per byte of
+# every column. A formula is compiled once into a straight-line program over
+# numbered slots (atoms first, then one slot per distinct subformula); slots
+# are dropped as soon as their last reader has run.
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+class BatchEvaluator:
+    """Evaluate a propositional formula on many assignments at once.
+
+    ``atoms`` fixes the column order of assignment arrays. By default it is
+    the order in which propositions first occur in the formula.
+    """
+
+    def __init__(self, formula: Any, atoms: Optional[Sequence[Proposition]] = None) -> None:
+        self.formula = formula
+        self.atoms: List[Proposition] = list(atoms) if atoms is not None else variable_order([formula])
+        self._program: List[Tuple[Any, ...]] = []
+        self._constants: List[Tuple[int, bool]] = []
+        self._output = self._compile(formula)
+        self._last_use = self._liveness()
+
+    def _compile(self, formula: Any) -> int:
+        slots = {atom: index for index, atom in enumerate(self.atoms)}
+        next_slot = len(self.atoms)
+        stack = [(formula, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if node in slots:
+                continue
+            if isinstance(node, bool):
+                self._constants.append((next_slot, node))
+            elif isinstance(node, Proposition):
+                raise ValueError(f"Proposition {node} is not one of the evaluator's atoms")
+            elif not isinstance(node, PROPOSITIONAL_TYPES):
+                raise TypeError(f"Not a propositional formula: {node}")
+            elif not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.args)
+                continue
+            elif isinstance(node, Not):
+                self._program.append(("not", slots[node.expr], next_slot))
+            elif isinstance(node, Implication):
+                self._program.append(("implies", slots[node.antecedent], slots[node.consequent], next_slot))
+            else:
+                # And and Or read two slots, Conjunction and Disjunction one per operand.
+                operation = "and" if isinstance(node, (And, Conjunction)) else "or"
+                self._program.append((operation,) + tuple(slots[child] for child in node.args) + (next_slot,))
+            slots[node] = next_slot
+            next_slot += 1
+        return slots[formula]
+
+    def _liveness(self) -> List[List[int]]:
+        last_use = {}
+        for position, instruction in enumerate(self._program):
+            for slot in instruction[1:-1]:
+                last_use[slot] = position
+        return [[slot for slot, position in last_use.items() if position == index and slot != self._output]
+                for index in range(len(self._program))]
+
+    @property
+    def num_operations(self) -> int:
+        """Number of distinct compound subformulas, each evaluated once per batch."""
+        return len(self._program)
+
+    def evaluate(self, assignments: Any) -> np.ndarray:
+        """Truth value of the formula for every row of a 2-D boolean array."""
+        assignments = np.asarray(assignments, dtype=bool)
+        if assignments.ndim != 2 or assignments.shape[1] != len(self.atoms):
+            raise ValueError(f"Expected an array of shape (rows, {len(self.atoms)}), got {assignments.shape}")
+        rows = assignments.shape[0]
+        packed = np.packbits(assignments, axis=0)
+        values = {slot: packed[:, slot] for slot in range(len(self.atoms))}
+        for slot, constant in self._constants:
+            values[slot] = np.full(packed.shape[0], 0xFF if constant else 0, dtype=np.uint8)
+
+        for instruction, dead in zip(self._program, self._last_use):
+            op = instruction[0]
+            if op == "not":
+                result = np.bitwise_not(values[instruction[1]])
+            elif op == "implies":
+                result = np.bitwise_or(np.bitwise_not(values[instruction[1]]), values[instruction[2]])
+            elif op == "and":
+                result = _fold(np.bitwise_and, [values[slot] for slot in instruction[1:-1]], 0xFF, packed.shape[0])
+            else:
+                result = _fold(np.bitwise_or, [values[slot] for slot in instruction[1:-1]], 0, packed.shape[0])
+            values[instruction[-1]] = result
+            for slot in dead:
+                del values[slot]
+        return np.unpackbits(values[self._output], count=rows).astype(bool)
+
+    def evaluate_chunks(self, chunks: Iterable[Any]) -> Iterator[np.ndarray]:
+        """Evaluate a stream of assignment arrays, such as one from ``read_assignments``."""
+        for chunk in chunks:
+            yield self.evaluate(chunk)
+
+    def evaluate_all(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[int, np.ndarray]]:
+        """Evaluate every assignment, yielding ``(first_row, results)`` per chunk.
+
+        Row ``i`` assigns the ``j``-th atom bit ``n - 1 - j`` of ``i``, so the
+        first atom is the most significant.
+        """
+        for start, chunk in all_assignments(len(self.atoms), chunk_size):
+            yield start, self.evaluate(chunk)
+
+    def count_models(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return sum(int(np.count_nonzero(results)) for _, results in self.evaluate_all(chunk_size))
+
+    def is_tautology(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+        return all(results.all() for _, results in self.evaluate_all(chunk_size))
+
+    def is_satisfiable(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+        return any(results.any() for _, results in self.evaluate_all(chunk_size))
+
+    def counterexample(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Optional[Dict[Proposition, bool]]:
+        """The first assignment that makes the formula false, or None."""
+        for start, results in self.evaluate_all(chunk_size):
+            failing = np.flatnonzero(~results)
+            if failing.size:
+                row = start + int(failing[0])
+                width = len(self.atoms)
+                return {atom: bool((row >> (width - 1 - index)) & 1) for index, atom in enumerate(self.atoms)}
+        return None
+
+
+def _fold(operation, operands: List[np.ndarray], unit: int, rows: int) -> np.ndarray:
+    if not operands:
+        return np.full(rows, unit, dtype=np.uint8)
+    result = operands[0]
+    for operand in operands[1:]:
+        result = operation(result, operand)
+    return result
+
+
+def all_assignments(num_atoms: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield all ``2 ** num_atoms`` assignments in chunks of at most ``chunk_size`` rows."""
+    total = 1 << num_atoms
+    shifts = np.arange(num_atoms - 1, -1, -1, dtype=np.uint64)
+    for start in range(0, total, chunk_size):
+        rows = np.arange(start, min(start + chunk_size, total), dtype=np.uint64)
+        yield start, ((rows[:, None] >> shifts) & np.uint64(1)).astype(bool)
+
+
+def read_assignments(source: Union[str, os.PathLike, IO[str]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Stream assignments from a file in chunks of at most ``chunk_size`` rows.
+
+    ``.npy`` files are memory-mapped. Any other file is read as text with one
+    assignment per line, either as separated ``0``/``1`` values or as a plain
+    string of bits. Blank lines and lines starting with ``#`` are skipped.
+    """
+    if isinstance(source, (str, os.PathLike)) and os.fspath(source).endswith(".npy"):
+        array = np.load(source, mmap_mode="r")
+        for start in range(0, array.shape[0], chunk_size):
+            yield np.asarray(array[start:start + chunk_size], dtype=bool)
+        return
+
+    with _open(source, "r") as stream:
+        rows = []
+        for line in stream:
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            fields = line.replace(",", " ").split()
+            bits = fields if len(fields) > 1 else list(fields[0])
+            rows.append([bit == "1" for bit in bits])
+            if len(rows) == chunk_size:
+                yield np.array(rows, dtype=bool)
+                rows = []
+        if rows:
+            yield np.array(rows, dtype=bool)
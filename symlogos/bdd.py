@@ -0,0 +1,493 @@
+from __future__ import annotations
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from symlogos.cnf import PROPOSITIONAL_TYPES
+from symlogos.connectives import And, Conjunction, Disjunction, Or, Not
+from symlogos.proposition import Proposition
+
+# Reduced ordered binary decision diagrams with complement edges.
+#
+# Nodes live in parallel lists indexed by node number; node 0 is the single
+# terminal, TRUE. A function is referred to by an edge, ``node << 1`` with the
+# low bit set when the edge is complemented, so FALSE is edge 1 and negation
+# is ``edge ^ 1``. To keep the representation canonical the high (then) edge
+# of a node is never complemented. Two functions built by the same manager
+# are therefore equal exactly when their edges are equal.
+#
+# The recursive operations descend one variable per call, so their depth is
+# bounded by the number of variables.
+
+TRUE = 0
+FALSE = 1
+_TERMINAL_LEVEL = 1 << 62
+
+ORDER_HEURISTICS = ("dfs", "frequency")
+
+
+def variable_order(formulas: Iterable[Any], heuristic: str = "dfs") -> List[Proposition]:
+    """Order the propositions of ``formulas`` for building a BDD.
+
+    ``"dfs"`` keeps the left-to-right order of first occurrence, which tends
+    to keep related atoms close together. ``"frequency"`` puts the atoms that
+    occur most often first. Shared subformulas are visited once, so
+    occurrences are counted per distinct parent.
+    """
+    if heuristic not in ORDER_HEURISTICS:
+        raise ValueError(f"Unknown ordering heuristic '{heuristic}', expected one of {ORDER_HEURISTICS}")
+    first_seen: Dict[Proposition, int] = {}
+    counts: Dict[Proposition, int] = {}
+    visited = set()
+    for formula in formulas:
+        stack = [formula]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Proposition):
+                first_seen.setdefault(node, len(first_seen))
+                counts[node] = counts.get(node, 0) + 1
+            elif isinstance(node, PROPOSITIONAL_TYPES) and node not in visited:
+                visited.add(node)
+                stack.extend(reversed(node.args))
+    atoms = list(first_seen)
+    if heuristic == "frequency":
+        atoms.sort(key=lambda atom: (-counts[atom], first_seen[atom]))
+    return atoms
+
+
+class ComputedTable:
+    """A fixed-size, direct-mapped operation cache.
+
+    Each key hashes to one slot, and storing a result evicts whatever was in
+    that slot before, so memory stays bounded however long the manager lives.
+    """
+    __slots__ = ("_keys", "_values", "_mask", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        size = 1 << max(size - 1, 1).bit_length()
+        self._keys: List[Any] = [None] * size
+        self._values: List[int] = [0] * size
+        self._mask = size - 1
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[int]:
+        slot = hash(key) & self._mask
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._values[slot]
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple, value: int) -> None:
+        slot = hash(key) & self._mask
+        self._keys[slot] = key
+        self._values[slot] = value
+
+    def clear(self) -> None:
+        self._keys = [None] * len(self._keys)
+
+
+class BDD:
+    """A manager owning the nodes of many BDDs over a shared variable order.
+
+    Variables are propositions. They are declared up front or on first use
+    and are placed below the existing ones. ``reorder`` applies Rudell's
+    sifting to shrink the diagrams. With ``auto_reorder`` it runs whenever the
+    number of live nodes doubles past ``reorder_threshold``.
+
+    Nodes are reference counted. References come from parent nodes and from
+    live ``Function`` objects. Unreferenced nodes are reclaimed by
+    ``collect``, which reordering calls first.
+    """
+
+    def __init__(self, variables: Iterable[Any] = (), cache_size: int = 1 << 16,
+                 auto_reorder: bool = False, reorder_threshold: int = 10000) -> None:
+        self._var: List[int] = [-1]
+        self._low: List[int] = [TRUE]
+        self._high: List[int] = [TRUE]
+        self._refs: List[int] = [0]
+        self._free: List[int] = []
+        self._unique: List[Dict[Tuple[int, int], int]] = []
+        self._order: List[int] = []
+        self._level: List[int] = []
+        self._names: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        self._live = 0
+        self._cache = ComputedTable(cache_size)
+        self.auto_reorder = auto_reorder
+        self.reorder_threshold = reorder_threshold
+        self.reorderings = 0
+        for variable in variables:
+            self.declare(variable)
+        self.true = Function(self, TRUE)
+        self.false = Function(self, FALSE)
+
+    def __len__(self) -> int:
+        """The number of live internal nodes."""
+        return self._live
+
+    @property
+    def variables(self) -> List[Any]:
+        """The declared variables, from the top level down."""
+        return [self._names[var] for var in self._order]
+
+    @property
+    def cache(self) -> ComputedTable:
+        return self._cache
+
+    def declare(self, variable: Any) -> int:
+        index = self._index.get(variable)
+        if index is None:
+            index = len(self._names)
+            self._index[variable] = index
+            self._names.append(variable)
+            self._unique.append({})
+            self._level.append(len(self._order))
+            self._order.append(index)
+        return index
+
+    def var(self, variable: Any) -> "Function":
+        return Function(self, self._mk(self.declare(variable), FALSE, TRUE))
+
+    # Node management
+
+    def _mk(self, var: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        if high & 1:
+            return self._mk(var, low ^ 1, high ^ 1) ^ 1
+        table = self._unique[var]
+        node = table.get((low, high))
+        if node is None:
+            if self._free:
+                node = self._free.pop()
+                self._var[node] = var
+                self._low[node] = low
+                self._high[node] = high
+                self._refs[node] = 0
+            else:
+                node = len(self._var)
+                self._var.append(var)
+                self._low.append(low)
+                self._high.append(high)
+                self._refs.append(0)
+            table[(low, high)] = node
+            self._live += 1
+            if low > 1:
+                self._refs[low >> 1] += 1
+            self._refs[high >> 1] += 1
+        return node << 1
+
+    def _ref(self, edge: int) -> None:
+        if edge > 1:
+            self._refs[edge >> 1] += 1
+
+    def _deref(self, edge: int) -> None:
+        if edge > 1:
+            self._refs[edge >> 1] -= 1
+
+    def _kill(self, node: int) -> None:
+        """Free ``node`` and every descendant that only it kept alive."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            del self._unique[self._var[node]][(self._low[node], self._high[node])]
+            self._var[node] = -1
+            self._free.append(node)
+            self._live -= 1
+            for child in (self._low[node], self._high[node]):
+                if child > 1:
+                    child >>= 1
+                    self._refs[child] -= 1
+                    if self._refs[child] == 0:
+                        stack.append(child)
+
+    def collect(self) -> int:
+        """Reclaim unreferenced nodes; returns how many were freed."""
+        before = self._live
+        for node in range(1, len(self._var)):
+            if self._var[node] >= 0 and self._refs[node] == 0:
+                self._kill(node)
+        # Freed node numbers get reused, so cached results may now be stale.
+        self._cache.clear()
+        return before - self._live
+
+    def _level_of(self, edge: int) -> int:
+        node = edge >> 1
+        return _TERMINAL_LEVEL if node == 0 else self._level[self._var[node]]
+
+    def _cofactors(self, edge: int, level: int) -> Tuple[int, int]:
+        node = edge >> 1
+        if node == 0 or self._level[self._var[node]] != level:
+            return edge, edge
+        complement = edge & 1
+        return self._low[node] ^ complement, self._high[node] ^ complement
+
+    # Operations
+
+    def _and(self, f: int, g: int) -> int:
+        if f == g or g == TRUE:
+            return f
+        if f == TRUE:
+            return g
+        if f == FALSE or g == FALSE or f == g ^ 1:
+            return FALSE
+        if f > g:
+            f, g = g, f
+        key = (f, g)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        level = min(self._level_of(f), self._level_of(g))
+        f0, f1 = self._cofactors(f, level)
+        g0, g1 = self._cofactors(g, level)
+        result = self._mk(self._order[level], self._and(f0, g0), self._and(f1, g1))
+        self._cache.put(key, result)
+        return result
+
+    def _or(self, f: int, g: int) -> int:
+        return self._and(f ^ 1, g ^ 1) ^ 1
+
+    def _ite(self, f: int, g: int, h: int) -> int:
+        return self._or(self._and(f, g), self._and(f ^ 1, h))
+
+    def from_formula(self, formula: Any) -> "Function":
+        """Build the BDD of a propositional formula."""
+        edges: Dict[Any, int] = {}
+        stack = [(formula, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if node in edges:
+                continue
+            if isinstance(node, bool):
+                edges[node] = TRUE if node else FALSE
+            elif isinstance(node, Proposition):
+                edges[node] = self._mk(self.declare(node), FALSE, TRUE)
+            elif not isinstance(node, PROPOSITIONAL_TYPES):
+                raise TypeError(f"Not a propositional formula: {node}")
+            elif not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.args))
+            elif isinstance(node, Not):
+                edges[node] = edges[node.expr] ^ 1
+            elif isinstance(node, Conjunction):
+                edges[node] = reduce(self._and, (edges[operand] for operand in node.operands), TRUE)
+            elif isinstance(node, Disjunction):
+                edges[node] = reduce(self._or, (edges[operand] for operand in node.operands), FALSE)
+            else:
+                left = edges[node.args[0]]
+                right = edges[node.args[1]]
+                if isinstance(node, And):
+                    edges[node] = self._and(left, right)
+                elif isinstance(node, Or):
+                    edges[node] = self._or(left, right)
+                else:
+                    edges[node] = self._or(left ^ 1, right)
+        result = Function(self, edges[formula])
+        self._maybe_reorder()
+        return result
+
+    def _maybe_reorder(self) -> None:
+        if self.auto_reorder and self._live > self.reorder_threshold:
+            self.collect()
+            if self._live > self.reorder_threshold:
+                self.reorder()
+            self.reorder_threshold = max(self.reorder_threshold, 2 * self._live)
+
+    def count(self, edge: int) -> int:
+        """Number of assignments to all declared variables that satisfy ``edge``."""
+        total = len(self._order)
+        counts: Dict[int, int] = {}
+
+        def below(edge: int, level: int) -> int:
+            # Models over the variables at ``level`` and below.
+            node = edge >> 1
+            if node == 0:
+                return 0 if edge & 1 else 1 << (total - level)
+            node_level = self._level[self._var[node]]
+            if node not in counts:
+                counts[node] = below(self._low[node], node_level + 1) + below(self._high[node], node_level + 1)
+            result = counts[node] << (node_level - level)
+            return (1 << (total - level)) - result if edge & 1 else result
+
+        return below(edge, 0)
+
+    def satisfy(self, edge: int) -> Optional[Dict[Any, bool]]:
+        """One satisfying assignment of the variables on a path, or None."""
+        if edge == FALSE:
+            return None
+        assignment = {}
+        while edge > 1:
+            node = edge >> 1
+            complement = edge & 1
+            low = self._low[node] ^ complement
+            name = self._names[self._var[node]]
+            if low != FALSE:
+                assignment[name] = False
+                edge = low
+            else:
+                assignment[name] = True
+                edge = self._high[node] ^ complement
+        return assignment
+
+    def size(self, edge: int) -> int:
+        """Number of internal nodes reachable from ``edge``."""
+        seen = set()
+        stack = [edge >> 1]
+        while stack:
+            node = stack.pop()
+            if node and node not in seen:
+                seen.add(node)
+                stack.append(self._low[node] >> 1)
+                stack.append(self._high[node] >> 1)
+        return len(seen)
+
+    # Reordering
+
+    def _swap(self, level: int) -> None:
+        """Exchange the variables at ``level`` and ``level + 1`` in place.
+
+        Nodes keep their numbers and keep denoting the same functions, so
+        edges held by callers stay valid.
+        """
+        x = self._order[level]
+        y = self._order[level + 1]
+        x_table = self._unique[x]
+        y_table = self._unique[y]
+        low, high, var = self._low, self._high, self._var
+
+        moved = []
+        for key, node in list(x_table.items()):
+            if var[key[0] >> 1] == y or var[key[1] >> 1] == y:
+                moved.append(node)
+                del x_table[key]
+
+        self._order[level], self._order[level + 1] = y, x
+        self._level[x], self._level[y] = level + 1, level
+
+        for node in moved:
+            f0, f1 = low[node], high[node]
+            f00, f01 = self._cofactors(f0, level)
+            f10, f11 = self._cofactors(f1, level)
+            new_low = self._mk(x, f00, f10)
+            new_high = self._mk(x, f01, f11)
+            self._ref(new_low)
+            self._ref(new_high)
+            var[node], low[node], high[node] = y, new_low, new_high
+            y_table[(new_low, new_high)] = node
+            for child in (f0, f1):
+                if child > 1:
+                    child >>= 1
+                    self._refs[child] -= 1
+                    if self._refs[child] == 0:
+                        self._kill(child)
+
+    def _sift(self, var: int, max_growth: float) -> None:
+        levels = len(self._order)
+        level = self._level[var]
+        best_size, best_level = self._live, level
+        limit = max_growth * self._live
+        # Visit the nearer end first, then sweep to the other one.
+        directions = (1, -1) if level >= levels // 2 else (-1, 1)
+        for direction in directions:
+            while 0 <= level + direction < levels and self._live <= limit:
+                self._swap(min(level, level + direction))
+                level += direction
+                if self._live < best_size:
+                    best_size, best_level = self._live, level
+        while level != best_level:
+            direction = 1 if best_level > level else -1
+            self._swap(min(level, level + direction))
+            level += direction
+
+    def reorder(self, max_growth: float = 1.2) -> None:
+        """Sift every variable to the position that minimises the node count."""
+        self.collect()
+        for var in sorted(range(len(self._order)), key=lambda var: -len(self._unique[var])):
+            self._sift(var, max_growth)
+        self._cache.clear()
+        self.reorderings += 1
+
+
+class Function:
+    """A boolean function held by a ``BDD`` manager.
+
+    Functions from the same manager compare equal exactly when they are
+    logically equivalent, and the comparison is a single integer test.
+    """
+    __slots__ = ("bdd", "edge", "__weakref__")
+
+    def __init__(self, bdd: BDD, edge: int) -> None:
+        self.bdd = bdd
+        self.edge = edge
+        bdd._ref(edge)
+
+    def __del__(self) -> None:
+        self.bdd._deref(self.edge)
+
+    def _check(self, other: "Function") -> int:
+        if not isinstance(other, Function) or other.bdd is not self.bdd:
+            raise ValueError("Both functions must belong to the same BDD manager")
+        return other.edge
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Function) and other.bdd is self.bdd and other.edge == self.edge
+
+    def __hash__(self) -> int:
+        return hash(self.edge)
+
+    def __invert__(self) -> "Function":
+        return Function(self.bdd, self.edge ^ 1)
+
+    def __and__(self, other: "Function") -> "Function":
+        return Function(self.bdd, self.bdd._and(self.edge, self._check(other)))
+
+    def __or__(self, other: "Function") -> "Function":
+        return Function(self.bdd, self.bdd._or(self.edge, self._check(other)))
+
+    def implies(self, other: "Function") -> "Function":
+        return Function(self.bdd, self.bdd._or(self.edge ^ 1, self._check(other)))
+
+    def ite(self, then: "Function", otherwise: "Function") -> "Function":
+        return Function(self.bdd, self.bdd._ite(self.edge, self._check(then), self._check(otherwise)))
+
+    @property
+    def is_true(self) -> bool:
+        return self.edge == TRUE
+
+    @property
+    def is_false(self) -> bool:
+        return self.edge == FALSE
+
+    def count(self) -> int:
+        return self.bdd.count(self.edge)
+
+    def satisfy(self) -> Optional[Dict[Any, bool]]:
+        return self.bdd.satisfy(self.edge)
+
+    def __len__(self) -> int:
+        return self.bdd.size(self.edge)
+
+    def __repr__(self) -> str:
+        if self.edge <= FALSE:
+            return f"Function({self.edge == TRUE})"
+        return f"Function(edge={self.edge}, nodes={len(self)})"
+
+
+def equivalent(first: Any, second: Any) -> bool:
+    bdd = BDD(variable_order([first, second]))
+    return bdd.from_formula(first) == bdd.from_formula(second)
+
+
+def is_tautology(formula: Any) -> bool:
+    return BDD(variable_order([formula])).from_formula(formula).is_true
+
+
+def is_satisfiable(formula: Any) -> bool:
+    return not BDD(variable_order([formula])).from_formula(formula).is_false
+
+
+def count_models(formula: Any, variables: Iterable[Any] = ()) -> int:
+    """Models of ``formula`` over its own propositions plus ``variables``."""
+    bdd = BDD(list(variables) + variable_order([formula]))
+    return bdd.from_formula(formula).count()
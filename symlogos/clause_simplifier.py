@@ -0,0 +1,234 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Set
+
+# A preprocessor for DIMACS clause sets, run before the SAT solver.
+#
+# Every step keeps the clause set satisfiable exactly when it was before, so
+# the solver's verdict does not change, but variables that were assigned or
+# substituted away are no longer mentioned and a model of the simplified
+# clauses says nothing about them.
+
+
+class ClauseSimplifier:
+    """Shrink a clause set by unit propagation, pure literals, equivalent literals and subsumption.
+
+    ``simplify`` repeats the four steps until none of them changes anything:
+
+    - a unit clause assigns its literal; clauses containing it are dropped
+      and its negation is removed from the rest,
+    - a literal whose negation occurs nowhere is assigned the same way,
+    - literals that imply each other through binary clauses (a strongly
+      connected component of the implication graph) are replaced by one
+      representative; a literal equivalent to its own negation makes the
+      clauses unsatisfiable,
+    - a clause that contains all the literals of another one is dropped.
+
+    ``assignment`` holds the literals assigned and ``equivalences`` maps each
+    substituted literal to its representative. ``unsatisfiable`` is set
+    when the empty clause was derived; ``simplify`` then returns ``[[]]``.
+    """
+
+    def __init__(self, clauses: Iterable[Iterable[int]] = ()) -> None:
+        self._clauses: List[Optional[frozenset]] = []
+        self._occurrences: Dict[int, Set[int]] = {}
+        self._seen: Set[frozenset] = set()
+        self.assignment: Set[int] = set()
+        self.equivalences: Dict[int, int] = {}
+        self.unsatisfiable = False
+        self.clauses_before = 0
+        self.literals_before = 0
+        self.units = 0
+        self.pure_literals = 0
+        self.subsumed = 0
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def add_clause(self, literals: Iterable[int]) -> None:
+        clause = frozenset(literals)
+        self.clauses_before += 1
+        self.literals_before += len(clause)
+        self._add(clause)
+
+    def _add(self, clause: frozenset) -> None:
+        if clause in self._seen:
+            return
+        for literal in clause:
+            if -literal in clause:
+                return
+        if not clause:
+            self.unsatisfiable = True
+        index = len(self._clauses)
+        self._clauses.append(clause)
+        self._seen.add(clause)
+        occurrences = self._occurrences
+        for literal in clause:
+            indices = occurrences.get(literal)
+            if indices is None:
+                occurrences[literal] = {index}
+            else:
+                indices.add(index)
+
+    def _remove(self, index: int) -> None:
+        clause = self._clauses[index]
+        self._clauses[index] = None
+        self._seen.discard(clause)
+        for literal in clause:
+            self._occurrences[literal].discard(index)
+
+    def _replace(self, index: int, clause: frozenset) -> None:
+        self._remove(index)
+        self._add(clause)
+
+    @property
+    def clauses(self) -> List[List[int]]:
+        if self.unsatisfiable:
+            return [[]]
+        return [sorted(clause, key=abs) for clause in self._clauses if clause is not None]
+
+    @property
+    def clauses_after(self) -> int:
+        return len(self.clauses)
+
+    @property
+    def literals_after(self) -> int:
+        return sum(len(clause) for clause in self.clauses)
+
+    @property
+    def reduction(self) -> float:
+        """How many times fewer literals the simplified clauses have."""
+        return self.literals_before / max(self.literals_after, 1)
+
+    def simplify(self) -> List[List[int]]:
+        """Simplify to a fixpoint and return the remaining clauses."""
+        steps = (self._propagate_units, self._pure_literals, self._substitute_equivalences, self._subsume)
+        changed = True
+        while changed:
+            changed = False
+            for step in steps:
+                changed = step() or changed
+                if self.unsatisfiable:
+                    return self.clauses
+        return self.clauses
+
+    def _assign(self, literal: int) -> None:
+        self.assignment.add(literal)
+        for index in list(self._occurrences.get(literal, ())):
+            self._remove(index)
+        for index in list(self._occurrences.get(-literal, ())):
+            self._replace(index, self._clauses[index] - {-literal})
+
+    def _propagate_units(self) -> bool:
+        changed = False
+        units = [clause for clause in self._clauses if clause is not None and len(clause) == 1]
+        while units and not self.unsatisfiable:
+            clause = units.pop()
+            [literal] = clause
+            if -literal in self.assignment:
+                self.unsatisfiable = True
+                break
+            if literal in self.assignment:
+                continue
+            first_new = len(self._clauses)
+            self._assign(literal)
+            self.units += 1
+            changed = True
+            units.extend(clause for clause in self._clauses[first_new:] if clause is not None and len(clause) == 1)
+        return changed
+
+    def _pure_literals(self) -> bool:
+        pure = [literal for literal, indices in self._occurrences.items()
+                if indices and not self._occurrences.get(-literal)]
+        changed = False
+        for literal in pure:
+            if self._occurrences[literal]:
+                self._assign(literal)
+                self.pure_literals += 1
+                changed = True
+        return changed
+
+    def _substitute_equivalences(self) -> bool:
+        graph: Dict[int, List[int]] = {}
+        for clause in self._clauses:
+            if clause is not None and len(clause) == 2:
+                left, right = clause
+                graph.setdefault(-left, []).append(right)
+                graph.setdefault(-right, []).append(left)
+        representative: Dict[int, int] = {}
+        for component in _components(graph):
+            if len(component) < 2:
+                continue
+            chosen = min(component, key=abs)
+            for literal in component:
+                if -literal in component:
+                    self.unsatisfiable = True
+                    return True
+                if literal != chosen:
+                    representative[literal] = chosen
+        if not representative:
+            return False
+        self.equivalences.update(representative)
+        touched = set()
+        for literal in representative:
+            touched |= self._occurrences.get(literal, set())
+        for index in touched:
+            clause = self._clauses[index]
+            if clause is not None:
+                self._replace(index, frozenset(representative.get(literal, literal) for literal in clause))
+        return True
+
+    def _subsume(self) -> bool:
+        changed = False
+        order = sorted((index for index, clause in enumerate(self._clauses) if clause is not None),
+                       key=lambda index: len(self._clauses[index]))
+        for index in order:
+            clause = self._clauses[index]
+            if clause is None:
+                continue
+            rarest = min(clause, key=lambda literal: len(self._occurrences[literal]))
+            for other in list(self._occurrences[rarest]):
+                candidate = self._clauses[other]
+                if other != index and len(candidate) >= len(clause) and clause <= candidate:
+                    self._remove(other)
+                    self.subsumed += 1
+                    changed = True
+        return changed
+
+
+def _components(graph: Dict[int, List[int]]) -> Iterable[List[int]]:
+    """The strongly connected components of ``graph`` (Tarjan's algorithm, without recursion)."""
+    index_of: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    on_stack: Set[int] = set()
+    stack: List[int] = []
+    for root in list(graph):
+        if root in index_of:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = len(index_of)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    yield component
@@ -0,0 +1,253 @@
+from __future__ import annotations
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from symlogos.connectives import And, Conjunction, Disjunction, Or, Not, Implication
+from symlogos.proposition import Proposition
+
+PROPOSITIONAL_TYPES = (Proposition, And, Or, Not, Implication, Conjunction, Disjunction)
+
+# Polarities of a subformula occurrence, as bit flags. A positive occurrence
+# only needs the clauses saying "variable implies subformula", a negative one
+# only "subformula implies variable" (Plaisted-Greenbaum).
+POSITIVE = 1
+NEGATIVE = 2
+BOTH = POSITIVE | NEGATIVE
+
+
+def _flip(polarity: int) -> int:
+    return ((polarity & POSITIVE) << 1) | ((polarity & NEGATIVE) >> 1)
+
+
+def is_propositional(formula: Any) -> bool:
+    """True if ``formula`` is built from propositions and the classical connectives only."""
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, bool) or isinstance(node, Proposition):
+            continue
+        if not isinstance(node, PROPOSITIONAL_TYPES):
+            return False
+        stack.extend(node.args)
+    return True
+
+
+class TseitinEncoder:
+    """Turn propositional formulas into an equisatisfiable set of DIMACS clauses.
+
+    Every distinct proposition and compound subformula gets one variable;
+    negation only flips the sign of a literal. Structurally equal
+    subformulas share their variable, so a formula DAG is encoded in time
+    and space linear in the number of distinct nodes.
+
+    With ``polarity_aware`` (the default) a subformula is only defined in
+    the direction its occurrences need, which roughly halves the clause
+    count. Formulas passed to ``add`` are asserted directly: conjunctions are
+    split and a top-level disjunction or implication becomes a single clause,
+    so a chain of implications costs one clause per link.
+
+    ``variables`` maps subformulas to variables and ``formulas`` maps them
+    back.
+    """
+
+    def __init__(self, polarity_aware: bool = True) -> None:
+        self.polarity_aware = polarity_aware
+        self.clauses: List[List[int]] = []
+        self.variables: Dict[Any, int] = {}
+        self.formulas: Dict[int, Any] = {}
+        self.num_vars = 0
+        self._defined: Dict[Any, int] = {}
+
+    def _literal(self, node: Any) -> int:
+        negated = False
+        while isinstance(node, Not):
+            node = node.expr
+            negated = not negated
+        var = self.variables.get(node)
+        if var is None:
+            if not isinstance(node, (bool,) + PROPOSITIONAL_TYPES):
+                raise TypeError(f"Not a propositional formula: {node}")
+            self.num_vars += 1
+            var = self.num_vars
+            self.variables[node] = var
+            self.formulas[var] = node
+            if isinstance(node, bool):
+                self.clauses.append([var if node else -var])
+        return -var if negated else var
+
+    def literal(self, formula: Any, polarity: int = BOTH) -> int:
+        """The literal standing for ``formula``, adding the definitions it needs."""
+        literal = self._literal(formula)
+        self._define(formula, polarity)
+        return literal
+
+    def _define(self, formula: Any, polarity: int) -> None:
+        if not self.polarity_aware:
+            polarity = BOTH
+        stack = [(formula, polarity)]
+        while stack:
+            node, polarity = stack.pop()
+            while isinstance(node, Not):
+                node = node.expr
+                polarity = _flip(polarity)
+            if isinstance(node, (bool, Proposition)):
+                continue
+            if not isinstance(node, PROPOSITIONAL_TYPES):
+                raise TypeError(f"Not a propositional formula: {node}")
+            defined = self._defined.get(node, 0)
+            missing = polarity & ~defined
+            if not missing:
+                continue
+            self._defined[node] = defined | missing
+
+            var = self._literal(node)
+            if isinstance(node, (Conjunction, Disjunction)):
+                self._define_nary(node, var, missing)
+                for operand in reversed(node.operands):
+                    stack.append((operand, missing))
+                continue
+            left_node, right_node = node.args
+            left = self._literal(left_node)
+            right = self._literal(right_node)
+            if isinstance(node, And):
+                if missing & POSITIVE:
+                    self.clauses.append([-var, left])
+                    self.clauses.append([-var, right])
+                if missing & NEGATIVE:
+                    self.clauses.append([var, -left, -right])
+                left_polarity = right_polarity = missing
+            elif isinstance(node, Or):
+                if missing & POSITIVE:
+                    self.clauses.append([-var, left, right])
+                if missing & NEGATIVE:
+                    self.clauses.append([var, -left])
+                    self.clauses.append([var, -right])
+                left_polarity = right_polarity = missing
+            else:
+                if missing & POSITIVE:
+                    self.clauses.append([-var, -left, right])
+                if missing & NEGATIVE:
+                    self.clauses.append([var, left])
+                    self.clauses.append([var, -right])
+                left_polarity, right_polarity = _flip(missing), missing
+            stack.append((right_node, right_polarity))
+            stack.append((left_node, left_polarity))
+
+    def _define_nary(self, node: Any, var: int, missing: int) -> None:
+        literals = [self._literal(operand) for operand in node.operands]
+        # A conjunction is a disjunction with every literal negated.
+        sign = 1 if isinstance(node, Disjunction) else -1
+        if missing & (POSITIVE if sign == 1 else NEGATIVE):
+            self.clauses.append([-sign * var] + [sign * literal for literal in literals])
+        if missing & (NEGATIVE if sign == 1 else POSITIVE):
+            self.clauses.extend([sign * var, -sign * literal] for literal in literals)
+
+    def add(self, formula: Any) -> None:
+        """Assert that ``formula`` is true."""
+        stack = [formula]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, And):
+                stack.append(node.right)
+                stack.append(node.left)
+            elif isinstance(node, Conjunction):
+                stack.extend(reversed(node.operands))
+            elif isinstance(node, Disjunction):
+                self.clauses.append([self.literal(operand, POSITIVE) for operand in node.operands])
+            elif isinstance(node, Not) and isinstance(node.expr, Conjunction):
+                self.clauses.append([-self.literal(operand, NEGATIVE) for operand in node.expr.operands])
+            elif isinstance(node, Not) and isinstance(node.expr, Disjunction):
+                stack.extend(Not(operand) for operand in reversed(node.expr.operands))
+            elif isinstance(node, Not) and isinstance(node.expr, And):
+                self.clauses.append([-self.literal(node.expr.left, NEGATIVE), -self.literal(node.expr.right, NEGATIVE)])
+            elif isinstance(node, Not) and isinstance(node.expr, Or):
+                stack.append(Not(node.expr.right))
+                stack.append(Not(node.expr.left))
+            elif isinstance(node, Not) and isinstance(node.expr, Implication):
+                stack.append(Not(node.expr.consequent))
+                stack.append(node.expr.antecedent)
+            elif isinstance(node, Or):
+                self.clauses.append([self.literal(node.left, POSITIVE), self.literal(node.right, POSITIVE)])
+            elif isinstance(node, Implication):
+                self.clauses.append([-self.literal(node.antecedent, NEGATIVE), self.literal(node.consequent, POSITIVE)])
+            else:
+                self.clauses.append([self.literal(node, POSITIVE)])
+
+    def add_all(self, formulas: Iterable[Any]) -> None:
+        for formula in formulas:
+            self.add(formula)
+
+    def decode(self, model: Dict[int, bool]) -> Dict[Proposition, bool]:
+        """Read the truth values of the propositions off a solver model."""
+        return {formula: model[var] for var, formula in self.formulas.items()
+                if isinstance(formula, Proposition) and var in model}
+
+    def to_dimacs(self, target: Union[str, os.PathLike, IO[str]]) -> None:
+        """Write the clauses as DIMACS, naming the proposition of every variable in comments."""
+        comments = (f"{var} {formula}" for var, formula in self.formulas.items() if isinstance(formula, Proposition))
+        write_dimacs(target, self.clauses, self.num_vars, comments)
+
+
+@contextmanager
+def _open(source: Union[str, os.PathLike, IO[str]], mode: str) -> Iterator[IO[str]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, mode, encoding="utf-8") as stream:
+            yield stream
+    else:
+        yield source
+
+
+def write_dimacs(target: Union[str, os.PathLike, IO[str]], clauses: Iterable[Iterable[int]],
+                 num_vars: Optional[int] = None, comments: Iterable[str] = ()) -> None:
+    """Write ``clauses`` in DIMACS CNF format to a path or an open text stream."""
+    if not isinstance(clauses, list):
+        clauses = [list(clause) for clause in clauses]
+    if num_vars is None:
+        num_vars = max((abs(lit) for clause in clauses for lit in clause), default=0)
+    with _open(target, "w") as stream:
+        for comment in comments:
+            stream.write(f"c {comment}\n")
+        stream.write(f"p cnf {num_vars} {len(clauses)}\n")
+        for clause in clauses:
+            stream.write(" ".join(map(str, clause)))
+            stream.write(" 0\n" if clause else "0\n")
+
+
+def _parse(stream: IO[str], header: List[int]) -> Iterator[List[int]]:
+    clause = []
+    for line in stream:
+        line = line.strip()
+        if not line or line[0] == "c":
+            continue
+        if line[0] == "p":
+            header.extend(int(field) for field in line.split()[2:4])
+            continue
+        if line[0] == "%":
+            break
+        for token in line.split():
+            lit = int(token)
+            if lit == 0:
+                yield clause
+                clause = []
+            else:
+                clause.append(lit)
+    if clause:
+        yield clause
+
+
+def iter_dimacs(source: Union[str, os.PathLike, IO[str]]) -> Iterator[List[int]]:
+    """Yield the clauses of a DIMACS CNF file one at a time."""
+    with _open(source, "r") as stream:
+        yield from _parse(stream, [])
+
+
+def read_dimacs(source: Union[str, os.PathLike, IO[str]]) -> Tuple[int, List[List[int]]]:
+    """Read a DIMACS CNF file; returns the number of variables and the clauses."""
+    header = []
+    with _open(source, "r") as stream:
+        clauses = list(_parse(stream, header))
+    num_vars = max((abs(lit) for clause in clauses for lit in clause), default=0)
+    if header:
+        num_vars = max(num_vars, header[0])
+    return num_vars, clauses
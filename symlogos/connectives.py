@@ -1,13 +1,17 @@
 from __future__ import annotations
-from .expressions_and_terms import LogicalExpression, simplify_expression
+from .expressions_and_terms import LogicalExpression
 from symlogos.expressions_and_terms import Term
-from typing import Any, Dict, Union, TYPE_CHECKING
+from operator import itemgetter
+from typing import Any, List, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from symlogos.proposition import Proposition
     from symlogos.modal_operators import Necessity
 
 class Implication(LogicalExpression):
+    __slots__ = ("antecedent", "consequent")
+    _fields = ("antecedent", "consequent")
+
     def __init__(self, antecedent: Union['Proposition', 'Necessity', Term], consequent: Union['Proposition', 'Necessity', Term]) -> None:
         self.antecedent = antecedent
         self.consequent = consequent
@@ -21,10 +25,16 @@ class Implication(LogicalExpression):
         return self.consequent
 
     def __hash__(self):
-        return hash((type(self), self.antecedent, self.consequent))
+        if self._hash is None:
+            self._hash = hash((type(self), self.antecedent, self.consequent))
+        return self._hash
 
     def __eq__(self, other: "Implication") -> bool:
+        if self is other:
+            return True
         if isinstance(other, Implication):
+            if self._interned is not None and self._interned is other._interned:
+                return False
             return self.antecedent == other.antecedent and self.consequent == other.consequent
         return False
 
@@ -36,11 +46,6 @@ class Implication(LogicalExpression):
     def __repr__(self):
         return f"Implication({repr(self.antecedent)}, {repr(self.consequent)})"
 
-    def substitute(self, variable, replacement):
-        antecedent_substituted = self.antecedent.substitute(variable, replacement)
-        consequent_substituted = self.consequent.substitute(variable, replacement)
-        return Implication(antecedent_substituted, consequent_substituted)
-
     def evaluate(self, valuation=None):
         if valuation is None:
             return self
@@ -53,37 +58,19 @@ class Implication(LogicalExpression):
         else:
             return Implication(antecedent_val, consequent_val)
 
-    def simplify(self):
-        antecedent_simplified = simplify_expression(self.antecedent)
-        consequent_simplified = simplify_expression(self.consequent)
-    
-        if antecedent_simplified == True:
-            return consequent_simplified
-        if antecedent_simplified == False or consequent_simplified == True:
-            return True
-        if antecedent_simplified == consequent_simplified:
-            return True
-    
-        return Implication(antecedent_simplified, consequent_simplified)
-
-    def match(self, other: "Implication") -> Dict[Any, Any]:
-        if self == other:
-            return {}
-        return None
-
-    def to_nnf(self) -> "Or":
-        negated_antecedent = Not(self.antecedent).to_nnf()
-        consequent_nnf = self.consequent.to_nnf()
-        return Or(negated_antecedent, consequent_nnf)
-
 
 class And(LogicalExpression):
+    __slots__ = ("left", "right")
+    _fields = ("left", "right")
+
     def __init__(self, left: Any, right: Union[And, Term, Or, 'Proposition', Not]) -> None:
         self.left = left
         self.right = right
 
     def __hash__(self):
-        return hash((type(self), self.left, self.right))
+        if self._hash is None:
+            self._hash = hash((type(self), self.left, self.right))
+        return self._hash
 
     def __str__(self) -> str:
         left_str = str(self.left)
@@ -92,16 +79,6 @@ class And(LogicalExpression):
 
     def __repr__(self):
         return f"And({repr(self.left)}, {repr(self.right)})"
-    
-    def substitute(self, variable: 'Proposition', replacement: 'Proposition') -> "And":
-        left_substituted = self.left.substitute(variable, replacement)
-        right_substituted = self.right.substitute(variable, replacement)
-        return And(left_substituted, right_substituted)
-
-    def substitute_all_terms(self, term_replacement_dict: Dict[Any, Any]) -> "And":
-        left_substituted = self.left.substitute_all_terms(term_replacement_dict)
-        right_substituted = self.right.substitute_all_terms(term_replacement_dict)
-        return And(left_substituted, right_substituted)
 
     def evaluate(self, valuation=None):
         if valuation is None:
@@ -116,121 +93,68 @@ class And(LogicalExpression):
             return And(left_val, right_val)
 
     def __eq__(self, other: "And") -> bool:
+        if self is other:
+            return True
         if isinstance(other, And):
+            if self._interned is not None and self._interned is other._interned:
+                return False
             return self.left == other.left and self.right == other.right
         return False
-        
-    def simplify(self) -> Union['Proposition', bool, And]:
-        left_simplified = simplify_expression(self.left)
-        right_simplified = simplify_expression(self.right)
-
-        if left_simplified == True:
-            return right_simplified
-        if right_simplified == True:
-            return left_simplified
-        if left_simplified == False or right_simplified == False:
-            return False
-
-        if isinstance(left_simplified, Not) and isinstance(left_simplified.expr, Not):
-            left_simplified = left_simplified.expr.expr
-        if isinstance(right_simplified, Not) and isinstance(right_simplified.expr, Not):
-            right_simplified = right_simplified.expr.expr
-
-        if left_simplified == self.left and right_simplified == self.right:
-            return self
-
-        return And(left_simplified, right_simplified)
-
-    def match(self, other: "And", bindings: None=None) -> Dict[Any, Any]:
-        if bindings is None:
-            bindings = {}
-            
-        if isinstance(other, And):
-            left_match = self.left.match(other.left, bindings)
-            right_match = self.right.match(other.right, bindings)
-            
-            if left_match is None or right_match is None:
-                return None
-            
-            new_bindings = dict(bindings)
-            new_bindings.update(left_match)
-            new_bindings.update(right_match)
-            return new_bindings
-
-        if isinstance(other, LogicalExpression):
-            return bindings
-
-        return None
-
-    def to_nnf(self) -> "And":
-        return And(*(arg.to_nnf() for arg in self.args))
 
 
 class Or(LogicalExpression):
+    __slots__ = ("left", "right")
+    _fields = ("left", "right")
+
     def __init__(self, left: Union['Proposition', And, Or, Not], right: Union['Proposition', Or, Not, And]) -> None:
         self.left = left
         self.right = right
 
     def __hash__(self):
-        return hash((type(self), self.left, self.right))
+        if self._hash is None:
+            self._hash = hash((type(self), self.left, self.right))
+        return self._hash
 
     def __repr__(self):
         return f"({self.left} ∨ {self.right})"
 
     def __eq__(self, other: "Or") -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Or):
             return False
+        if self._interned is not None and self._interned is other._interned:
+            return False
         return self.left == other.left and self.right == other.right
 
-    def variables(self):
-        return self.left.variables().union(self.right.variables())
-
-    def substitute_all_terms(self, term_replacement_dict: Dict[Any, Any]) -> "Or":
-        new_left = self.left.substitute_all_terms(term_replacement_dict)
-        new_right = self.right.substitute_all_terms(term_replacement_dict)
-        return Or(new_left, new_right)
-
-    def match(self, other: "Or", bindings: None=None) -> Dict[Any, Any]:
-        if bindings is None:
-            bindings = {}
-
-        if isinstance(other, Or):
-            left_match = self.left.match(other.left, bindings)
-            if left_match is not None:
-                right_match = self.right.match(other.right, left_match)
-                if right_match is not None:
-                    return right_match
-        return None
-
-    def to_nnf(self) -> "Or":
-        return Or(*(arg.to_nnf() for arg in self.args))
-
 class Not(LogicalExpression):
+    __slots__ = ("expr",)
+    _fields = ("expr",)
+
     def __init__(self, expr: Union[And, bool, Or, 'Proposition', Not]) -> None:
         super().__init__()
         self.expr = expr
 
     def __eq__(self, other: "Not") -> bool:
+        if self is other:
+            return True
         if isinstance(other, Not):
+            if self._interned is not None and self._interned is other._interned:
+                return False
             return self.expr == other.expr
         return False
 
     def __hash__(self):
-        return hash((type(self), self.expr))
+        if self._hash is None:
+            self._hash = hash((type(self), self.expr))
+        return self._hash
 
     def __str__(self) -> str:
         return f"¬{str(self.expr)}"
 
     def __repr__(self):
         return f"Not({repr(self.expr)})"
-    
-    def substitute(self, variable: 'Proposition', replacement: 'Proposition') -> "Not":
-        return Not(self.expr.substitute(variable, replacement))
-
-    def substitute_all_terms(self, term_replacement_dict: Dict[Any, Any]) -> "Not":
-        new_expr = self.expr.substitute_all_terms(term_replacement_dict)  # Change this line
-        return Not(new_expr)
-    
+
     def evaluate(self, valuation=None):
         if valuation is None:
             return self
@@ -241,45 +165,113 @@ class Not(LogicalExpression):
             return not expr_val
         else:
             return Not(expr_val)
-    
-    def simplify(self) -> Union['Proposition', bool, Not]:
-        simplified_inner = simplify_expression(self.expr)
 
-        if isinstance(simplified_inner, Not):
-            return simplified_inner.expr
 
-        if simplified_inner == True:
-            return False
+def _canonical_operands(cls: type, operands: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """``operands`` flattened, without duplicates and in canonical order.
+
+    Operands of the same n-ary type are spliced in; they are canonical
+    already, so one level is all there is to flatten. Duplicates are found
+    by hash and equality. The order is that of the structural digest in
+    ``symlogos.metadata``, with ties broken by ``str``, which unlike
+    ``hash`` does not depend on ``PYTHONHASHSEED``: equal operand sets come
+    out as equal tuples in every process, whether or not hash-consing is on.
+    """
+    from symlogos.metadata import metadata
+    flat = []
+    for operand in operands:
+        if type(operand) is cls:
+            flat.extend(operand.operands)
+        else:
+            flat.append(operand)
+    keyed = sorted(((metadata(operand).digest, operand) for operand in dict.fromkeys(flat)), key=itemgetter(0))
+    if any(keyed[i][0] == keyed[i + 1][0] for i in range(len(keyed) - 1)):
+        keyed.sort(key=lambda pair: (pair[0], str(pair[1])))
+    return tuple(operand for _, operand in keyed)
+
+
+class _NaryConnective(LogicalExpression):
+    """Common base of the n-ary ``Conjunction`` and ``Disjunction``.
+
+    The operands are kept flat, free of duplicates and sorted, so two
+    formulas that only differ in how the operands are grouped or ordered
+    are equal. ``to_nary`` and ``to_binary`` convert from and to ``And`` and
+    ``Or``.
+    """
+    __slots__ = ("operands",)
+    _fields = ("operands",)
+    _symbol = ""
+    _unit = True
+    _binary: type = None
+    _dual: type = None
+
+    def __init__(self, *operands: Any) -> None:
+        self.operands = _canonical_operands(type(self), operands)
+
+    @property
+    def args(self):
+        return self.operands
+
+    def _rebuild(self, operands):
+        return type(self)(*operands)
 
-        if simplified_inner == False:
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
             return True
+        if type(other) is not type(self):
+            return False
+        if self._interned is not None and self._interned is other._interned:
+            return False
+        return self.operands == other.operands
 
-        return Not(simplified_inner)
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((type(self), self.operands))
+        return self._hash
 
-    def __eq__(self, other: "Not") -> bool:
-        if isinstance(other, Not):
-            return self.expr == other.expr
-        return False
-    
-    def match(self, other: "Not") -> Dict[Any, Any]:
-        if isinstance(other, Not):
-            print(f"Matching Not: self: {self}, other: {other}")
-            result = self.expr.match(other.expr)
-            print(f"Match result: {result}")
-            return result
-        else:
-            print(f"Matching without Not: self: {self}, other: {other}")
-            result = self.expr.match(other)
-            print(f"Match result: {result}")
-            return result
-
-    def to_nnf(self) -> "Not":
-        inner = self.expr
-        if inner.is_atomic():
+    def __str__(self) -> str:
+        return "(" + f" {self._symbol} ".join(map(str, self.operands)) + ")"
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.operands))})"
+
+    def _combine(self, values: List[Any]) -> Any:
+        """The connective over ``values``, with constants folded."""
+        operands = []
+        for value in values:
+            if value is self._unit:
+                continue
+            if value is (not self._unit):
+                return not self._unit
+            operands.append(value)
+        if not operands:
+            return self._unit
+        if len(operands) == 1:
+            return operands[0]
+        return type(self)(*operands)
+
+    def evaluate(self, valuation=None):
+        if valuation is None:
             return self
-        if isinstance(inner, And):
-            return Or(*(Not(expr).to_nnf() for expr in inner.expr))
-        if isinstance(inner, Or):
-            return And(*(Not(expr).to_nnf() for expr in inner.expr))
-        if isinstance(inner, Not):
-            return inner.expr.to_nnf()
\ No newline at end of file
+        return self._combine([operand.evaluate(valuation) if isinstance(operand, LogicalExpression) else operand
+                              for operand in self.operands])
+
+
+class Conjunction(_NaryConnective):
+    """The n-ary, canonical form of ``And``; ``Conjunction()`` is true."""
+    __slots__ = ()
+    _symbol = "∧"
+    _unit = True
+    _binary = And
+
+
+class Disjunction(_NaryConnective):
+    """The n-ary, canonical form of ``Or``; ``Disjunction()`` is false."""
+    __slots__ = ()
+    _symbol = "∨"
+    _unit = False
+    _binary = Or
+
+
+Conjunction._dual = Disjunction
+Disjunction._dual = Conjunction
@@ -1,17 +1,134 @@
 from __future__ import annotations
 import abc
-import sympy
+import sys
 from typing import Any, Dict, Type, Union, TYPE_CHECKING
+from symlogos import hash_consing
 
 if TYPE_CHECKING:
     from symlogos.connectives import Implication, Not
     from symlogos.modal_operators import Possibility
     from symlogos.proposition import Proposition
 
-class CombinedMeta(sympy.Basic.__class__, abc.ABCMeta):
-    pass
 
-class LogicalExpression(sympy.Basic, metaclass=CombinedMeta):
+class Symbol:
+    """An interned name: there is one ``Symbol`` object per string.
+
+    Symbols compare equal to ``sympy.Symbol`` objects of the same name, but
+    creating one never imports sympy.
+    """
+    __slots__ = ("name",)
+
+    _table: Dict[str, "Symbol"] = {}
+
+    def __new__(cls: Type[Symbol], name: Any) -> "Symbol":
+        obj = cls._table.get(name)
+        if obj is not None:
+            return obj
+        if isinstance(name, Symbol):
+            return name
+        name = str(name)
+        obj = cls._table.get(name)
+        if obj is None:
+            obj = super().__new__(cls)
+            obj.name = name
+            cls._table[name] = obj
+        return obj
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        sympy = sys.modules.get("sympy")
+        if sympy is not None and isinstance(other, sympy.Symbol):
+            return self.name == other.name
+        return False
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return f"Symbol('{self.name}')"
+
+    def __reduce__(self):
+        return (Symbol, (self.name,))
+
+
+class CombinedMeta(abc.ABCMeta):
+    def __call__(cls, *args, **kwargs):
+        obj = type.__call__(cls, *args, **kwargs)
+        obj._hash = None
+        obj._interned = None
+        obj._metadata = None
+        # Classes opt into hash-consing by naming their structural fields.
+        if hash_consing.active_table is not None and cls._fields:
+            return hash_consing.active_table.intern(obj)
+        return obj
+
+
+class Node(metaclass=CombinedMeta):
+    """Common base of formulas and terms.
+
+    Nodes have no ``__dict__``: every subclass declares its attributes in
+    ``__slots__``. ``_fields`` names the attributes that make up the
+    structure of a node, ``_hash`` caches its hash and ``_interned`` is the
+    generation of the hash-consing table the node came from, if any. ``_metadata`` caches
+    the node's ``metadata``.
+    """
+    __slots__ = ("_hash", "_interned", "_metadata", "__weakref__")
+    _fields = ()
+
+    @property
+    def args(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    @property
+    def metadata(self):
+        """Size, height, atoms, free variables and nesting depths; see ``symlogos.metadata.Metadata``."""
+        if self._metadata is None:
+            from symlogos.metadata import metadata
+            return metadata(self)
+        return self._metadata
+
+    def variables(self):
+        """The free variables, as a set."""
+        return set(self.metadata.free_variables)
+
+    def substitute(self, mapping: Any, replacement: Any = None):
+        """Replace the free occurrences of the keys of ``mapping`` by their values, all at once.
+
+        ``substitute(old, new)`` is short for ``substitute({old: new})``.
+        Quantifiers are renamed where they would capture a variable of a
+        value. See ``symlogos.transform.Substitution``.
+        """
+        from symlogos.transform import substitute
+        return substitute(self, mapping if isinstance(mapping, dict) else {mapping: replacement})
+
+    def subs(self, substitutions: Dict[Any, Any]):
+        """Replace every subexpression that is a key of ``substitutions``, bound variables included."""
+        from symlogos.transform import replace
+        return replace(self, substitutions)
+
+    def _rebuild(self, *values):
+        return type(self)(*values)
+
+    def match(self, other, bindings: Dict[Any, Any] = None):
+        """The bindings under which this node, as a pattern, matches ``other``, or None.
+
+        See ``symlogos.matching.Matcher`` for what matches what.
+        """
+        from symlogos.matching import match
+        return match(self, other, bindings)
+
+    def to_sympy(self):
+        from symlogos.sympy_bridge import to_sympy
+        return to_sympy(self)
+
+
+class LogicalExpression(Node):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __eq__(self, other):
         pass
@@ -20,45 +137,47 @@ class LogicalExpression(sympy.Basic, metaclass=CombinedMeta):
     def __hash__(self):
         pass
 
-    @abc.abstractmethod
-    def match(self, other):
-        pass
-
-    def substitute(self, mapping):
-        raise NotImplementedError("Substitution not implemented for this class")
-
     def substitute_all(self, substitutions):
-        return self.subs(substitutions)
+        return self.substitute(substitutions)
 
     def substitute_all_terms(self, term_replacement_dict: Dict[Any, Any]) -> Union['Possibility', 'Implication']:
-        return self.subs(term_replacement_dict)
+        return self.substitute(term_replacement_dict)
 
     def evaluate(self, assignment):
-        return self.subs(assignment).evalf()
+        return simplify_expression(self.subs(assignment))
 
     def is_atomic(self):
         return False
 
+    def simplify(self):
+        from symlogos.transform import simplify
+        return simplify(self)
+
     def to_nnf(self) -> 'Proposition':
-        if self.is_atomic():
-            return self
-        else:
-            raise NotImplementedError(f"to_nnf is not implemented for the class {type(self)}")
+        from symlogos.transform import to_nnf
+        return to_nnf(self)
 
 
-class Term(sympy.Basic):
-    def __new__(cls: Type[Term], name: str) -> "Term":
-        obj = super().__new__(cls)
-        obj.symbol = sympy.Symbol(name)
-        return obj
+class Term(Node):
+    __slots__ = ("symbol",)
+    _fields = ("symbol",)
+
+    def __init__(self, name: str) -> None:
+        self.symbol = Symbol(name)
 
     def __eq__(self, other: "Term") -> bool:
+        if self is other:
+            return True
         if isinstance(other, Term):
+            if self._interned is not None and self._interned is other._interned:
+                return False
             return self.symbol == other.symbol
         return False
 
     def __hash__(self) -> int:
-        return hash((type(self), self.symbol))
+        if self._hash is None:
+            self._hash = hash((type(self), self.symbol))
+        return self._hash
 
     def __str__(self) -> str:
         return str(self.symbol)
@@ -66,35 +185,15 @@ class Term(sympy.Basic):
     def __repr__(self) -> str:
         return f"Term('{self.symbol}')"
 
-    def substitute(self, mapping):
-        if self in mapping:
-            return mapping[self]
-        return self
-
     def evaluate(self, assignment):
         if self.symbol in assignment:
             return assignment[self.symbol]
         else:
             raise ValueError(f"Assignment for term '{self.symbol}' not found.")
 
-    def match(self, other: "Term") -> Dict[Term, Term]:
-        if isinstance(other, Term):
-            if self.symbol == other.symbol:
-                print(f"Match successful: self: {self}, other: {other}")
-                return {}
-            elif self.is_variable() or other.is_variable():
-                print(f"Match successful: self: {self}, other: {other}")
-                return {self: other}
-            else:
-                print(f"Matching failed for terms: self: {self}, other: {other}")
-                return None
-        else:
-            print(f"Matching failed for different types: self: {self}, other: {other}")
-            return None
-
     def is_variable(self) -> bool:
         return self.symbol.name.islower()
-    
+
 def simplify_expression(expr: Union['Not', bool, 'Proposition']) -> Union['Not', bool, 'Proposition']:
     if isinstance(expr, LogicalExpression):
         return expr.simplify()
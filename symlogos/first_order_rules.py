@@ -1,17 +1,29 @@
-from symlogos.connectives import And, Implication, Or
+from symlogos.connectives import And, Conjunction, Disjunction, Implication, Not, Or
 from symlogos.expressions_and_terms import Term
 from symlogos.quantifiers import Exists, Forall
 from symlogos.rules import TableauRule
 from symlogos.signed_formula import SignedFormula
-from typing import List
+from symlogos.tracing import INFO, tracer
+from typing import List, Tuple
 
+from symlogos.tableau_branch import Branch
 from symlogos.tableau_node import TableauNode
 
 
 class AlphaRule(TableauRule):
+    expands = (("T", And), ("F", And), ("T", Or), ("F", Or),
+               ("T", Conjunction), ("F", Conjunction), ("T", Disjunction), ("F", Disjunction))
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
+    @classmethod
+    def expansion(cls, node, signed_formula: SignedFormula) -> List[SignedFormula]:
+        formula = signed_formula.formula
+        if isinstance(formula, (Conjunction, Disjunction)):
+            return [SignedFormula(signed_formula.sign, operand) for operand in formula.operands]
+        return [SignedFormula(signed_formula.sign, formula.left), SignedFormula(signed_formula.sign, formula.right)]
+
     def __hash__(self):
         return hash((type(self), self.signed_formula))
 
@@ -20,7 +32,6 @@ class AlphaRule(TableauRule):
         return isinstance(formula, And) or isinstance(formula, Or)
 
     def apply(self) -> List[SignedFormula]:
-        print(f"AlphaRule: Applying rule to {self.signed_formula}")
         if not self.is_applicable():
             raise ValueError("Alpha rule is not applicable to the given formula")
 
@@ -38,7 +49,8 @@ class AlphaRule(TableauRule):
                 result = [SignedFormula('T', left), SignedFormula('T', right)]
             else:
                 result = [SignedFormula('F', left), SignedFormula('F', right)]
-        print(f"AlphaRule: Result: {result}")
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule="AlphaRule", premise=self.signed_formula, result=result)
         return result
 
 class BetaRule(TableauRule):
@@ -67,7 +79,30 @@ class BetaRule(TableauRule):
             else:
                 return [SignedFormula('T', antecedent), SignedFormula('F', consequent)]
 
+class NegationRule(TableauRule):
+    expands = (("T", Not), ("F", Not))
+
+    def __init__(self, signed_formula: SignedFormula) -> None:
+        super().__init__(signed_formula)
+
+    def __hash__(self):
+        return hash((type(self), self.signed_formula))
+
+    def is_applicable(self) -> bool:
+        return isinstance(self.signed_formula.formula, Not)
+
+    def apply(self) -> List[SignedFormula]:
+        if not self.is_applicable():
+            raise ValueError("Negation rule is not applicable to the given formula")
+        return self.expansion(None, self.signed_formula)
+
+    @classmethod
+    def expansion(cls, node, signed_formula: SignedFormula) -> List[SignedFormula]:
+        return [SignedFormula("F" if signed_formula.sign == "T" else "T", signed_formula.formula.expr)]
+
 class GammaRule(TableauRule):
+    expands = (("F", Exists),)
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
@@ -78,21 +113,39 @@ class GammaRule(TableauRule):
         return isinstance(self.signed_formula.formula, Exists) and self.signed_formula.sign == "F"
 
     def apply(self, node: TableauNode) -> List[TableauNode]:
-        print(f"{self.__class__.__name__}: Applying rule to {self.signed_formula}")
-        quantifier_formula = self.signed_formula.formula
         if not self.is_applicable():
             raise ValueError("GammaRule can only be applied to negated Exists quantifiers")
 
-        fresh_variable = Term("v_" + str(node.get_next_fresh_variable_index()))
-        instantiated_formula = quantifier_formula.predicate.substitute({quantifier_formula.variable: fresh_variable})
-        new_node = TableauNode(SignedFormula("T", instantiated_formula), node)
+        [(signed_formula, branch)] = self._instantiate(node)
+        new_node = TableauNode(signed_formula, node, branch)
         node.children.append(new_node)
         result = [new_node]
-        print(f"{self.__class__.__name__}: Result: {result}")
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
         return result
 
+    def _instantiate(self, node: TableauNode) -> List[Tuple[SignedFormula, Branch]]:
+        """The instance at the branch's next fresh variable, and the branch with that variable used up."""
+        quantifier_formula = self.signed_formula.formula
+        fresh_variable = Term("v_" + str(node.get_next_fresh_variable_index()))
+        instantiated_formula = quantifier_formula.predicate.substitute({quantifier_formula.variable: fresh_variable})
+        return [(SignedFormula("T", instantiated_formula), node.branch.with_fresh_variable())]
+
+    @classmethod
+    def branch_expansion(cls, node: TableauNode, signed_formula: SignedFormula) -> List[Tuple[SignedFormula, Branch]]:
+        result = cls(signed_formula)._instantiate(node)
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=cls.__name__, premise=signed_formula, result=result)
+        return result
+
+    @classmethod
+    def expansion(cls, node: TableauNode, signed_formula: SignedFormula) -> List[SignedFormula]:
+        return [new_signed_formula for new_signed_formula, _ in cls.branch_expansion(node, signed_formula)]
+
 
 class DeltaRule(TableauRule):
+    expands = (("F", Forall),)
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
@@ -103,14 +156,31 @@ class DeltaRule(TableauRule):
         return isinstance(self.signed_formula.formula, Forall)
 
     def apply(self, node: TableauNode) -> List[TableauNode]:
-        quantifier_formula = self.signed_formula.formula
-        if not (isinstance(quantifier_formula, Forall) and self.signed_formula.sign == "F"):
+        if not (isinstance(self.signed_formula.formula, Forall) and self.signed_formula.sign == "F"):
             raise ValueError("DeltaRule can only be applied to negated Forall quantifiers")
 
-        fresh_variable = Term("v_" + str(node.get_next_fresh_variable_index()))
-        instantiated_formula = quantifier_formula.predicate.substitute({quantifier_formula.variable: fresh_variable})
-        new_node = TableauNode(SignedFormula("T", instantiated_formula), node)
+        [(signed_formula, branch)] = self._instantiate(node)
+        new_node = TableauNode(signed_formula, node, branch)
         node.children.append(new_node)
         result = [new_node]
-        print(f"{self.__class__.__name__}: Result: {result}")
-        return result
\ No newline at end of file
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
+        return result
+
+    def _instantiate(self, node: TableauNode) -> List[Tuple[SignedFormula, Branch]]:
+        """The instance at the branch's next fresh variable, and the branch with that variable used up."""
+        quantifier_formula = self.signed_formula.formula
+        fresh_variable = Term("v_" + str(node.get_next_fresh_variable_index()))
+        instantiated_formula = quantifier_formula.predicate.substitute({quantifier_formula.variable: fresh_variable})
+        return [(SignedFormula("T", instantiated_formula), node.branch.with_fresh_variable())]
+
+    @classmethod
+    def branch_expansion(cls, node: TableauNode, signed_formula: SignedFormula) -> List[Tuple[SignedFormula, Branch]]:
+        result = cls(signed_formula)._instantiate(node)
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=cls.__name__, premise=signed_formula, result=result)
+        return result
+
+    @classmethod
+    def expansion(cls, node: TableauNode, signed_formula: SignedFormula) -> List[SignedFormula]:
+        return [new_signed_formula for new_signed_formula, _ in cls.branch_expansion(node, signed_formula)]
@@ -0,0 +1,269 @@
+from __future__ import annotations
+from typing import Iterable, List, Optional, Tuple
+
+from symlogos.connectives import Not
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.proof_result import ProofResult
+from symlogos.signed_formula import SignedFormula
+from symlogos.skolemization import Skolemizer
+from symlogos.tableau_branch import Branch
+from symlogos.tableau_engine import _NO_PENDING, _PRIORITY, Agenda, _hash_formulas, _pop, expand_formula, rule_class
+from symlogos.tracing import DEBUG, INFO, tracer
+from symlogos.unification import Substitution, unify
+
+DEFAULT_MAX_INSTANCES = 4
+DEFAULT_MAX_STEPS = 10000
+
+
+class FreeBranch:
+    """A branch of the free-variable tableau waiting to be expanded.
+
+    Besides the state a ``WorklistTableau`` branch has, it keeps the gamma
+    formulas with how often each was instantiated, the literals that may
+    close it by unification and the rigid variables introduced on it, which
+    Skolem terms depend on. ``skip_closure`` makes the branch instantiate a
+    gamma formula before it tries to close again.
+    """
+    __slots__ = ("new_formulas", "pending", "branch", "gammas", "literals", "free_variables", "skip_closure")
+
+    def __init__(self, new_formulas: Tuple[SignedFormula, ...], pending: Agenda, branch: Branch,
+                 gammas: Tuple[Tuple[SignedFormula, int], ...] = (), literals: Tuple[SignedFormula, ...] = (),
+                 free_variables: Tuple[Term, ...] = (), skip_closure: bool = False) -> None:
+        self.new_formulas = new_formulas
+        self.pending = pending
+        self.branch = branch
+        self.gammas = gammas
+        self.literals = literals
+        self.free_variables = free_variables
+        self.skip_closure = skip_closure
+
+
+class FreeVariableTableau:
+    """First-order tableau with rigid variables, closed by unification.
+
+    The gamma rule (``T ∀x φ``, ``F ∃x φ``) instantiates ``x`` with a fresh
+    rigid variable rather than a fixed term, and a branch closes when two
+    complementary literals can be unified. One substitution has to close
+    every branch, so a branch that can close in several ways is a choice
+    point and the search backtracks into the other ways, or into
+    instantiating its gamma formulas once more, when a later branch cannot
+    be closed. The delta rule (``T ∃x φ``, ``F ∀x φ``) instantiates ``x``
+    with a Skolem function of the branch's rigid variables.
+
+    Each gamma formula is instantiated at most ``n`` times on a branch, for
+    ``n`` from 1 up to ``max_instances``; a search that runs out of
+    instances, or of ``max_steps`` expansions, is reported as
+    ``ProofResult.UNKNOWN``. A saturated open branch without gamma formulas
+    is a model, so that is reported as ``ProofResult.REFUTED``.
+    ``substitution`` holds the unifier that closed the tableau.
+    Modal formulas are not handled here; see ``WorklistTableau``.
+
+    With ``preprocess`` (the default) ``F φ`` is first rewritten to
+    ``T ¬φ`` and every formula is miniscoped and Skolemized by a
+    ``Skolemizer``, so the search only meets universal quantifiers, each
+    scoped as narrowly as it can be.
+    ``instantiations`` counts the quantifiers instantiated.
+    """
+
+    def __init__(self, max_instances: int = DEFAULT_MAX_INSTANCES, max_steps: int = DEFAULT_MAX_STEPS,
+                 preprocess: bool = True) -> None:
+        self.max_instances = max_instances
+        self.max_steps = max_steps
+        self.preprocess = preprocess
+        self.substitution: Optional[Substitution] = None
+        self.instances = 0
+        self.steps = 0
+        self.instantiations = 0
+        self.unknown = False
+        self._rigid_variables = set()
+        self._skolem_functions = 0
+
+    def is_closed(self, premises: Iterable, conclusion) -> bool:
+        roots = [SignedFormula("T", premise) for premise in premises]
+        roots.append(SignedFormula("F", conclusion))
+        return self.run(roots)
+
+    def prove(self, premises: Iterable, conclusion) -> ProofResult:
+        if self.is_closed(premises, conclusion):
+            return ProofResult.PROVED
+        return ProofResult.UNKNOWN if self.unknown else ProofResult.REFUTED
+
+    def run(self, signed_formulas: List[SignedFormula]) -> bool:
+        """True if the tableau closes. Otherwise ``unknown`` tells whether a model was found."""
+        self.substitution = None
+        self.steps = 0
+        self.instantiations = 0
+        self._rigid_variables = set()
+        self._skolem_functions = 0
+        if self.preprocess:
+            formulas = [signed_formula.formula if signed_formula.sign == "T" else Not(signed_formula.formula)
+                        for signed_formula in signed_formulas]
+            signed_formulas = [SignedFormula("T", formula) for formula in Skolemizer().preprocess_all(formulas)]
+        _hash_formulas(signed_formulas)
+        for instances in range(1, self.max_instances + 1):
+            self.instances = instances
+            outcome = self._search(tuple(signed_formulas), instances)
+            if outcome is not None:
+                self.unknown = False
+                if outcome is not False:
+                    self.substitution = outcome
+                    return True
+                return False
+            if self.steps >= self.max_steps:
+                break
+        self.unknown = True
+        return False
+
+    def _is_rigid(self, term: Term) -> bool:
+        return term in self._rigid_variables
+
+    def _search(self, roots: Tuple[SignedFormula, ...], instances: int):
+        """The closing substitution, False if a branch is a model and None if the bounds were hit."""
+        root = FreeBranch(roots, _NO_PENDING, Branch())
+        # Choice points: the branches still to close and the substitution so far.
+        choices = [((root, None), Substitution(self._is_rigid))]
+        while choices:
+            worklist, substitution = choices.pop()
+            while worklist is not None:
+                open_branch, worklist = worklist
+                if self.steps >= self.max_steps:
+                    return None
+                outcome, values = self._expand_branch(open_branch, substitution, instances)
+                if outcome == "split":
+                    for child in reversed(values):
+                        worklist = (child, worklist)
+                elif outcome == "closed":
+                    closers, continuation = values
+                    if continuation is not None:
+                        choices.append(((continuation, worklist), substitution))
+                    for closer in reversed(closers[1:]):
+                        choices.append((worklist, closer))
+                    substitution = closers[0]
+                else:
+                    if not values:
+                        return False
+                    break
+            else:
+                return substitution
+        return None
+
+    def _expand_branch(self, open_branch: FreeBranch, substitution: Substitution, instances: int):
+        """Expand ``open_branch`` until it splits, can close or is saturated.
+
+        Returns ``("split", children)``, ``("closed", (substitutions, continuation))``
+        with the substitutions that close the branch and, if it has gamma
+        instances left, the branch to try instead of closing, or
+        ``("open", has_gammas)``.
+        """
+        branch = open_branch.branch
+        pending = open_branch.pending
+        gammas = open_branch.gammas
+        literals = open_branch.literals
+        free_variables = open_branch.free_variables
+        skip_closure = open_branch.skip_closure
+
+        for signed_formula in reversed(open_branch.new_formulas):
+            branch, pending, literals = self._add(branch, pending, literals, signed_formula)
+
+        while not branch.closed:
+            signed_formula, pending = _pop(pending)
+            if signed_formula is None:
+                if not skip_closure:
+                    closers = self._closers(literals, substitution)
+                    if closers:
+                        continuation = None
+                        if any(uses < instances for _, uses in gammas):
+                            continuation = FreeBranch((), pending, branch, gammas, literals, free_variables, True)
+                        return "closed", (closers, continuation)
+                skip_closure = False
+                # Instantiate the gamma formula used least so far.
+                index = min(range(len(gammas)), key=lambda i: gammas[i][1], default=None)
+                if index is None or gammas[index][1] >= instances:
+                    if tracer.level <= INFO:
+                        tracer.emit(INFO, "branch_open", depth=branch.depth)
+                    return "open", bool(gammas)
+                gamma, uses = gammas[index]
+                gammas = gammas[:index] + ((gamma, uses + 1),) + gammas[index + 1:]
+                variable = Term(f"?X{len(self._rigid_variables)}")
+                self._rigid_variables.add(variable)
+                free_variables = free_variables + (variable,)
+                signed_formula = self._instantiate(gamma, variable)
+                self.instantiations += 1
+                branch, pending, literals = self._add(branch, pending, literals, signed_formula)
+                continue
+
+            self.steps += 1
+            kind, results = expand_formula(signed_formula, 0)
+            if tracer.level <= DEBUG:
+                tracer.emit(DEBUG, "formula_expanded", kind=kind, formula=signed_formula, result=results)
+            if kind in ("universal", "existential"):
+                raise ValueError(f"The free-variable tableau does not handle modal formulas, got {signed_formula}")
+            if kind == "quantifier":
+                if rule_class(signed_formula) == "gamma":
+                    gammas = gammas + ((signed_formula, 0),)
+                    continue
+                results = [self._instantiate(signed_formula, self._skolem_term(free_variables))]
+                self.instantiations += 1
+            elif kind == "beta":
+                alternatives = [result for result in results if branch.status(result) is not None]
+                if any(branch.status(result) is False for result in alternatives):
+                    continue
+                if len(alternatives) > 1:
+                    return "split", [FreeBranch((result,), pending, branch, gammas, literals, free_variables)
+                                     for result in alternatives]
+                results = alternatives
+                if not results:
+                    break
+            for result in reversed(results):
+                branch, pending, literals = self._add(branch, pending, literals, result)
+
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "branch_closed", depth=branch.depth)
+        return "closed", ([substitution], None)
+
+    def _add(self, branch: Branch, pending: Agenda, literals: Tuple[SignedFormula, ...],
+             signed_formula: SignedFormula) -> Tuple[Branch, Agenda, Tuple[SignedFormula, ...]]:
+        extended = branch.extend(signed_formula)
+        if extended is branch:
+            return branch, pending, literals
+        if isinstance(signed_formula.formula, Predicate):
+            literals = literals + (signed_formula,)
+        index = _PRIORITY[rule_class(signed_formula)]
+        pending = pending[:index] + ((signed_formula, pending[index]),) + pending[index + 1:]
+        return extended, pending, literals
+
+    @staticmethod
+    def _closers(literals: Tuple[SignedFormula, ...], substitution: Substitution) -> List[Substitution]:
+        """The substitutions that close the branch by unifying two complementary literals.
+
+        A pair that is already complementary under ``substitution`` makes
+        every other choice pointless, so it is returned on its own.
+        """
+        closers = []
+        for index, positive in enumerate(literals):
+            if positive.sign != "T":
+                continue
+            for negative in literals:
+                if negative.sign != "F" or negative.formula.symbol != positive.formula.symbol:
+                    continue
+                closer = unify(positive.formula, negative.formula, substitution)
+                if closer is None:
+                    continue
+                if len(closer) == len(substitution):
+                    return [substitution]
+                closers.append(closer)
+        closers.sort(key=len)
+        return closers
+
+    def _skolem_term(self, free_variables: Tuple[Term, ...]):
+        name = f"sk{self._skolem_functions}"
+        self._skolem_functions += 1
+        if not free_variables:
+            return Term(name)
+        return FunctionApplication(name, *free_variables)
+
+    @staticmethod
+    def _instantiate(signed_formula: SignedFormula, term) -> SignedFormula:
+        formula = signed_formula.formula
+        return SignedFormula(signed_formula.sign, formula.predicate.substitute({formula.variable: term}))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import weakref
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class UniqueTable:
+    """Maps ``(class, *fields)`` to the one live node with that structure.
+
+    Nodes are held weakly, so an entry disappears as soon as the last formula
+    using it is garbage collected. ``generation`` is the token nodes interned
+    since the last ``clear`` carry; nodes interned before it are not in the
+    table any more and compare structurally with the new ones.
+    """
+
+    def __init__(self) -> None:
+        self._nodes = weakref.WeakValueDictionary()
+        self.generation = object()
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, node: Any) -> Any:
+        key = (type(node),) + tuple(getattr(node, name) for name in node._fields)
+        existing = self._nodes.get(key)
+        if existing is not None:
+            self.hits += 1
+            return existing
+        self.misses += 1
+        # Nodes remember their table's generation: two distinct nodes of the
+        # same generation are structurally different, which makes equality an
+        # identity test.
+        node._interned = self.generation
+        # Hashing the key above hashed every child; the node's own hash is
+        # computed once here and cached on the node.
+        hash(node)
+        self._nodes[key] = node
+        return node
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def clear(self) -> None:
+        self._nodes.clear()
+        self.generation = object()
+        self.hits = 0
+        self.misses = 0
+
+
+# The active table, or None when hash-consing is switched off.
+active_table: Optional[UniqueTable] = None
+
+
+def enable(table: Optional[UniqueTable] = None) -> UniqueTable:
+    global active_table
+    active_table = table if table is not None else UniqueTable()
+    return active_table
+
+
+def disable() -> None:
+    global active_table
+    active_table = None
+
+
+def is_enabled() -> bool:
+    return active_table is not None
+
+
+@contextmanager
+def hash_consing(table: Optional[UniqueTable] = None) -> Iterator[UniqueTable]:
+    """Intern every formula built inside the ``with`` block."""
+    global active_table
+    previous = active_table
+    try:
+        yield enable(table if table is not None or previous is None else previous)
+    finally:
+        active_table = previous
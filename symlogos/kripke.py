@@ -0,0 +1,178 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np
+from scipy import sparse
+
+from symlogos.connectives import And, Conjunction, Disjunction, Or, Not, Implication
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+
+# Worlds are the integers 0 .. num_worlds - 1. The accessibility relation is
+# a CSR matrix R with R[u, v] = 1 when v is accessible from u, and a set of
+# worlds is a boolean vector over them. □φ then holds exactly where no
+# successor falls outside φ, i.e. where R @ ¬φ is zero, and ◇φ where R @ φ is
+# non-zero: one sparse matrix-vector product per modal operator.
+
+MODAL_TYPES = (Proposition, And, Or, Not, Implication, Conjunction, Disjunction, Necessity, Possibility)
+
+
+class Frame:
+    """A set of worlds together with an accessibility relation.
+
+    ``edges`` is an iterable of ``(source, target)`` pairs or an array of
+    shape ``(m, 2)``. Duplicate edges are merged.
+    """
+
+    def __init__(self, num_worlds: int, edges: Any = ()) -> None:
+        edges = np.asarray(edges if isinstance(edges, np.ndarray) else list(edges), dtype=np.int64).reshape(-1, 2)
+        if edges.size and (edges.min() < 0 or edges.max() >= num_worlds):
+            raise ValueError(f"Edge endpoints must be worlds in range(0, {num_worlds})")
+        data = np.ones(len(edges), dtype=np.int32)
+        self.accessibility = self._normalize(sparse.csr_matrix((data, (edges[:, 0], edges[:, 1])), shape=(num_worlds, num_worlds)))
+
+    @staticmethod
+    def _normalize(matrix: Any) -> sparse.csr_matrix:
+        matrix = sparse.csr_matrix(matrix, dtype=np.int32)
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+        matrix.data[:] = 1
+        return matrix
+
+    @classmethod
+    def from_matrix(cls, matrix: Any) -> "Frame":
+        """Build a frame from a square adjacency matrix, dense or sparse."""
+        if matrix.shape[0] != matrix.shape[1]:
+            raise ValueError(f"Accessibility matrix must be square, got shape {matrix.shape}")
+        frame = cls.__new__(cls)
+        frame.accessibility = cls._normalize(matrix)
+        return frame
+
+    @property
+    def num_worlds(self) -> int:
+        return self.accessibility.shape[0]
+
+    @property
+    def num_edges(self) -> int:
+        return self.accessibility.nnz
+
+    def successors(self, world: int) -> np.ndarray:
+        matrix = self.accessibility
+        return matrix.indices[matrix.indptr[world]:matrix.indptr[world + 1]]
+
+    def is_reflexive(self) -> bool:
+        return bool(np.all(self.accessibility.diagonal()))
+
+    def is_serial(self) -> bool:
+        return bool(np.all(np.diff(self.accessibility.indptr)))
+
+    def is_symmetric(self) -> bool:
+        return (self.accessibility != self.accessibility.T).nnz == 0
+
+    def is_transitive(self) -> bool:
+        matrix = self.accessibility.astype(bool)
+        return ((matrix @ matrix) > matrix).nnz == 0
+
+    def box(self, worlds: np.ndarray) -> np.ndarray:
+        """The worlds all of whose successors are in ``worlds``."""
+        return (self.accessibility @ ~worlds) == 0
+
+    def diamond(self, worlds: np.ndarray) -> np.ndarray:
+        """The worlds with at least one successor in ``worlds``."""
+        return (self.accessibility @ worlds) != 0
+
+    def __repr__(self) -> str:
+        return f"Frame({self.num_worlds} worlds, {self.num_edges} edges)"
+
+
+class Model:
+    """A frame with a valuation saying at which worlds each proposition holds.
+
+    ``valuation`` maps propositions (or their names) to either an iterable of
+    world indices or a boolean vector over all worlds. Propositions that are
+    not mentioned are false everywhere.
+    """
+
+    def __init__(self, frame: Frame, valuation: Optional[Mapping[Union[Proposition, str], Any]] = None) -> None:
+        self.frame = frame
+        self.valuation: Dict[Proposition, np.ndarray] = {}
+        for atom, worlds in (valuation or {}).items():
+            self.set(atom, worlds)
+
+    def set(self, atom: Union[Proposition, str], worlds: Any) -> None:
+        """Make ``atom`` true at exactly ``worlds``."""
+        if isinstance(atom, str):
+            atom = Proposition(atom)
+        worlds = np.asarray(worlds if not isinstance(worlds, (set, frozenset)) else sorted(worlds))
+        if worlds.dtype == bool:
+            if worlds.shape != (self.frame.num_worlds,):
+                raise ValueError(f"Valuation of {atom} must have shape ({self.frame.num_worlds},), got {worlds.shape}")
+            vector = worlds.copy()
+        else:
+            vector = np.zeros(self.frame.num_worlds, dtype=bool)
+            vector[worlds.astype(np.int64)] = True
+        self.valuation[atom] = vector
+
+    def evaluate(self, formula: Any) -> np.ndarray:
+        """Boolean vector over the worlds, true where ``formula`` holds."""
+        frame = self.frame
+        values: Dict[Any, np.ndarray] = {}
+        stack = [(formula, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if node in values:
+                continue
+            if isinstance(node, bool):
+                values[node] = np.full(frame.num_worlds, node)
+                continue
+            if isinstance(node, Proposition):
+                vector = self.valuation.get(node)
+                values[node] = vector if vector is not None else np.zeros(frame.num_worlds, dtype=bool)
+                continue
+            if not isinstance(node, MODAL_TYPES):
+                raise TypeError(f"Cannot evaluate {node} in a Kripke model")
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.args)
+                continue
+            if isinstance(node, Not):
+                values[node] = ~values[node.expr]
+            elif isinstance(node, Necessity):
+                values[node] = frame.box(values[node.expr])
+            elif isinstance(node, Possibility):
+                values[node] = frame.diamond(values[node.expr])
+            elif isinstance(node, And):
+                values[node] = values[node.left] & values[node.right]
+            elif isinstance(node, Or):
+                values[node] = values[node.left] | values[node.right]
+            elif isinstance(node, (Conjunction, Disjunction)):
+                conjunction = isinstance(node, Conjunction)
+                result = np.full(frame.num_worlds, conjunction)
+                for operand in node.operands:
+                    result = result & values[operand] if conjunction else result | values[operand]
+                values[node] = result
+            else:
+                values[node] = ~values[node.antecedent] | values[node.consequent]
+        return values[formula]
+
+    def worlds(self, formula: Any) -> np.ndarray:
+        """Indices of the worlds where ``formula`` holds."""
+        return np.flatnonzero(self.evaluate(formula))
+
+    def holds(self, formula: Any, world: int) -> bool:
+        return bool(self.evaluate(formula)[world])
+
+    def is_valid(self, formula: Any) -> bool:
+        """True if ``formula`` holds at every world of the model."""
+        return bool(self.evaluate(formula).all())
+
+    def __repr__(self) -> str:
+        return f"Model({self.frame!r}, {len(self.valuation)} propositions)"
+
+
+def random_model(num_worlds: int, num_edges: int, atoms: Iterable[Union[Proposition, str]] = (),
+                 density: float = 0.5, seed: Optional[int] = None) -> Model:
+    """A model with uniformly random edges and valuations, for testing and benchmarks."""
+    rng = np.random.default_rng(seed)
+    frame = Frame(num_worlds, rng.integers(0, num_worlds, size=(num_edges, 2)))
+    return Model(frame, {atom: rng.random(num_worlds) < density for atom in atoms})
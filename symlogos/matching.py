@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+from symlogos.expressions_and_terms import Node, Term
+from symlogos.functions_and_predicates import HigherOrderFunction
+from symlogos.quantifiers import Exists, Forall
+from symlogos.tracing import DEBUG, emit_match, tracer
+
+_UNBOUND = object()
+
+# What each type is to the matcher, memoised because ``Node`` is an ABC and
+# ``isinstance`` against it is slow.
+_TERM, _BINDER, _NODE, _FUNCTION, _OTHER = "term", "binder", "node", "function", "other"
+_kinds: Dict[type, str] = {}
+
+
+def _kind(cls: type) -> str:
+    kind = _kinds.get(cls)
+    if kind is None:
+        for base, kind in ((Term, _TERM), ((Forall, Exists), _BINDER), (Node, _NODE),
+                           (HigherOrderFunction, _FUNCTION)):
+            if issubclass(cls, base):
+                break
+        else:
+            kind = _OTHER
+        _kinds[cls] = kind
+    return kind
+
+
+class Matcher:
+    """One-way syntactic matching of patterns against expressions.
+
+    A pattern matches an expression of the same type whose structural
+    fields (``_fields``) match pairwise; fields that are not nodes, such as
+    symbols, must be equal. A ``Term`` that is a variable, or is matched
+    against one, is bound to the expression term, itself included, and a
+    term that is bound already only matches what it is bound to, so the
+    bindings of one ``Matcher`` are consistent across every ``match`` call
+    made on it. A node matched against itself binds its variables to
+    themselves. The variable a quantifier binds is only a name for its
+    scope when both quantifiers bind the same one, and is then not bound.
+    A ``HigherOrderFunction`` matches one of the same name whose arguments
+    match its own; an argument or return function it leaves out matches any.
+
+    Matching walks the two expressions with an explicit stack. Every new
+    binding is recorded on ``trail``; ``mark`` and ``undo`` take bindings
+    back, and a failed ``match`` undoes its own.
+    """
+    __slots__ = ("bindings", "trail")
+
+    def __init__(self, bindings: Optional[Dict[Any, Any]] = None) -> None:
+        self.bindings: Dict[Any, Any] = dict(bindings) if bindings else {}
+        self.trail: List[Any] = []
+
+    def mark(self) -> int:
+        return len(self.trail)
+
+    def undo(self, mark: int) -> None:
+        """Remove the bindings made since ``mark``."""
+        bindings, trail = self.bindings, self.trail
+        while len(trail) > mark:
+            del bindings[trail.pop()]
+
+    def match(self, pattern: Any, expression: Any) -> bool:
+        bindings, trail = self.bindings, self.trail
+        mark = len(trail)
+        stack = [(pattern, expression)]
+        while stack:
+            pattern, expression = stack.pop()
+            kind = _kinds.get(type(pattern)) or _kind(type(pattern))
+            if pattern is expression and kind is not _FUNCTION:
+                if kind is _OTHER or self._bind_to_itself(pattern):
+                    continue
+                self.undo(mark)
+                return False
+            if kind is _TERM:
+                if type(expression) is Term or _kind(type(expression)) is _TERM:
+                    bound = bindings.get(pattern, _UNBOUND)
+                    if bound is _UNBOUND:
+                        if pattern.is_variable() or expression.is_variable():
+                            bindings[pattern] = expression
+                            trail.append(pattern)
+                            continue
+                        if pattern.symbol is expression.symbol:
+                            continue
+                    elif bound == expression:
+                        continue
+                self.undo(mark)
+                return False
+            if kind is _FUNCTION:
+                if (_kind(type(expression)) is not _FUNCTION or pattern.name != expression.name
+                        or len(pattern.args) != len(expression.args)):
+                    self.undo(mark)
+                    return False
+                stack.extend(zip(reversed(pattern.args), reversed(expression.args)))
+                for function in ("return_function", "arg_function"):
+                    if getattr(pattern, function) is not None:
+                        stack.append((getattr(pattern, function), getattr(expression, function)))
+                continue
+            if kind is _OTHER or type(pattern) is not type(expression):
+                if pattern == expression:
+                    continue
+                self.undo(mark)
+                return False
+            for name in reversed(pattern._fields):
+                pattern_value, expression_value = getattr(pattern, name), getattr(expression, name)
+                if kind is _BINDER and name == "variable" and str(pattern_value) == str(expression_value):
+                    # The same variable bound on both sides only names the scope.
+                    continue
+                if type(pattern_value) is tuple:
+                    if type(expression_value) is not tuple or len(pattern_value) != len(expression_value):
+                        self.undo(mark)
+                        return False
+                    stack.extend(zip(reversed(pattern_value), reversed(expression_value)))
+                elif (_kinds.get(type(pattern_value)) or _kind(type(pattern_value))) is not _OTHER:
+                    stack.append((pattern_value, expression_value))
+                elif pattern_value != expression_value:
+                    self.undo(mark)
+                    return False
+        return True
+
+    def _bind_to_itself(self, node: Node) -> bool:
+        """Bind the unbound variables of ``node`` to themselves; False if one of its terms is bound to another."""
+        bindings, trail = self.bindings, self.trail
+        for term in node.metadata.terms:
+            if type(term) is str:
+                continue
+            bound = bindings.get(term, _UNBOUND)
+            if bound is _UNBOUND:
+                if term.is_variable():
+                    bindings[term] = term
+                    trail.append(term)
+            elif bound != term:
+                return False
+        return True
+
+def match(pattern: Any, expression: Any, bindings: Optional[Dict[Any, Any]] = None) -> Optional[Dict[Any, Any]]:
+    """The bindings under which ``pattern`` matches ``expression``, extending ``bindings``, or None."""
+    matcher = Matcher(bindings)
+    result = matcher.bindings if matcher.match(pattern, expression) else None
+    if tracer.level <= DEBUG:
+        emit_match(pattern, expression, result)
+    return result
@@ -0,0 +1,284 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zlib import crc32
+from symlogos.connectives import And, Implication, Not, Or, _NaryConnective
+from symlogos.expressions_and_terms import LogicalExpression, Node, Term
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.persistent_set import PersistentSet
+from symlogos.quantifiers import Exists, Forall
+
+# What kind of value a field holds, memoised by type: Node classes are ABCs
+# and ``isinstance`` on them is slow. ``symlogos.transform`` dispatches on
+# the same kinds.
+_NOT, _BINARY, _NARY, _IMPLICATION, _MODAL, _QUANTIFIER, _FORMULA, _NODE, _OTHER = range(9)
+_CONNECTIVES = frozenset((_NOT, _BINARY, _NARY, _IMPLICATION, _MODAL, _QUANTIFIER))
+_FORMULAS = _CONNECTIVES | {_FORMULA}
+_NODES = _FORMULAS | {_NODE}
+_ALL = _NODES | {_OTHER}
+
+_kinds: Dict[type, int] = {}
+
+
+def _kind(value: Any) -> int:
+    cls = type(value)
+    kind = _kinds.get(cls)
+    if kind is None:
+        for base, kind in ((Not, _NOT), ((And, Or), _BINARY), (_NaryConnective, _NARY), (Implication, _IMPLICATION),
+                           ((Necessity, Possibility), _MODAL), ((Forall, Exists), _QUANTIFIER),
+                           (LogicalExpression, _FORMULA), (Node, _NODE)):
+            if issubclass(cls, base):
+                break
+        else:
+            kind = _OTHER
+        _kinds[cls] = kind
+    return kind
+
+
+_EMPTY = PersistentSet()
+
+
+def _union(sets: List[PersistentSet]) -> PersistentSet:
+    """The union of ``sets``: the largest one, with the members of the others added to it."""
+    sets = [members for members in sets if members]
+    if not sets:
+        return _EMPTY
+    union = largest = max(sets, key=len)
+    for members in sets:
+        if members is not largest:
+            for member in members:
+                union = union.add(member)
+    return union
+
+
+class Metadata:
+    """Structural facts about a formula or term, computed once per node.
+
+    - ``size`` counts the nodes of the formula as a tree, its terms and
+      constants included, and ``height`` is the number of nodes on its
+      longest branch. Names, such as a predicate's symbol, do not count.
+    - ``atoms`` are the atomic formulas in it; ``positive_atoms`` and
+      ``negative_atoms`` those with an occurrence under an even and an odd
+      number of negations. The antecedent of an implication counts as negated.
+    - ``terms`` are the ``Term`` objects, and strings used as terms,
+      anywhere in it, bound variables included. ``free_variables`` are the
+      variables among them (``Term.is_variable``, or a lowercase string)
+      with an occurrence no quantifier binds. A quantifier binds the
+      variables with the name of its own, whether terms or strings.
+    - ``modal_depth`` and ``quantifier_depth`` are the largest number of
+      modal operators and of quantifiers nested in each other.
+    - ``digest`` is a 64-bit number computed from the structure and names
+      of the formula alone. Equal formulas have equal digests, and unlike
+      ``hash`` it is the same in every process, whatever
+      ``PYTHONHASHSEED`` is, so it can order things reproducibly.
+
+    Shared subformulas have their metadata computed once. The sets are
+    only computed the first time one of them is asked for, and are
+    ``PersistentSet``s: a node's set is the largest of its children's with
+    the members of the others added, so it shares all but a few paths with
+    that child's, and a set equal to one of the children's is that child's
+    set, not a copy. A chain of nodes thus takes space linear in its length.
+    """
+    __slots__ = ("size", "height", "modal_depth", "quantifier_depth", "digest", "_sets", "_parts")
+
+    def __init__(self, size: int = 1, height: int = 1, modal_depth: int = 0, quantifier_depth: int = 0,
+                 digest: int = 0, sets: Tuple[PersistentSet, ...] = (_EMPTY,) * 5,
+                 parts: Optional[Tuple[Any, ...]] = None) -> None:
+        self.size = size
+        self.height = height
+        self.modal_depth = modal_depth
+        self.quantifier_depth = quantifier_depth
+        self.digest = digest
+        # Positive atoms, negative atoms, atoms, terms and free variables, once computed.
+        self._sets = sets if parts is None else None
+        # What the sets are computed from until then: the kind of the node,
+        # the metadata of its children, the node itself if it is an atomic
+        # formula or a term, and the variable it binds if it is a quantifier.
+        self._parts = parts
+
+    @property
+    def positive_atoms(self) -> PersistentSet:
+        return (self._sets or _fill(self))[0]
+
+    @property
+    def negative_atoms(self) -> PersistentSet:
+        return (self._sets or _fill(self))[1]
+
+    @property
+    def atoms(self) -> PersistentSet:
+        return (self._sets or _fill(self))[2]
+
+    @property
+    def terms(self) -> PersistentSet:
+        return (self._sets or _fill(self))[3]
+
+    @property
+    def free_variables(self) -> PersistentSet:
+        return (self._sets or _fill(self))[4]
+
+    def __repr__(self) -> str:
+        return (f"Metadata(size={self.size}, height={self.height}, atoms={len(self.atoms)}, "
+                f"free_variables={set(self.free_variables)}, modal_depth={self.modal_depth}, "
+                f"quantifier_depth={self.quantifier_depth})")
+
+
+def _sets(kind: int, children: List[Metadata], own: Any, variable: Any) -> Tuple[PersistentSet, ...]:
+    """The sets of a node from those of its children; see ``Metadata._parts``."""
+    if own is not None and kind == _NODE:
+        terms = _EMPTY.add(own)
+        return _EMPTY, _EMPTY, _EMPTY, terms, terms if own.is_variable() else _EMPTY
+    if own is not None:
+        positive = atoms = _EMPTY.add(own)
+        negative = _EMPTY
+    elif kind == _NOT:
+        [inner] = children
+        positive, negative, atoms = inner.negative_atoms, inner.positive_atoms, inner.atoms
+    else:
+        if kind == _IMPLICATION:
+            antecedent, consequent = children
+            positive = _union([antecedent.negative_atoms, consequent.positive_atoms])
+            negative = _union([antecedent.positive_atoms, consequent.negative_atoms])
+        else:
+            positive = _union([child.positive_atoms for child in children])
+            negative = _union([child.negative_atoms for child in children])
+        atoms = _union([child.atoms for child in children])
+    free_variables = _union([child.free_variables for child in children])
+    if kind == _QUANTIFIER:
+        # By name: the string "x" and Term("x") are the same variable.
+        name = str(variable)
+        for bound in (name, Term(name) if type(variable) is str else variable):
+            free_variables = free_variables.discard(bound)
+    return positive, negative, atoms, _union([child.terms for child in children]), free_variables
+
+
+def _fill(data: Metadata) -> Tuple[PersistentSet, ...]:
+    """Compute the sets of ``data`` and of all metadata it is computed from that lacks them, bottom-up."""
+    stack = [data]
+    while stack:
+        top = stack[-1]
+        if top._sets is not None:
+            stack.pop()
+            continue
+        kind, children, own, variable = top._parts
+        pending = [child for child in children if child._sets is None]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        top._sets = _sets(kind, children, own, variable)
+        top._parts = None
+    return data._sets
+
+
+_MASK = (1 << 64) - 1
+
+
+def _digest(value: Any) -> int:
+    """The digest of a value that is not a node, from its type and text."""
+    return crc32(f"{type(value).__name__}:{value}".encode())
+
+
+def _combine(digests: Iterable[int], start: int) -> int:
+    digest = start
+    for item in digests:
+        digest = (digest * 1000003 ^ item) & _MASK
+    return digest
+
+
+_TRUE, _FALSE = Metadata(digest=_digest(True)), Metadata(digest=_digest(False))
+
+
+def _children(node: Node) -> Iterable[Any]:
+    """The values that make up ``node``: node fields, constants and everything in tuple fields."""
+    if _kind(node) == _QUANTIFIER:
+        return (node.variable, node.predicate)
+    children = []
+    for name in node._fields:
+        value = getattr(node, name)
+        if type(value) is tuple:
+            children.extend(value)
+        elif type(value) is bool or _kind(value) in _NODES:
+            children.append(value)
+    return children
+
+
+def _leaf(value: Any) -> Metadata:
+    """The metadata of a value that is not a node: a string standing for a term, or a constant."""
+    if type(value) is str:
+        terms = _EMPTY.add(value)
+        return Metadata(digest=_digest(value), sets=(_EMPTY, _EMPTY, _EMPTY, terms, terms if value.islower() else _EMPTY))
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    return Metadata(digest=_digest(value))
+
+
+def _node_digest(node: Node) -> int:
+    """Combines the class name with the digests of all fields, names included, in order."""
+    digests = []
+    for name in node._fields:
+        value = getattr(node, name)
+        for item in (value if type(value) is tuple else (value,)):
+            digests.append(item._metadata.digest if _kind(item) in _NODES else _digest(item))
+    return _combine(digests, crc32(type(node).__name__.encode()))
+
+
+def _compute(node: Node) -> Metadata:
+    kind = _kind(node)
+    if kind == _NODE and isinstance(node, Term):
+        return Metadata(digest=_node_digest(node), parts=(kind, (), node, None))
+    children = [value._metadata if _kind(value) in _NODES else _leaf(value) for value in _children(node)]
+    own = node if kind == _FORMULA and node.is_atomic() else None
+    return Metadata(
+        size=1 + sum(child.size for child in children),
+        height=1 + max((child.height for child in children), default=0),
+        modal_depth=max((child.modal_depth for child in children), default=0) + (kind == _MODAL),
+        quantifier_depth=max((child.quantifier_depth for child in children), default=0) + (kind == _QUANTIFIER),
+        digest=_node_digest(node),
+        parts=(kind, children, own, node.variable if kind == _QUANTIFIER else None),
+    )
+
+
+def metadata(value: Any) -> Metadata:
+    """The ``Metadata`` of ``value``, cached on every node it computes.
+
+    Works bottom-up from an explicit stack, so formulas of any depth are
+    fine, and so do the sets when they are first asked for.
+    """
+    if _kind(value) not in _NODES:
+        return _leaf(value)
+    if value._metadata is not None:
+        return value._metadata
+    stack = [value]
+    while stack:
+        node = stack[-1]
+        if node._metadata is not None:
+            stack.pop()
+            continue
+        pending = [child for child in _children(node) if _kind(child) in _NODES and child._metadata is None]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        node._metadata = _compute(node)
+    return value._metadata
+
+
+def hash_bottom_up(value: Any) -> None:
+    """Compute and cache the hash of every node in ``value``, children first.
+
+    A node's ``__hash__`` hashes its children, so the first ``hash`` of a
+    deep formula would recurse as deep as the formula goes. This walks an
+    explicit stack instead, and computes nothing but the hashes.
+    """
+    if _kind(value) not in _NODES or value._hash is not None:
+        return
+    stack = [(value, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            hash(node)
+        elif node._hash is None:
+            stack.append((node, True))
+            stack.extend((child, False) for child in _children(node)
+                         if _kind(child) in _NODES and child._hash is None)
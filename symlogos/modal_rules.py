@@ -1,66 +1,93 @@
+from typing import Optional
+
 from symlogos.signed_formula import SignedFormula
 from symlogos.modal_operators import Necessity, Possibility
 from symlogos.rules import TableauRule
+from symlogos.tracing import INFO, tracer
+
+# ``apply`` takes the world the operand is placed at: for ModalBoxTRule and
+# ModalDiamondFRule each world accessible from the premise's, for
+# ModalBoxFRule and ModalDiamondTRule a new one. The labelled tableau in
+# symlogos.tableau_engine keeps track of those worlds. Without a world the
+# operand stays at the premise's own world, as in the recursive prover.
+
+
+class _ModalRule(TableauRule):
+    def _target(self, world: Optional[int]) -> int:
+        return self.signed_formula.world if world is None else world
+
+    @classmethod
+    def expansion(cls, node, signed_formula: SignedFormula) -> list:
+        return [SignedFormula(signed_formula.sign, signed_formula.formula.expr, signed_formula.world)]
+
+
+class ModalBoxTRule(_ModalRule):
+    expands = (("T", Necessity),)
 
-class ModalBoxTRule(TableauRule):
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
-    def apply(self) -> list:
-        print(f"{self.__class__.__name__}: Applying rule to {self.signed_formula}")
+    def apply(self, world: Optional[int] = None) -> list:
         if not isinstance(self.signed_formula.formula, Necessity) or self.signed_formula.sign != "T":
             raise ValueError("Invalid signed formula for ModalBoxTRule")
-        new_signed_formula = SignedFormula("T", self.signed_formula.formula.expr)
-        result= [new_signed_formula]
-        print(f"{self.__class__.__name__}: Result: {result}")
+        new_signed_formula = SignedFormula("T", self.signed_formula.formula.expr, self._target(world))
+        result = [new_signed_formula]
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
         return result
 
     def is_applicable(self) -> bool:
         return self.signed_formula.sign == "T" and isinstance(self.signed_formula.formula, Necessity)
 
-class ModalBoxFRule(TableauRule):
+class ModalBoxFRule(_ModalRule):
+    expands = (("F", Necessity),)
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
-    def apply(self) -> list:
-        print(f"{self.__class__.__name__}: Applying rule to {self.signed_formula}")
+    def apply(self, world: Optional[int] = None) -> list:
         if not isinstance(self.signed_formula.formula, Necessity) or self.signed_formula.sign != "F":
             raise ValueError("Invalid signed formula for ModalBoxFRule")
-        new_signed_formula = SignedFormula("F", self.signed_formula.formula.expr)
+        new_signed_formula = SignedFormula("F", self.signed_formula.formula.expr, self._target(world))
         result = [new_signed_formula]
-        print(f"{self.__class__.__name__}: Result: {result}")
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
         return result
 
     def is_applicable(self) -> bool:
         return self.signed_formula.sign == "F" and isinstance(self.signed_formula.formula, Necessity)
 
-class ModalDiamondTRule(TableauRule):
+class ModalDiamondTRule(_ModalRule):
+    expands = (("T", Possibility),)
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
-    def apply(self) -> list:
-        print(f"{self.__class__.__name__}: Applying rule to {self.signed_formula}")
+    def apply(self, world: Optional[int] = None) -> list:
         if not isinstance(self.signed_formula.formula, Possibility) or self.signed_formula.sign != "T":
             raise ValueError("Invalid signed formula for ModalDiamondTRule")
-        new_signed_formula = SignedFormula("T", self.signed_formula.formula.expr)
+        new_signed_formula = SignedFormula("T", self.signed_formula.formula.expr, self._target(world))
         result = [new_signed_formula]
-        print(f"{self.__class__.__name__}: Result: {result}")
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
         return result
 
     def is_applicable(self) -> bool:
         return self.signed_formula.sign == "T" and isinstance(self.signed_formula.formula, Possibility)
 
-class ModalDiamondFRule(TableauRule):
+class ModalDiamondFRule(_ModalRule):
+    expands = (("F", Possibility),)
+
     def __init__(self, signed_formula: SignedFormula) -> None:
         super().__init__(signed_formula)
 
-    def apply(self) -> list:
-        print(f"{self.__class__.__name__}: Applying rule to {self.signed_formula}")
+    def apply(self, world: Optional[int] = None) -> list:
         if not isinstance(self.signed_formula.formula, Possibility) or self.signed_formula.sign != "F":
             raise ValueError("Invalid signed formula for ModalDiamondFRule")
-        new_signed_formula = SignedFormula("F", self.signed_formula.formula.expr)
+        new_signed_formula = SignedFormula("F", self.signed_formula.formula.expr, self._target(world))
         result = [new_signed_formula]
-        print(f"{self.__class__.__name__}: Result: {result}")
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.__class__.__name__, premise=self.signed_formula, result=result)
         return result
 
     def is_applicable(self) -> bool:
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from collections.abc import Set
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+# A hash array mapped trie: every level consumes five bits of the hash, so a
+# lookup or an insertion touches at most thirteen small nodes for 64-bit
+# hashes and in practice three or four. Adding an element copies only the
+# path from the root to the changed slot, everything else is shared with the
+# set it was derived from.
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+class _Node:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: Tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        # Entries are either nested nodes or ``(hash, item)`` leaves.
+        self.entries = entries
+
+
+class _Collision:
+    __slots__ = ("hash", "items")
+
+    def __init__(self, hash_value: int, items: Tuple[Any, ...]) -> None:
+        self.hash = hash_value
+        self.items = items
+
+
+def _pair(shift: int, first: Tuple[int, Any], second: Tuple[int, Any]):
+    if shift >= _MAX_SHIFT:
+        return _Collision(first[0], (first[1], second[1]))
+    first_index = (first[0] >> shift) & _MASK
+    second_index = (second[0] >> shift) & _MASK
+    if first_index == second_index:
+        return _Node(1 << first_index, (_pair(shift + _BITS, first, second),))
+    if first_index < second_index:
+        return _Node((1 << first_index) | (1 << second_index), (first, second))
+    return _Node((1 << first_index) | (1 << second_index), (second, first))
+
+
+def _insert(node, shift: int, hash_value: int, item: Any):
+    """Return a node containing ``item``, or ``node`` itself if it already did."""
+    if type(node) is _Collision:
+        if item in node.items:
+            return node
+        return _Collision(node.hash, node.items + (item,))
+
+    bit = 1 << ((hash_value >> shift) & _MASK)
+    position = _popcount(node.bitmap & (bit - 1))
+    entries = node.entries
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, entries[:position] + ((hash_value, item),) + entries[position:])
+
+    entry = entries[position]
+    if type(entry) is tuple:
+        if entry[0] == hash_value and entry[1] == item:
+            return node
+        replacement = _pair(shift + _BITS, entry, (hash_value, item))
+    else:
+        replacement = _insert(entry, shift + _BITS, hash_value, item)
+        if replacement is entry:
+            return node
+    return _Node(node.bitmap, entries[:position] + (replacement,) + entries[position + 1:])
+
+
+def _remove(node, shift: int, hash_value: int, item: Any):
+    """Return a node or leaf without ``item``, ``node`` itself if it did not contain it, or None if it is empty."""
+    if type(node) is _Collision:
+        if item not in node.items:
+            return node
+        items = tuple(other for other in node.items if other != item)
+        return _Collision(node.hash, items) if len(items) > 1 else (node.hash, items[0])
+
+    bit = 1 << ((hash_value >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    position = _popcount(node.bitmap & (bit - 1))
+    entries = node.entries
+    entry = entries[position]
+    if type(entry) is tuple:
+        if entry[0] != hash_value or entry[1] != item:
+            return node
+        replacement = None
+    else:
+        replacement = _remove(entry, shift + _BITS, hash_value, item)
+        if replacement is entry:
+            return node
+        # A nested node left with a single leaf is replaced by the leaf.
+        if type(replacement) is _Node and len(replacement.entries) == 1 and type(replacement.entries[0]) is tuple:
+            replacement = replacement.entries[0]
+    if replacement is None:
+        if node.bitmap == bit:
+            return None
+        return _Node(node.bitmap & ~bit, entries[:position] + entries[position + 1:])
+    return _Node(node.bitmap, entries[:position] + (replacement,) + entries[position + 1:])
+
+
+class PersistentSet(Set):
+    """An immutable hash set whose ``add`` and ``discard`` share structure with the original.
+
+    It is a ``collections.abc.Set``, so it compares equal to a ``set`` with
+    the same members; the operators that build a new set, such as ``|``
+    and ``-``, return a ``frozenset``.
+    """
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, _root: Optional[_Node] = None, _size: int = 0) -> None:
+        self._root = _root if _root is not None else _Node(0, ())
+        self._size = _size
+
+    def add(self, item: Any) -> "PersistentSet":
+        root = _insert(self._root, 0, hash(item) & _HASH_MASK, item)
+        if root is self._root:
+            return self
+        return PersistentSet(root, self._size + 1)
+
+    def discard(self, item: Any) -> "PersistentSet":
+        root = _remove(self._root, 0, hash(item) & _HASH_MASK, item)
+        if root is self._root:
+            return self
+        return PersistentSet(root, self._size - 1)
+
+    def __contains__(self, item: Any) -> bool:
+        hash_value = hash(item) & _HASH_MASK
+        node = self._root
+        shift = 0
+        while True:
+            if type(node) is _Collision:
+                return item in node.items
+            bit = 1 << ((hash_value >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return False
+            entry = node.entries[_popcount(node.bitmap & (bit - 1))]
+            if type(entry) is tuple:
+                return entry[0] == hash_value and entry[1] == item
+            node = entry
+            shift += _BITS
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if type(node) is _Collision:
+                yield from node.items
+                continue
+            for entry in node.entries:
+                if type(entry) is tuple:
+                    yield entry[1]
+                else:
+                    stack.append(entry)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[Any]) -> frozenset:
+        return frozenset(iterable)
+
+    def __repr__(self) -> str:
+        return f"PersistentSet({{{', '.join(map(repr, self))}}})"
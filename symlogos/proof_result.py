@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class ProofResult(Enum):
+    """Outcome of a proof attempt.
+
+    ``UNKNOWN`` means the search stopped before it could decide, for example
+    because a resource bound was hit or a quantifier was only instantiated
+    once; it is never reported as a refutation.
+    """
+    PROVED = "proved"
+    REFUTED = "refuted"
+    UNKNOWN = "unknown"
+
+    def __str__(self) -> str:
+        return self.value
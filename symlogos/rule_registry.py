@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from symlogos.first_order_rules import AlphaRule, DeltaRule, GammaRule, NegationRule
+from symlogos.modal_rules import ModalBoxFRule, ModalBoxTRule, ModalDiamondFRule, ModalDiamondTRule
+from symlogos.rules import TableauRule
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_branch import Branch
+
+Expansion = Callable[..., List[Tuple[SignedFormula, Optional[Branch]]]]
+
+BUILTIN_RULES = (AlphaRule, NegationRule, GammaRule, DeltaRule,
+                 ModalBoxTRule, ModalBoxFRule, ModalDiamondTRule, ModalDiamondFRule)
+
+
+def _no_expansion(node, signed_formula: SignedFormula) -> List[Tuple[SignedFormula, Optional[Branch]]]:
+    return []
+
+
+class RuleRegistry:
+    """Which ``TableauRule`` expands a signed formula, keyed by its sign and formula type.
+
+    Each key maps to the rule's ``branch_expansion`` function, so expanding a
+    formula is a single dict lookup and a call. A formula type without a rule
+    of its own uses the rule registered for the nearest base class, and a
+    formula no rule expands (a literal) expands to nothing. Rules from other
+    packages are added with ``register``, which also works as a class
+    decorator::
+
+        @default_registry.register
+        class XorRule(TableauRule):
+            expands = (("T", Xor),)
+    """
+
+    def __init__(self, rules: Iterable[Type[TableauRule]] = ()) -> None:
+        self._rules: Dict[Tuple[str, type], Type[TableauRule]] = {}
+        # Also holds the answers for subclasses and literals, worked out on first use.
+        self._expansions: Dict[Tuple[str, type], Expansion] = {}
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule: Type[TableauRule], sign: Optional[str] = None,
+                 formula_type: Optional[type] = None) -> Type[TableauRule]:
+        """Register ``rule`` for every pair in ``rule.expands``, or only for ``sign`` and ``formula_type``.
+
+        A rule registered later for the same pair replaces the earlier one.
+        """
+        if sign is None:
+            keys = rule.expands
+            if not keys:
+                raise ValueError(f"{rule.__name__} does not say which formulas it expands")
+        else:
+            keys = ((sign, formula_type),)
+        for key in keys:
+            if key[0] not in ("T", "F"):
+                raise ValueError(f"Invalid sign '{key[0]}' for {rule.__name__}")
+            self._rules[key] = rule
+        self._reset()
+        return rule
+
+    def unregister(self, sign: str, formula_type: type) -> None:
+        del self._rules[(sign, formula_type)]
+        self._reset()
+
+    def _reset(self) -> None:
+        self._expansions = {key: rule.branch_expansion for key, rule in self._rules.items()}
+
+    def rule_for(self, signed_formula: SignedFormula) -> Optional[Type[TableauRule]]:
+        for formula_type in type(signed_formula.formula).__mro__:
+            rule = self._rules.get((signed_formula.sign, formula_type))
+            if rule is not None:
+                return rule
+        return None
+
+    def expand(self, node, signed_formula: SignedFormula) -> List[SignedFormula]:
+        """The signed formulas the rule for ``signed_formula`` adds at ``node``."""
+        return [new_signed_formula for new_signed_formula, _ in self.expand_branches(node, signed_formula)]
+
+    def expand_branches(self, node, signed_formula: SignedFormula) -> List[Tuple[SignedFormula, Optional[Branch]]]:
+        """``expand``, with the branch each new formula goes on (None for ``node``'s own)."""
+        key = (signed_formula.sign, type(signed_formula.formula))
+        expansion = self._expansions.get(key)
+        if expansion is None:
+            rule = self.rule_for(signed_formula)
+            expansion = _no_expansion if rule is None else rule.branch_expansion
+            self._expansions[key] = expansion
+        return expansion(node, signed_formula)
+
+    def copy(self) -> "RuleRegistry":
+        registry = RuleRegistry()
+        registry._rules = dict(self._rules)
+        registry._reset()
+        return registry
+
+    def __contains__(self, key: Tuple[str, type]) -> bool:
+        return key in self._rules
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __repr__(self) -> str:
+        return f"RuleRegistry({len(self)} rules)"
+
+
+# Used by every TableauProver that is not given a registry of its own.
+default_registry = RuleRegistry(BUILTIN_RULES)
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from symlogos.expressions_and_terms import LogicalExpression
-from sympy.core.basic import Basic
-from typing import List
+from symlogos.matching import Matcher
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from symlogos.signed_formula import SignedFormula
+from symlogos.tracing import INFO, tracer
+
+if TYPE_CHECKING:
+    from symlogos.tableau_branch import Branch
 
 class Rule:
-    def __init__(self, name: str, premises: List[Basic], conclusion: Basic) -> None:
+    def __init__(self, name: str, premises: List[LogicalExpression], conclusion: LogicalExpression) -> None:
         self.name = name
         self.premises = premises
         self.conclusion = conclusion
@@ -23,20 +27,15 @@ class Rule:
         if len(args) != len(self.premises):
             raise ValueError("Wrong number of arguments")
 
-        match_dicts = []
+        # One matcher for all premises, so a variable is bound the same way in each.
+        matcher = Matcher()
         for premise, arg in zip(self.premises, args):
-            current_match = premise.match(arg)
-            print(f"Matching {premise} with {arg}: {current_match}")  # Debug print
-            if current_match is None:
+            if not matcher.match(premise, arg):
                 return None
-            match_dicts.append(current_match)
-
-        match_dict = {}
-        for d in match_dicts:
-            match_dict.update(d)
 
-        result = self.conclusion.substitute_all_terms(match_dict)
-        print(f"Rule applied: {result}")  # Debug print
+        result = self.conclusion.subs(matcher.bindings)
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "rule_fired", rule=self.name, premises=args, result=result)
         return result
 
     def to_nnf(self) -> "Rule":
@@ -51,10 +50,36 @@ def check_validity():
     pass
 
 class TableauRule(ABC):
+    """A tableau expansion rule.
+
+    ``expands`` lists the ``(sign, formula type)`` pairs the rule handles;
+    ``symlogos.rule_registry.RuleRegistry`` dispatches on them, so a rule
+    added by another package is picked up by registering it there.
+    """
+
+    expands: Tuple[Tuple[str, type], ...] = ()
 
     def __init__(self, signed_formula: SignedFormula) -> None:
         self.signed_formula = signed_formula
 
+    @classmethod
+    def expansion(cls, node, signed_formula: SignedFormula) -> List[SignedFormula]:
+        """The signed formulas that expanding ``signed_formula`` at ``node`` adds.
+
+        The registry only calls this for the pairs in ``expands``, so rules
+        may override it with a version that skips ``is_applicable``.
+        """
+        return cls(signed_formula).apply()
+
+    @classmethod
+    def branch_expansion(cls, node, signed_formula: SignedFormula) -> List[Tuple[SignedFormula, Optional["Branch"]]]:
+        """``expansion`` paired with the branch each new formula goes on, None for ``node``'s own.
+
+        Rules that hand out fresh names return the branch with the name used
+        up, so the next fresh name on it is a different one.
+        """
+        return [(new_signed_formula, None) for new_signed_formula in cls.expansion(node, signed_formula)]
+
     @abstractmethod
     def is_applicable(self):
         """
@@ -0,0 +1,362 @@
+from __future__ import annotations
+import heapq
+from typing import Dict, Iterable, List, Optional
+
+# A conflict-driven clause learning solver in the style of MiniSat.
+#
+# The public interface speaks DIMACS: variables are positive integers and a
+# literal is a variable or its negation. Internally variable ``v`` becomes
+# index ``v - 1`` and its literals ``2 * (v - 1)`` (positive) and
+# ``2 * (v - 1) + 1`` (negative), so negation is ``lit ^ 1`` and the
+# variable of a literal is ``lit >> 1``.
+#
+# Every clause of two or more literals watches its first two positions. A
+# clause is only visited when one of its watched literals becomes false, and
+# then it either finds another literal to watch, becomes unit, or conflicts.
+
+_TRUE = 1
+_FALSE = -1
+_UNASSIGNED = 0
+
+RESTART_BASE = 100
+ACTIVITY_DECAY = 0.95
+RESCALE_LIMIT = 1e100
+
+
+def luby(index: int) -> int:
+    """The ``index``-th element (0-based) of the Luby sequence 1 1 2 1 1 2 4 ..."""
+    size, exponent = 1, 0
+    while size < index + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != index:
+        size = (size - 1) >> 1
+        exponent -= 1
+        index %= size
+    return 1 << exponent
+
+
+class SATSolver:
+    """Decide satisfiability of a set of clauses.
+
+    Conflicts are analysed down to the first unique implication point and the
+    learnt clause is added to the database. Branching picks the unassigned
+    variable with the highest VSIDS activity and gives it the polarity it had
+    when it was last assigned. Restarts follow the Luby sequence, and the
+    learnt clauses with the worst literal block distance are periodically
+    dropped.
+    """
+
+    def __init__(self, clauses: Iterable[Iterable[int]] = ()) -> None:
+        self._ok = True
+        self._clauses: List[Optional[List[int]]] = []
+        self._learnts: List[int] = []
+        self._lbd: Dict[int, int] = {}
+        self._watches: List[List[int]] = []
+        self._value: List[int] = []
+        self._level: List[int] = []
+        self._reason: List[Optional[int]] = []
+        self._activity: List[float] = []
+        self._phase: List[bool] = []
+        self._seen = bytearray()
+        self._heap: List = []
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+        self._qhead = 0
+        self._increment = 1.0
+        self._max_learnts = 2000.0
+        self._model: List[bool] = []
+
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+        self.restarts = 0
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    @property
+    def num_vars(self) -> int:
+        return len(self._level)
+
+    def new_var(self) -> int:
+        var = len(self._level)
+        self._watches.append([])
+        self._watches.append([])
+        self._value.append(_UNASSIGNED)
+        self._value.append(_UNASSIGNED)
+        self._level.append(0)
+        self._reason.append(None)
+        self._activity.append(0.0)
+        self._phase.append(False)
+        self._seen.append(0)
+        heapq.heappush(self._heap, (0.0, var))
+        return var + 1
+
+    def _literal(self, literal: int) -> int:
+        if literal == 0:
+            raise ValueError("0 is not a literal")
+        var = abs(literal)
+        while var > len(self._level):
+            self.new_var()
+        return 2 * (var - 1) + (literal < 0)
+
+    def add_clause(self, literals: Iterable[int]) -> bool:
+        """Add a clause; returns False once the clause set is known unsatisfiable."""
+        if not self._ok:
+            return False
+        self._backtrack(0)
+
+        clause = []
+        for lit in map(self._literal, literals):
+            value = self._value[lit]
+            if value == _TRUE or lit ^ 1 in clause:
+                return True
+            if value == _UNASSIGNED and lit not in clause:
+                clause.append(lit)
+
+        if not clause:
+            self._ok = False
+        elif len(clause) == 1:
+            self._enqueue(clause[0], None)
+            self._ok = self._propagate() is None
+        else:
+            self._attach(clause)
+        return self._ok
+
+    def _attach(self, clause: List[int]) -> int:
+        index = len(self._clauses)
+        self._clauses.append(clause)
+        self._watches[clause[0]].append(index)
+        self._watches[clause[1]].append(index)
+        return index
+
+    def _enqueue(self, lit: int, reason: Optional[int]) -> None:
+        var = lit >> 1
+        self._value[lit] = _TRUE
+        self._value[lit ^ 1] = _FALSE
+        self._level[var] = len(self._trail_lim)
+        self._reason[var] = reason
+        self._trail.append(lit)
+
+    def _propagate(self) -> Optional[int]:
+        """Run unit propagation; returns the index of a conflicting clause."""
+        value = self._value
+        clauses = self._clauses
+        watches = self._watches
+        trail = self._trail
+        while self._qhead < len(trail):
+            false_lit = trail[self._qhead] ^ 1
+            self._qhead += 1
+            self.propagations += 1
+            watchers = watches[false_lit]
+            i = j = 0
+            count = len(watchers)
+            while i < count:
+                index = watchers[i]
+                i += 1
+                clause = clauses[index]
+                if clause is None:
+                    continue
+                if clause[0] == false_lit:
+                    clause[0] = clause[1]
+                    clause[1] = false_lit
+                first = clause[0]
+                if value[first] == _TRUE:
+                    watchers[j] = index
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if value[lit] != _FALSE:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watchers[j] = index
+                    j += 1
+                    if value[first] == _FALSE:
+                        watchers[j:] = watchers[i:count]
+                        self._qhead = len(trail)
+                        return index
+                    self._enqueue(first, index)
+            del watchers[j:]
+        return None
+
+    def _analyze(self, conflict: int):
+        """Derive the first-UIP clause for ``conflict`` and its backjump level."""
+        seen = self._seen
+        level = self._level
+        reason = self._reason
+        trail = self._trail
+        current = len(self._trail_lim)
+
+        learnt = [0]
+        pending = 0
+        lit = None
+        index = len(trail) - 1
+        clause = self._clauses[conflict]
+        while True:
+            for q in (clause if lit is None else clause[1:]):
+                var = q >> 1
+                if not seen[var] and level[var] > 0:
+                    self._bump(var)
+                    seen[var] = 1
+                    if level[var] >= current:
+                        pending += 1
+                    else:
+                        learnt.append(q)
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            seen[lit >> 1] = 0
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self._clauses[reason[lit >> 1]]
+        learnt[0] = lit ^ 1
+
+        # Drop literals implied by the rest of the clause.
+        minimized = [learnt[0]]
+        for q in learnt[1:]:
+            antecedent = reason[q >> 1]
+            if antecedent is None or any(not seen[r >> 1] and level[r >> 1] > 0 for r in self._clauses[antecedent][1:]):
+                minimized.append(q)
+        for q in learnt[1:]:
+            seen[q >> 1] = 0
+
+        backjump = 0
+        if len(minimized) > 1:
+            highest = max(range(1, len(minimized)), key=lambda position: level[minimized[position] >> 1])
+            minimized[1], minimized[highest] = minimized[highest], minimized[1]
+            backjump = level[minimized[1] >> 1]
+        lbd = len({level[q >> 1] for q in minimized})
+        return minimized, backjump, lbd
+
+    def _bump(self, var: int) -> None:
+        activity = self._activity
+        activity[var] += self._increment
+        if activity[var] > RESCALE_LIMIT:
+            for other in range(len(activity)):
+                activity[other] *= 1 / RESCALE_LIMIT
+            self._increment *= 1 / RESCALE_LIMIT
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(-self._activity[var], var) for var in range(len(self._level)) if self._value[2 * var] == _UNASSIGNED]
+        heapq.heapify(self._heap)
+
+    def _backtrack(self, target: int) -> None:
+        if len(self._trail_lim) <= target:
+            return
+        limit = self._trail_lim[target]
+        value = self._value
+        heap = self._heap
+        activity = self._activity
+        for lit in self._trail[limit:]:
+            var = lit >> 1
+            value[lit] = _UNASSIGNED
+            value[lit ^ 1] = _UNASSIGNED
+            self._reason[var] = None
+            self._phase[var] = not lit & 1
+            heapq.heappush(heap, (-activity[var], var))
+        del self._trail[limit:]
+        del self._trail_lim[target:]
+        self._qhead = limit
+        if len(heap) > 4 * len(self._level) + 100:
+            self._rebuild_heap()
+
+    def _pick_branch(self) -> Optional[int]:
+        heap = self._heap
+        value = self._value
+        activity = self._activity
+        while heap:
+            negative_activity, var = heapq.heappop(heap)
+            if value[2 * var] == _UNASSIGNED and -negative_activity == activity[var]:
+                return 2 * var + (not self._phase[var])
+        return None
+
+    def _locked(self, index: int) -> bool:
+        first = self._clauses[index][0]
+        return self._reason[first >> 1] == index and self._value[first] == _TRUE
+
+    def _reduce_learnts(self) -> None:
+        """Forget the half of the learnt clauses with the highest LBD."""
+        ranked = sorted(self._learnts, key=lambda index: (self._lbd[index], len(self._clauses[index])))
+        keep = ranked[:len(ranked) // 2]
+        for index in ranked[len(ranked) // 2:]:
+            if self._lbd[index] <= 2 or self._locked(index):
+                keep.append(index)
+            else:
+                self._clauses[index] = None
+                del self._lbd[index]
+        self._learnts = keep
+        self._max_learnts *= 1.1
+
+    def _search(self, conflict_budget: int) -> Optional[bool]:
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts += 1
+                if not self._trail_lim:
+                    return False
+                learnt, backjump, lbd = self._analyze(conflict)
+                self._backtrack(backjump)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    index = self._attach(learnt)
+                    self._learnts.append(index)
+                    self._lbd[index] = lbd
+                    self._enqueue(learnt[0], index)
+                self._increment /= ACTIVITY_DECAY
+                continue
+
+            if conflicts >= conflict_budget:
+                self._backtrack(0)
+                return None
+            if len(self._learnts) - len(self._trail) >= self._max_learnts:
+                self._reduce_learnts()
+            lit = self._pick_branch()
+            if lit is None:
+                return True
+            self.decisions += 1
+            self._trail_lim.append(len(self._trail))
+            self._enqueue(lit, None)
+
+    def solve(self) -> bool:
+        if not self._ok:
+            return False
+        self._max_learnts = max(self._max_learnts, len(self._clauses) / 3)
+        restart = 0
+        while True:
+            status = self._search(luby(restart) * RESTART_BASE)
+            if status is not None:
+                break
+            restart += 1
+            self.restarts += 1
+        if status:
+            self._model = [self._value[2 * var] == _TRUE for var in range(len(self._level))]
+        else:
+            self._ok = False
+        self._backtrack(0)
+        return status
+
+    def model(self) -> Dict[int, bool]:
+        """The satisfying assignment found by the last successful ``solve``."""
+        return {var + 1: value for var, value in enumerate(self._model)}
+
+    def value(self, var: int) -> bool:
+        return self._model[var - 1]
+
+
+def solve(clauses: Iterable[Iterable[int]]) -> Optional[Dict[int, bool]]:
+    """Return a model of ``clauses`` or None if they are unsatisfiable."""
+    solver = SATSolver(clauses)
+    if solver.solve():
+        return solver.model()
+    return None
@@ -1,22 +1,34 @@
-from sympy.core.basic import Basic
+from symlogos.expressions_and_terms import LogicalExpression
 
 class SignedFormula:
-    def __init__(self, sign: str, formula: Basic) -> None:
+    """A formula asserted true (``T``) or false (``F``) at a world of a labelled tableau.
+
+    Worlds are numbered from 0, the world at which the premises and the
+    conclusion are evaluated.
+    """
+    def __init__(self, sign: str, formula: LogicalExpression, world: int = 0) -> None:
         if sign not in ('T', 'F'):
             raise ValueError("Sign must be either 'T' or 'F'")
         self.sign = sign
         self.formula = formula
+        self.world = world
 
     def __str__(self):
+        if self.world:
+            return f"{self.world}: {self.sign} {self.formula}"
         return f"{self.sign} {self.formula}"
 
     def __eq__(self, other: "SignedFormula") -> bool:
         if not isinstance(other, SignedFormula):
             return False
-        return self.sign == other.sign and self.formula == other.formula
+        return self.sign == other.sign and self.world == other.world and self.formula == other.formula
 
     def __hash__(self):
-        return hash((type(self), self.sign, self.formula))
+        return hash((type(self), self.sign, self.formula, self.world))
+
+    def at(self, world: int) -> "SignedFormula":
+        """The same signed formula at another world."""
+        return SignedFormula(self.sign, self.formula, world)
 
     def is_positive(self) -> bool:
         return self.sign == 'T'
@@ -0,0 +1,247 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from symlogos.connectives import And, Not, Or
+from symlogos.expressions_and_terms import Node, Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.metadata import metadata
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.transform import Transformation, replace, to_binary
+
+
+def occurs(term: Term, formula: Any) -> bool:
+    """True if ``term`` occurs anywhere in ``formula``."""
+    if isinstance(term, (Term, str)):
+        return term in metadata(formula).terms
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if node == term:
+            return True
+        if isinstance(node, Node) and not isinstance(node, Term):
+            for value in node.args:
+                if isinstance(value, tuple):
+                    stack.extend(value)
+                else:
+                    stack.append(value)
+    return False
+
+
+def _names(formula: Any, names: Set[str]) -> None:
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Term):
+            names.add(node.symbol.name)
+        elif isinstance(node, FunctionApplication):
+            names.add(str(node.function_symbol))
+            stack.extend(node.arguments)
+        elif isinstance(node, Node):
+            for value in node.args:
+                if isinstance(value, tuple):
+                    stack.extend(value)
+                else:
+                    stack.append(value)
+
+
+class Skolemizer:
+    """Bring first-order formulas into a form with universal quantifiers only.
+
+    ``preprocess`` puts a formula into negation normal form, gives every
+    quantifier a variable of its own, pushes quantifiers as far inward as
+    they go (miniscoping) and replaces each existential variable by a Skolem
+    term: a fresh constant, or a ``FunctionApplication`` of the universal
+    variables in whose scope it occurs and which its body mentions. The
+    result is satisfiable exactly when the input is, so it can stand in for
+    the input in a refutation, but it is not equivalent to it.
+
+    One ``Skolemizer`` hands out names that are fresh across every formula
+    it has seen, so the formulas of one problem must go through the same
+    instance; ``preprocess_all`` does that. ``skolem_functions`` counts the
+    Skolem terms introduced.
+    """
+
+    def __init__(self) -> None:
+        self.skolem_functions = 0
+        self._names: Set[str] = set()
+        self._variables = 0
+        # The name each renamed variable had, which its copies are named after.
+        self._original: Dict[Term, str] = {}
+
+    def preprocess_all(self, formulas: Iterable[Any]) -> List[Any]:
+        formulas = list(formulas)
+        for formula in formulas:
+            _names(formula, self._names)
+        return [self.preprocess(formula) for formula in formulas]
+
+    def preprocess(self, formula: Any) -> Any:
+        _names(formula, self._names)
+        # Miniscoping works on binary connectives.
+        formula = self._miniscope(self._rename(to_binary(formula).to_nnf()))
+        return self._skolemize(formula, ())
+
+    def _fresh(self, prefix: str) -> str:
+        name = prefix
+        while name in self._names:
+            self._variables += 1
+            name = f"{prefix}_{self._variables}"
+        self._names.add(name)
+        return name
+
+    def _fresh_variable(self, variable: Any) -> Term:
+        original = self._original.get(variable, str(variable))
+        fresh = Term(self._fresh(original))
+        self._original[fresh] = original
+        return fresh
+
+    def _rename(self, formula: Any) -> Any:
+        """``formula`` with every quantifier binding a variable no other quantifier binds."""
+        return _Renaming(self)(formula, 0)
+
+    def _miniscope(self, formula: Any) -> Any:
+        return _Miniscoping(self)(formula)
+
+    def _push(self, quantifier: type, variable: Term, body: Any) -> Any:
+        """``quantifier`` over ``variable`` and ``body``, moved as far into ``body`` as it goes."""
+        return _Pushing(self, quantifier)(body, variable)
+
+    def _skolemize(self, formula: Any, universals: Tuple[Term, ...]) -> Any:
+        return _Skolemization(self)(formula, universals)
+
+
+# The passes of ``Skolemizer``, run from an explicit stack so that long
+# conjunctions and disjunctions do not exhaust the Python stack. Results are
+# memoised by node identity, so the formulas a pass builds in ``children``
+# are kept in ``_built`` until it is done: a freed one's id could be reused.
+
+class _Renaming(Transformation):
+    """The context is the index in ``scopes`` of the renaming in force."""
+
+    def __init__(self, skolemizer: Skolemizer) -> None:
+        self.skolemizer = skolemizer
+        self.scopes: List[Dict[Any, Term]] = [{}]
+        self._binders: Dict[Tuple[int, int], Tuple[Term, int]] = {}
+
+    def _enter(self, node: Any, scope: int) -> Tuple[Term, int]:
+        key = (id(node), scope)
+        if key not in self._binders:
+            variable = self.skolemizer._fresh_variable(node.variable)
+            self.scopes.append({**self.scopes[scope], node.variable: variable})
+            self._binders[key] = (variable, len(self.scopes) - 1)
+        return self._binders[key]
+
+    def children(self, node, scope):
+        if isinstance(node, (Forall, Exists)):
+            return [(node.predicate, self._enter(node, scope)[1])]
+        if isinstance(node, (And, Or)):
+            return [(node.left, scope), (node.right, scope)]
+        return ()
+
+    def combine(self, node, scope, results):
+        if isinstance(node, (Forall, Exists)):
+            return type(node)(self._enter(node, scope)[0], results[0])
+        if isinstance(node, (And, Or)):
+            return type(node)(*results)
+        mapping = self.scopes[scope]
+        return replace(node, mapping) if mapping else node
+
+
+class _Miniscoping(Transformation):
+    def __init__(self, skolemizer: Skolemizer) -> None:
+        self.skolemizer = skolemizer
+
+    def children(self, node, context):
+        if isinstance(node, (Forall, Exists)):
+            return [(node.predicate, context)]
+        if isinstance(node, (And, Or)):
+            return [(node.left, context), (node.right, context)]
+        return ()
+
+    def combine(self, node, context, results):
+        if isinstance(node, (Forall, Exists)):
+            return self.skolemizer._push(type(node), node.variable, results[0])
+        if isinstance(node, (And, Or)):
+            return type(node)(*results)
+        return node
+
+
+class _Pushing(Transformation):
+    """Moves ``quantifier`` into a formula; the context is the variable it binds there."""
+
+    def __init__(self, skolemizer: Skolemizer, quantifier: type) -> None:
+        self.skolemizer = skolemizer
+        self.quantifier = quantifier
+        # ∀ distributes over ∧ and ∃ over ∨; each copy gets a variable of its own.
+        self.distributes = And if quantifier is Forall else Or
+        self._built: List[Any] = []
+
+    def children(self, body, variable):
+        if not occurs(variable, body):
+            return ()
+        if isinstance(body, self.distributes):
+            copy = self.skolemizer._fresh_variable(variable)
+            right = body.right.subs({variable: copy})
+            self._built.append(right)
+            return [(body.left, variable), (right, copy)]
+        # Over the other connective it can only move to the side that mentions it.
+        if isinstance(body, (And, Or)):
+            if not occurs(variable, body.right):
+                return [(body.left, variable)]
+            if not occurs(variable, body.left):
+                return [(body.right, variable)]
+        return ()
+
+    def combine(self, body, variable, results):
+        if not occurs(variable, body):
+            return body
+        if isinstance(body, self.distributes):
+            return self.distributes(*results)
+        if isinstance(body, (And, Or)):
+            if not occurs(variable, body.right):
+                return type(body)(results[0], body.right)
+            if not occurs(variable, body.left):
+                return type(body)(body.left, results[0])
+        return self.quantifier(variable, body)
+
+
+class _Skolemization(Transformation):
+    """The context is the tuple of universal variables in whose scope the node is."""
+
+    def __init__(self, skolemizer: Skolemizer) -> None:
+        self.skolemizer = skolemizer
+        self._built: List[Any] = []
+
+    def children(self, node, universals):
+        if isinstance(node, Forall):
+            return [(node.predicate, universals + (node.variable,))]
+        if isinstance(node, Exists):
+            body = node.predicate
+            arguments = [variable for variable in universals if occurs(variable, body)]
+            skolemizer = self.skolemizer
+            name = skolemizer._fresh(f"sk{skolemizer.skolem_functions}")
+            skolemizer.skolem_functions += 1
+            term = FunctionApplication(name, *arguments) if arguments else Term(name)
+            body = body.subs({node.variable: term})
+            self._built.append(body)
+            return [(body, universals)]
+        if isinstance(node, (And, Or)):
+            return [(node.left, universals), (node.right, universals)]
+        atom = node.expr if isinstance(node, Not) else node
+        if isinstance(atom, (bool, Predicate, Proposition)):
+            return ()
+        raise ValueError(f"Skolemization only handles first-order formulas, got {node}")
+
+    def combine(self, node, universals, results):
+        if isinstance(node, Forall):
+            return Forall(node.variable, results[0])
+        if isinstance(node, Exists):
+            return results[0]
+        if isinstance(node, (And, Or)):
+            return type(node)(*results)
+        return node
+
+
+def skolemize(formulas: Iterable[Any]) -> List[Any]:
+    """The formulas, preprocessed together by one ``Skolemizer``."""
+    return Skolemizer().preprocess_all(formulas)
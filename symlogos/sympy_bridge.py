@@ -0,0 +1,125 @@
+from __future__ import annotations
+from typing import Any
+
+# Conversion between kernel formulas and sympy expressions. sympy is imported
+# on first use only, so code that never converts never pays for the import.
+#
+# Connectives map onto sympy's boolean functions. Modal operators and
+# quantifiers have no sympy counterpart and become undefined boolean
+# functions named after the kernel class, so converting back restores them.
+# sympy predicates are unary, so P(x, y) becomes Holds(P, x, y).
+# sympy keeps the arguments of And and Or in a canonical order, which means
+# a round trip may swap the two sides of a conjunction or disjunction.
+
+_functions = {}
+
+
+def _sympy():
+    import sympy
+    return sympy
+
+
+def _function(name: str):
+    """The undefined sympy boolean function standing for a kernel operator."""
+    function = _functions.get(name)
+    if function is None:
+        from sympy.logic.boolalg import BooleanFunction
+        function = type(name, (BooleanFunction,), {})
+        _functions[name] = function
+    return function
+
+
+def to_sympy(expression: Any) -> Any:
+    from symlogos.connectives import And, Conjunction, Disjunction, Implication, Not, Or
+    from symlogos.expressions_and_terms import Symbol, Term
+    from symlogos.functions_and_predicates import FunctionApplication, Predicate
+    from symlogos.modal_operators import Necessity, Possibility
+    from symlogos.proposition import Proposition
+    from symlogos.quantifiers import Exists, Forall
+
+    sympy = _sympy()
+    if isinstance(expression, bool):
+        return sympy.true if expression else sympy.false
+    if isinstance(expression, Symbol):
+        return sympy.Symbol(expression.name)
+    if isinstance(expression, (Proposition, Term)):
+        return sympy.Symbol(str(expression))
+    if isinstance(expression, Not):
+        return sympy.Not(to_sympy(expression.expr), evaluate=False)
+    if isinstance(expression, And):
+        return sympy.And(to_sympy(expression.left), to_sympy(expression.right), evaluate=False)
+    if isinstance(expression, Or):
+        return sympy.Or(to_sympy(expression.left), to_sympy(expression.right), evaluate=False)
+    if isinstance(expression, Conjunction):
+        return sympy.And(*(to_sympy(operand) for operand in expression.operands), evaluate=False)
+    if isinstance(expression, Disjunction):
+        return sympy.Or(*(to_sympy(operand) for operand in expression.operands), evaluate=False)
+    if isinstance(expression, Implication):
+        return sympy.Implies(to_sympy(expression.antecedent), to_sympy(expression.consequent), evaluate=False)
+    if isinstance(expression, Necessity):
+        return _function("Necessity")(to_sympy(expression.expr))
+    if isinstance(expression, Possibility):
+        return _function("Possibility")(to_sympy(expression.expr))
+    if isinstance(expression, Forall):
+        return _function("Forall")(to_sympy(expression.variable), to_sympy(expression.predicate))
+    if isinstance(expression, Exists):
+        return _function("Exists")(to_sympy(expression.variable), to_sympy(expression.predicate))
+    if isinstance(expression, Predicate):
+        return _function("Holds")(sympy.Symbol(expression.symbol.name), *(to_sympy(term) for term in expression.terms))
+    if isinstance(expression, FunctionApplication):
+        return sympy.Function(str(expression.function_symbol))(*(to_sympy(arg) for arg in expression.arguments))
+    if isinstance(expression, str):
+        return sympy.Symbol(expression)
+    if isinstance(expression, sympy.Basic):
+        return expression
+    raise TypeError(f"Cannot convert {expression!r} to sympy")
+
+
+def from_sympy(expression: Any, atom=None) -> Any:
+    """Convert a sympy expression back to a kernel formula.
+
+    Symbols become propositions unless ``atom`` is given, in which case it is
+    called with the symbol name; arguments of predicates, functions and
+    quantified variables are always read as terms.
+    """
+    from symlogos.connectives import And, Implication, Not, Or
+    from symlogos.expressions_and_terms import Term
+    from symlogos.functions_and_predicates import FunctionApplication, Predicate
+    from symlogos.modal_operators import Necessity, Possibility
+    from symlogos.proposition import Proposition
+    from symlogos.quantifiers import Exists, Forall
+
+    sympy = _sympy()
+    if atom is None:
+        atom = Proposition
+    if expression is sympy.true or expression is True:
+        return True
+    if expression is sympy.false or expression is False:
+        return False
+    if isinstance(expression, sympy.Symbol):
+        return atom(expression.name)
+    if isinstance(expression, sympy.Not):
+        return Not(from_sympy(expression.args[0], atom))
+    if isinstance(expression, (sympy.And, sympy.Or)):
+        connective = And if isinstance(expression, sympy.And) else Or
+        args = [from_sympy(arg, atom) for arg in expression.args]
+        result = args[-1]
+        for arg in reversed(args[:-1]):
+            result = connective(arg, result)
+        return result
+    if isinstance(expression, sympy.Implies):
+        return Implication(from_sympy(expression.args[0], atom), from_sympy(expression.args[1], atom))
+    if isinstance(expression, sympy.logic.boolalg.BooleanFunction):
+        name = type(expression).__name__
+        if name == "Necessity":
+            return Necessity(from_sympy(expression.args[0], atom))
+        if name == "Possibility":
+            return Possibility(from_sympy(expression.args[0], atom))
+        if name in ("Forall", "Exists"):
+            quantifier = Forall if name == "Forall" else Exists
+            return quantifier(from_sympy(expression.args[0], Term), from_sympy(expression.args[1], atom))
+        if name == "Holds":
+            return Predicate(expression.args[0].name, *(from_sympy(arg, Term) for arg in expression.args[1:]))
+    if isinstance(expression, sympy.core.function.AppliedUndef):
+        return FunctionApplication(type(expression).__name__, *(from_sympy(arg, Term) for arg in expression.args))
+    raise TypeError(f"Cannot convert {expression!r} from sympy")
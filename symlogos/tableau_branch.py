@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import Any, List, Optional, Tuple
+
+from symlogos.persistent_set import PersistentSet
+from symlogos.signed_formula import SignedFormula
+
+_EMPTY = PersistentSet()
+
+
+def _key(signed_formula: SignedFormula) -> Any:
+    # Formulas at the root world are stored bare, so branches that never leave
+    # it (every non-modal proof) pay nothing for the world labels.
+    if signed_formula.world:
+        return signed_formula.world, signed_formula.formula
+    return signed_formula.formula
+
+
+class Branch:
+    """Immutable state of one tableau branch.
+
+    A branch remembers which formulas it asserts with sign T and with sign F
+    at which world, how many fresh variables and constants it has handed out
+    and how many formulas it holds. Extending a branch returns a new object
+    that shares almost all of its state with the old one, so creating the two
+    children of a beta split is cheap and a closed branch is detected by a
+    single hashed lookup when the contradicting formula is added.
+
+    ``successors[w]`` lists the worlds accessible from world ``w`` and
+    ``boxes[w]`` the formulas at ``w`` that must hold in all of them (``T □φ``
+    and ``F ◇φ``), so they can be passed on to worlds created later.
+    """
+    __slots__ = ("true_formulas", "false_formulas", "depth", "fresh_variable_index", "fresh_constant_index", "closed",
+                 "successors", "boxes")
+
+    def __init__(self, true_formulas: PersistentSet = _EMPTY, false_formulas: PersistentSet = _EMPTY, depth: int = 0,
+                 fresh_variable_index: int = 0, fresh_constant_index: int = 0, closed: bool = False,
+                 successors: Tuple[Tuple[int, ...], ...] = ((),),
+                 boxes: Tuple[Tuple[SignedFormula, ...], ...] = ((),)) -> None:
+        self.true_formulas = true_formulas
+        self.false_formulas = false_formulas
+        self.depth = depth
+        self.fresh_variable_index = fresh_variable_index
+        self.fresh_constant_index = fresh_constant_index
+        self.closed = closed
+        self.successors = successors
+        self.boxes = boxes
+
+    def status(self, signed_formula: SignedFormula) -> Optional[bool]:
+        """Return None if ``signed_formula`` contradicts the branch, False if
+        the branch already contains it and True if it would be new."""
+        formula = signed_formula.formula
+        key = _key(signed_formula)
+        if signed_formula.sign == "T":
+            if formula is False or key in self.false_formulas:
+                return None
+            return key not in self.true_formulas
+        if formula is True or key in self.true_formulas:
+            return None
+        return key not in self.false_formulas
+
+    def __contains__(self, signed_formula: SignedFormula) -> bool:
+        return self.status(signed_formula) is False
+
+    def extend(self, signed_formula: SignedFormula) -> "Branch":
+        status = self.status(signed_formula)
+        if status is False:
+            return self
+        closed = self.closed or status is None
+        if signed_formula.sign == "T":
+            return Branch(self.true_formulas.add(_key(signed_formula)), self.false_formulas, self.depth + 1,
+                          self.fresh_variable_index, self.fresh_constant_index, closed, self.successors, self.boxes)
+        return Branch(self.true_formulas, self.false_formulas.add(_key(signed_formula)), self.depth + 1,
+                      self.fresh_variable_index, self.fresh_constant_index, closed, self.successors, self.boxes)
+
+    def with_fresh_variable(self) -> "Branch":
+        return Branch(self.true_formulas, self.false_formulas, self.depth,
+                      self.fresh_variable_index + 1, self.fresh_constant_index, self.closed, self.successors, self.boxes)
+
+    def with_fresh_constant(self) -> "Branch":
+        return Branch(self.true_formulas, self.false_formulas, self.depth,
+                      self.fresh_variable_index, self.fresh_constant_index + 1, self.closed, self.successors, self.boxes)
+
+    def formulas_at(self, world: int) -> List[SignedFormula]:
+        """The signed formulas the branch asserts at ``world``."""
+        result = []
+        for sign, formulas in (("T", self.true_formulas), ("F", self.false_formulas)):
+            for key in formulas:
+                if type(key) is tuple:
+                    if key[0] == world:
+                        result.append(SignedFormula(sign, key[1], world))
+                elif not world:
+                    result.append(SignedFormula(sign, key))
+        return result
+
+    @property
+    def num_worlds(self) -> int:
+        return len(self.successors)
+
+    def with_world(self) -> "Branch":
+        """Add a world, numbered ``num_worlds``, with no edges."""
+        return Branch(self.true_formulas, self.false_formulas, self.depth, self.fresh_variable_index,
+                      self.fresh_constant_index, self.closed, self.successors + ((),), self.boxes + ((),))
+
+    def with_edge(self, source: int, target: int) -> "Branch":
+        successors = self.successors
+        successors = successors[:source] + (successors[source] + (target,),) + successors[source + 1:]
+        return Branch(self.true_formulas, self.false_formulas, self.depth, self.fresh_variable_index,
+                      self.fresh_constant_index, self.closed, successors, self.boxes)
+
+    def with_box(self, world: int, signed_formula: SignedFormula) -> "Branch":
+        boxes = self.boxes
+        boxes = boxes[:world] + (boxes[world] + (signed_formula,),) + boxes[world + 1:]
+        return Branch(self.true_formulas, self.false_formulas, self.depth, self.fresh_variable_index,
+                      self.fresh_constant_index, self.closed, self.successors, boxes)
+
+    def __repr__(self) -> str:
+        return f"Branch(depth={self.depth}, closed={self.closed})"
@@ -0,0 +1,490 @@
+from __future__ import annotations
+from typing import Generator, Iterable, List, Optional, Tuple
+
+from symlogos.connectives import And, Conjunction, Disjunction, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.metadata import hash_bottom_up, metadata
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proof_result import ProofResult
+from symlogos.quantifiers import Forall, Exists
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_branch import Branch
+from symlogos.tracing import DEBUG, INFO, tracer
+from symlogos.world_cache import WorldCache
+
+# Pending formulas are kept in an immutable cons list ``(head, tail)`` so that
+# the two children of a beta split can share everything that was still queued
+# on their parent without copying it.
+PendingQueue = Optional[Tuple[SignedFormula, "PendingQueue"]]
+
+# The classes of tableau rules in the order the scheduler applies them:
+# everything that keeps to one branch comes before a beta split, so its
+# results are not derived again on both sides, and gamma instances come last.
+RULE_CLASSES = ("alpha", "delta", "modal", "beta", "gamma")
+
+# One pending queue per rule class, indexed like ``RULE_CLASSES``.
+Agenda = Tuple[PendingQueue, ...]
+_NO_PENDING: Agenda = (None,) * len(RULE_CLASSES)
+_PRIORITY = {name: index for index, name in enumerate(RULE_CLASSES)}
+
+# Modal logics and the frame conditions the tableau enforces for them. In S5
+# every world sees every other, so the accessibility relation is never
+# stored and all worlds of a branch form one equivalence class.
+LOGICS = ("K", "T", "D", "S4", "S5")
+REFLEXIVE = frozenset({"T", "S4"})
+TRANSITIVE = frozenset({"S4"})
+SERIAL = frozenset({"D"})
+UNIVERSAL = frozenset({"S5"})
+
+# In K, T and D a world is constrained only by the world it was created from,
+# so every successor is decided by a search of its own over its label and the
+# answer is cached. S4 and S5 relate worlds to their ancestors and siblings,
+# so their worlds are kept together on the branch.
+LOCAL = frozenset({"K", "T", "D"})
+
+# A search yields the label of every world it needs decided and is sent back
+# whether that label is satisfiable (None if that could not be settled); it
+# returns True if it closed, False if it found an open branch and None if
+# its only open branches are inconclusive.
+Search = Generator[List[SignedFormula], Optional[bool], Optional[bool]]
+
+DEFAULT_MAX_WORLDS = 1000
+
+
+def rule_class(signed_formula: SignedFormula) -> str:
+    """Which of ``RULE_CLASSES`` expands ``signed_formula``; literals count as alpha."""
+    key = (type(signed_formula.formula), signed_formula.sign)
+    try:
+        return _rule_classes[key]
+    except KeyError:
+        pass
+    formula = signed_formula.formula
+    positive = signed_formula.sign == "T"
+    if isinstance(formula, (And, Conjunction)):
+        name = "alpha" if positive else "beta"
+    elif isinstance(formula, (Or, Disjunction, Implication)):
+        name = "beta" if positive else "alpha"
+    elif isinstance(formula, (Necessity, Possibility)):
+        name = "modal"
+    elif isinstance(formula, (Forall, Exists)):
+        name = "gamma" if positive == isinstance(formula, Forall) else "delta"
+    else:
+        name = "alpha"
+    _rule_classes[key] = name
+    return name
+
+
+# The class only depends on the type of the formula and the sign.
+_rule_classes = {}
+
+
+def _pop(pending: Agenda) -> Tuple[Optional[SignedFormula], Agenda]:
+    """The first formula of the highest priority queue that has one."""
+    for index, queue in enumerate(pending):
+        if queue is not None:
+            signed_formula, rest = queue
+            return signed_formula, pending[:index] + (rest,) + pending[index + 1:]
+    return None, pending
+
+# Seriality in D amounts to ◇⊤ holding at every world.
+_SERIAL_WITNESS = SignedFormula("T", Possibility(True))
+
+
+class OpenBranch:
+    """A tableau branch waiting on the worklist.
+
+    ``new_formulas`` are added to ``branch`` when it is activated, ``pending``
+    holds the formulas that are already on the branch but not yet expanded,
+    one queue per rule class, and ``deferred`` the world-creating formulas held back until the branch
+    is otherwise saturated. ``incomplete`` is set once the branch has done
+    something that keeps an open verdict from being final.
+    """
+    __slots__ = ("new_formulas", "pending", "branch", "deferred", "incomplete")
+
+    def __init__(self, new_formulas: Tuple[SignedFormula, ...], pending: Agenda, branch: Branch,
+                 deferred: PendingQueue = None, incomplete: bool = False) -> None:
+        self.new_formulas = new_formulas
+        self.pending = pending
+        self.branch = branch
+        self.deferred = deferred
+        self.incomplete = incomplete
+
+
+class WorklistTableau:
+    """Iterative tableau search driven by an explicit stack of open branches.
+
+    The state of every branch is a persistent ``Branch``, so the children of a
+    split share their parent's formula sets and a contradiction is noticed as
+    soon as the offending formula is added.
+
+    Modal formulas are handled by a labelled tableau: every signed formula
+    carries the world it holds at, ``T ◇φ`` and ``F □φ`` demand a world
+    accessible from theirs where ``φ`` holds (or fails), and ``T □φ`` and
+    ``F ◇φ`` pass ``φ`` on along the accessibility edges only. ``logic``
+    selects the frame conditions: ``"K"`` has none, ``"T"`` makes every world
+    reflexive, ``"D"`` serial, ``"S4"`` reflexive and transitive, and ``"S5"``
+    puts all worlds in a single equivalence class.
+
+    Worlds are only created once everything else on the branch is expanded.
+    In K, T and D a new world's label, its operand plus what the boxes of its
+    parent pass on, is then final, and the world is decided by a separate
+    search that is looked up in and stored into ``cache`` first, so a label
+    reached again on another branch or in another proof is not explored
+    twice. The searches are run from an explicit stack holding one suspended
+    search per world on the current chain of successors, and a world's
+    search is dropped as soon as its verdict is known, so memory grows with
+    the modal depth of the input rather than with the number of worlds
+    explored (``max_nesting`` records the deepest chain), and arbitrarily
+    deep nesting of modalities does not exhaust the Python stack. In S4 and
+    S5 the worlds stay on the branch; an accessible world
+    that already satisfies the operand is reused, and in S4 a world whose
+    formulas all hold at a world that sees it is blocked (subset blocking):
+    the search would only repeat itself there.
+
+    At most ``max_worlds`` worlds are created. Hitting that bound, or
+    instantiating a universal quantifier just once, makes an open branch
+    inconclusive, which ``prove`` reports as ``ProofResult.UNKNOWN``.
+
+    Pending formulas are expanded by rule class in the order of
+    ``RULE_CLASSES``, so a branch is only split once nothing else is left to
+    do on it; with ``schedule=False`` they are expanded in the order they
+    were derived. ``expansions`` counts the rules applied per class and
+    ``branches`` the branches put on the worklist.
+    """
+
+    def __init__(self, logic: str = "K", max_worlds: int = DEFAULT_MAX_WORLDS,
+                 cache: Optional[WorldCache] = None, schedule: bool = True) -> None:
+        if logic not in LOGICS:
+            raise ValueError(f"Unknown modal logic '{logic}', expected one of {LOGICS}")
+        self.logic = logic
+        self.max_worlds = max_worlds
+        self.cache = cache if cache is not None else WorldCache()
+        self.schedule = schedule
+        self.expansions = dict.fromkeys(RULE_CLASSES, 0)
+        self.branches = 0
+        self.max_depth = 0
+        self.worlds_created = 0
+        self.max_nesting = 0
+        self.blocked = 0
+        self.truncated = False
+        self.unknown = False
+
+    def is_closed(self, premises: Iterable, conclusion) -> bool:
+        roots = [SignedFormula("T", premise) for premise in premises]
+        roots.append(SignedFormula("F", conclusion))
+        return self.run(roots)
+
+    def prove(self, premises: Iterable, conclusion) -> ProofResult:
+        if self.is_closed(premises, conclusion):
+            return ProofResult.PROVED
+        return ProofResult.UNKNOWN if self.unknown else ProofResult.REFUTED
+
+    def run(self, signed_formulas: List[SignedFormula]) -> bool:
+        """True if every branch closes. Otherwise ``unknown`` tells whether an open branch was found."""
+        self.max_depth = 0
+        self.worlds_created = 0
+        self.max_nesting = 0
+        self.blocked = 0
+        self.truncated = False
+        self.expansions = dict.fromkeys(RULE_CLASSES, 0)
+        self.branches = 0
+        _hash_formulas(signed_formulas)
+        closed = self._drive(signed_formulas)
+        self.unknown = closed is None
+        return closed is True
+
+    def _drive(self, signed_formulas: Iterable[SignedFormula]) -> Optional[bool]:
+        """Run the search for ``signed_formulas`` and for every world it asks about.
+
+        ``searches`` is the chain of worlds being decided, each waiting on
+        the one above it.
+        """
+        searches = [self._search(signed_formulas)]
+        keys = [None]
+        answer = None
+        while True:
+            try:
+                label = searches[-1].send(answer)
+            except StopIteration as finished:
+                searches.pop()
+                key = keys.pop()
+                if not searches:
+                    return finished.value
+                answer = None if finished.value is None else not finished.value
+                if answer is not None:
+                    self.cache.put(key, answer)
+                continue
+
+            key = self.cache.key(self.logic, label)
+            answer = self.cache.get(key)
+            if answer is not None:
+                continue
+            if self.worlds_created >= self.max_worlds:
+                self.truncated = True
+                continue
+            self.worlds_created += 1
+            if tracer.level <= DEBUG:
+                tracer.emit(DEBUG, "world_created", label=label, logic=self.logic, nesting=len(searches))
+            # The label may mention fresh names its parent gave out: new ones
+            # start past them. The start depends on the label alone, which is
+            # therefore still all the cache key needs.
+            searches.append(self._search(label, _next_fresh_index(label)))
+            keys.append(key)
+            self.max_nesting = max(self.max_nesting, len(searches) - 1)
+
+    def _search(self, signed_formulas: Iterable[SignedFormula], fresh_index: int = 0) -> Search:
+        root = Branch(fresh_variable_index=fresh_index)
+        if self.logic in REFLEXIVE:
+            root = root.with_edge(0, 0)
+        worklist = [OpenBranch(tuple(signed_formulas), _NO_PENDING, root)]
+        self.branches += 1
+        unknown = False
+        while worklist:
+            closed = yield from self._expand_branch(worklist.pop(), worklist)
+            if closed is None:
+                unknown = True
+            elif not closed:
+                return False
+        return None if unknown else True
+
+    def _expand_branch(self, open_branch: OpenBranch, worklist: List[OpenBranch]) -> Search:
+        """Expand ``open_branch`` until it closes, splits or runs out of formulas.
+
+        Returns False when the branch is saturated and still open, None when
+        it is open but incomplete, and True otherwise.
+        """
+        branch = open_branch.branch
+        pending = open_branch.pending
+        deferred = open_branch.deferred
+        incomplete = open_branch.incomplete
+        for signed_formula in reversed(open_branch.new_formulas):
+            extended = branch.extend(signed_formula)
+            if extended is not branch:
+                branch = extended
+                pending = self._push(pending, signed_formula)
+
+        has_successor = False
+        while not branch.closed:
+            signed_formula, pending = _pop(pending)
+            if signed_formula is None and deferred is None:
+                if self.logic in SERIAL and not has_successor and branch.boxes[0]:
+                    deferred = (_SERIAL_WITNESS, None)
+                else:
+                    break
+            if signed_formula is not None:
+                kind, results = expand_formula(signed_formula, branch.fresh_variable_index)
+                if kind == "existential" and self.logic not in UNIVERSAL:
+                    deferred = (signed_formula, deferred)
+                    continue
+            else:
+                signed_formula, deferred = deferred
+                if self.logic in LOCAL:
+                    has_successor = True
+                    satisfiable = yield self._label(branch, signed_formula)
+                    if satisfiable is None:
+                        incomplete = True
+                    elif not satisfiable:
+                        branch = branch.extend(SignedFormula("T", False))
+                    continue
+                if self._is_blocked(branch, signed_formula.world):
+                    self.blocked += 1
+                    if tracer.level <= DEBUG:
+                        tracer.emit(DEBUG, "world_blocked", world=signed_formula.world, formula=signed_formula)
+                    continue
+                kind, results = expand_formula(signed_formula, branch.fresh_variable_index)
+            if kind != "literal":
+                self.expansions[rule_class(signed_formula)] += 1
+            if tracer.level <= DEBUG:
+                tracer.emit(DEBUG, "formula_expanded", kind=kind, formula=signed_formula, result=results)
+            if kind == "beta":
+                # Drop alternatives that would close at once and skip the split
+                # altogether when one alternative is already on the branch.
+                alternatives = []
+                for result in results:
+                    status = branch.status(result)
+                    if status is False:
+                        alternatives = None
+                        break
+                    if status:
+                        alternatives.append(result)
+                if alternatives is None:
+                    continue
+                if len(alternatives) > 1:
+                    if tracer.level <= INFO:
+                        tracer.emit(INFO, "branch_split", depth=branch.depth, formula=signed_formula, alternatives=alternatives)
+                    for result in reversed(alternatives):
+                        worklist.append(OpenBranch((result,), pending, branch, deferred, incomplete))
+                    self.branches += len(alternatives)
+                    self.max_depth = max(self.max_depth, branch.depth)
+                    return True
+                if not alternatives:
+                    self.max_depth = max(self.max_depth, branch.depth)
+                    if tracer.level <= INFO:
+                        tracer.emit(INFO, "branch_closed", depth=branch.depth, formula=signed_formula)
+                    return True
+                results = alternatives
+
+            if kind == "quantifier":
+                branch = branch.with_fresh_variable()
+                # A universal quantifier may need more than one instance.
+                if (signed_formula.sign == "T") == isinstance(signed_formula.formula, Forall):
+                    incomplete = True
+            elif kind == "universal":
+                branch, results = self._expand_universal(signed_formula, results[0], branch)
+            elif kind == "existential":
+                branch, results = self._expand_existential(signed_formula, results[0], branch)
+            if results is None:
+                incomplete = True
+                results = []
+
+            for result in reversed(results):
+                extended = branch.extend(result)
+                if extended is not branch:
+                    branch = extended
+                    pending = self._push(pending, result)
+
+        self.max_depth = max(self.max_depth, branch.depth)
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "branch_closed" if branch.closed else "branch_open", depth=branch.depth)
+        if not branch.closed and incomplete:
+            return None
+        return branch.closed
+
+    def _push(self, pending: Agenda, signed_formula: SignedFormula) -> Agenda:
+        index = _PRIORITY[rule_class(signed_formula)] if self.schedule else 0
+        return pending[:index] + ((signed_formula, pending[index]),) + pending[index + 1:]
+
+    @staticmethod
+    def _label(branch: Branch, signed_formula: SignedFormula) -> List[SignedFormula]:
+        """The label of the successor of the root world that ``signed_formula`` asks for:
+        its operand together with what the boxes of the root world pass on."""
+        label = [SignedFormula(signed_formula.sign, signed_formula.formula.expr)]
+        label.extend(SignedFormula(box.sign, box.formula.expr) for box in branch.boxes[0])
+        return label
+
+    def _successors(self, branch: Branch, world: int) -> Iterable[int]:
+        if self.logic in UNIVERSAL:
+            return range(branch.num_worlds)
+        return branch.successors[world]
+
+    def _is_blocked(self, branch: Branch, world: int) -> bool:
+        """True if a world that sees ``world`` already holds all of its formulas."""
+        label = branch.formulas_at(world)
+        for ancestor in range(branch.num_worlds):
+            if ancestor != world and world in branch.successors[ancestor]:
+                if all(signed_formula.at(ancestor) in branch for signed_formula in label):
+                    return True
+        return False
+
+    def _expand_universal(self, signed_formula: SignedFormula, body: SignedFormula,
+                          branch: Branch) -> Tuple[Branch, List[SignedFormula]]:
+        """``T □φ`` or ``F ◇φ``: ``φ`` holds (or fails) at every accessible world."""
+        world = signed_formula.world
+        branch = branch.with_box(world, signed_formula)
+        return branch, [body.at(successor) for successor in self._successors(branch, world)]
+
+    def _expand_existential(self, signed_formula: SignedFormula, body: SignedFormula,
+                            branch: Branch) -> Tuple[Branch, Optional[List[SignedFormula]]]:
+        """``T ◇φ`` or ``F □φ`` in S4 or S5: some accessible world satisfies (or refutes) ``φ``.
+
+        The formulas are None if a new world was needed but the bound was reached.
+        """
+        world = signed_formula.world
+        for successor in self._successors(branch, world):
+            if body.at(successor) in branch:
+                return branch, []
+        if self.worlds_created >= self.max_worlds:
+            self.truncated = True
+            return branch, None
+        branch, new_world, results = self._new_world(branch, world)
+        results.insert(0, body.at(new_world))
+        return branch, results
+
+    def _new_world(self, branch: Branch, parent: int) -> Tuple[Branch, int, List[SignedFormula]]:
+        """Add a world accessible from ``parent`` and everything the frame conditions demand.
+
+        Returns the new branch, the new world and the formulas that the boxes
+        of the worlds now seeing it pass on.
+        """
+        new_world = branch.num_worlds
+        branch = branch.with_world()
+        self.worlds_created += 1
+        if tracer.level <= DEBUG:
+            tracer.emit(DEBUG, "world_created", world=new_world, parent=parent, logic=self.logic)
+
+        if self.logic in UNIVERSAL:
+            sources = range(new_world)
+        else:
+            if self.logic in TRANSITIVE:
+                # The relation is kept transitively closed, so the worlds that
+                # reach ``parent`` are exactly those it is a successor of.
+                sources = [world for world in range(new_world) if parent in branch.successors[world]]
+            else:
+                sources = [parent]
+            for source in sources:
+                branch = branch.with_edge(source, new_world)
+            if self.logic in REFLEXIVE:
+                branch = branch.with_edge(new_world, new_world)
+
+        results = [SignedFormula(box.sign, box.formula.expr, new_world) for source in sources for box in branch.boxes[source]]
+        return branch, new_world, results
+
+
+def _hash_formulas(signed_formulas: Iterable[SignedFormula]) -> None:
+    """Hash every subformula bottom-up, so that putting a deep one on a branch does not recurse through it."""
+    for signed_formula in signed_formulas:
+        hash_bottom_up(signed_formula.formula)
+
+
+def _next_fresh_index(signed_formulas: Iterable[SignedFormula]) -> int:
+    """The first ``n`` such that no ``v_<m>`` with ``m >= n`` occurs in ``signed_formulas``."""
+    index = 0
+    for signed_formula in signed_formulas:
+        for term in metadata(signed_formula.formula).terms:
+            name = str(term)
+            if name.startswith("v_") and name[2:].isdigit():
+                index = max(index, int(name[2:]) + 1)
+    return index
+
+
+def expand_formula(signed_formula: SignedFormula, fresh_index: int) -> Tuple[str, List[SignedFormula]]:
+    """The kind of rule that expands ``signed_formula`` and what it adds.
+
+    The kind is ``"alpha"``, ``"beta"`` (the results are the alternatives),
+    ``"quantifier"`` (instantiated with ``v_<fresh_index>``), ``"universal"``
+    or ``"existential"`` (modal; the operand still has to be placed at a
+    world) or ``"literal"``.
+    """
+    sign = signed_formula.sign
+    formula = signed_formula.formula
+    world = signed_formula.world
+    positive = sign == "T"
+
+    if isinstance(formula, And):
+        if positive:
+            return "alpha", [SignedFormula("T", formula.left, world), SignedFormula("T", formula.right, world)]
+        return "beta", [SignedFormula("F", formula.left, world), SignedFormula("F", formula.right, world)]
+    if isinstance(formula, Or):
+        if positive:
+            return "beta", [SignedFormula("T", formula.left, world), SignedFormula("T", formula.right, world)]
+        return "alpha", [SignedFormula("F", formula.left, world), SignedFormula("F", formula.right, world)]
+    # All operands of an n-ary connective are taken in one step.
+    if isinstance(formula, Conjunction):
+        return "alpha" if positive else "beta", [SignedFormula(sign, operand, world) for operand in formula.operands]
+    if isinstance(formula, Disjunction):
+        return "beta" if positive else "alpha", [SignedFormula(sign, operand, world) for operand in formula.operands]
+    if isinstance(formula, Implication):
+        if positive:
+            return "beta", [SignedFormula("F", formula.antecedent, world), SignedFormula("T", formula.consequent, world)]
+        return "alpha", [SignedFormula("T", formula.antecedent, world), SignedFormula("F", formula.consequent, world)]
+    if isinstance(formula, Not):
+        return "alpha", [SignedFormula("F" if positive else "T", formula.expr, world)]
+    if isinstance(formula, Necessity):
+        return "universal" if positive else "existential", [SignedFormula(sign, formula.expr)]
+    if isinstance(formula, Possibility):
+        return "existential" if positive else "universal", [SignedFormula(sign, formula.expr)]
+    if isinstance(formula, (Forall, Exists)):
+        fresh_variable = Term("v_" + str(fresh_index))
+        instantiated_formula = formula.predicate.substitute_all_terms({formula.variable: fresh_variable})
+        return "quantifier", [SignedFormula(sign, instantiated_formula, world)]
+    return "literal", []
@@ -1,29 +1,31 @@
 from __future__ import annotations
 from typing import Optional, List
 from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_branch import Branch
 
 class TableauNode:
-    def __init__(self, signed_formula: SignedFormula, parent: Optional[TableauNode]=None) -> None:
+    def __init__(self, signed_formula: SignedFormula, parent: Optional[TableauNode]=None, branch: Optional[Branch]=None) -> None:
         self.signed_formula = signed_formula
         self.parent = parent
         self.children = []
+        # ``branch`` is the state this node extends; it defaults to the parent's.
+        if branch is None:
+            branch = parent.branch if parent is not None else Branch()
+        self.branch = branch.extend(signed_formula)
 
-    def add_child(self, signed_formula):
-        child_node = TableauNode(signed_formula, parent=self)
+    def add_child(self, signed_formula, branch: Optional[Branch]=None):
+        child_node = TableauNode(signed_formula, parent=self, branch=branch)
         self.children.append(child_node)
         return child_node
 
+    def is_closed(self) -> bool:
+        return self.branch.closed
+
     def get_next_fresh_constant_index(self):
-        if self.parent:
-            return self.parent.get_next_fresh_constant_index() + 1
-        else:
-            return 0
+        return self.branch.fresh_constant_index
 
     def get_next_fresh_variable_index(self) -> int:
-        if self.parent:
-            return self.parent.get_next_fresh_variable_index() + 1
-        else:
-            return 0
+        return self.branch.fresh_variable_index
 
     def get_ancestors(self) -> List['TableauNode']:
         ancestors = []
@@ -33,4 +35,4 @@ class TableauNode:
             ancestors.append(current_node)
             current_node = current_node.parent
 
-        return ancestors
\ No newline at end of file
+        return ancestors
@@ -1,21 +1,112 @@
 from __future__ import annotations
 from typing import Optional
 
-from symlogos.first_order_rules import AlphaRule, BetaRule, DeltaRule, GammaRule
-from symlogos.modal_operators import Necessity, Possibility
 from symlogos.proposition import Proposition
 from symlogos.tableau_node import TableauNode
 from .signed_formula import SignedFormula
-from .connectives import And, Or, Not, Implication
-from .quantifiers import Forall, Exists
+from .connectives import Not, Implication
 from symlogos.signed_formula import SignedFormula
-from symlogos.modal_rules import ModalBoxTRule, ModalBoxFRule, ModalDiamondTRule, ModalDiamondFRule
+from symlogos.free_variable_tableau import FreeVariableTableau
+from symlogos.proof_result import ProofResult
+from symlogos.rule_registry import RuleRegistry, default_registry
+from symlogos.tableau_engine import LOGICS, WorklistTableau
+from symlogos.world_cache import WorldCache
+from symlogos.clause_simplifier import ClauseSimplifier
+from symlogos.cnf import TseitinEncoder, is_propositional
+from symlogos.sat_solver import SATSolver
+from symlogos.tracing import DEBUG, INFO, tracer
+
+# "auto" hands purely propositional problems to the SAT solver. Everything
+# else goes to the labelled worklist tableau when a modal logic was chosen
+# and to the recursive tableau otherwise. "free_variable" is the first-order
+# tableau that closes branches by unification.
+ENGINES = ("auto", "recursive", "worklist", "sat", "free_variable")
 
 class TableauProver:
-    def __init__(self):
+    def __init__(self, engine: str = "auto", logic: Optional[str] = None, rules: Optional[RuleRegistry] = None,
+                 simplify: bool = True):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown tableau engine '{engine}', expected one of {ENGINES}")
+        if logic is not None and logic not in LOGICS:
+            raise ValueError(f"Unknown modal logic '{logic}', expected one of {LOGICS}")
+        self.engine = engine
+        self.logic = logic
+        # The recursive tableau expands every formula with the rule registered for it.
+        self.rules = rules if rules is not None else default_registry
         self.tableau_formulas = set()
+        self.depth_limit_reached = False
+        # Shared by every proof this prover runs, see WorklistTableau.
+        self.world_cache = WorldCache()
+        # Problems for the SAT solver are simplified as a whole first; the
+        # last simplifier run is kept for its statistics.
+        self.simplify = simplify
+        self.simplifier: Optional[ClauseSimplifier] = None
+
+    def _select_engine(self, formulas):
+        if self.engine == "sat":
+            for formula in formulas:
+                if not is_propositional(formula):
+                    raise ValueError(f"The SAT engine only handles propositional formulas, got {formula}")
+            return "sat"
+        if self.engine == "auto":
+            if all(is_propositional(formula) for formula in formulas):
+                return "sat"
+            return "worklist" if self.logic is not None else "recursive"
+        return self.engine
+
+    def _solve(self, encoder: TseitinEncoder) -> bool:
+        clauses = encoder.clauses
+        if self.simplify:
+            self.simplifier = ClauseSimplifier(clauses)
+            clauses = self.simplifier.simplify()
+            if tracer.level <= INFO:
+                tracer.emit(INFO, "problem_simplified", clauses_before=self.simplifier.clauses_before,
+                            clauses_after=self.simplifier.clauses_after, literals_before=self.simplifier.literals_before,
+                            literals_after=self.simplifier.literals_after)
+        return SATSolver(clauses).solve()
+
+    def _worklist(self) -> WorklistTableau:
+        return WorklistTableau(self.logic or "K", cache=self.world_cache)
+
+    def is_satisfiable(self, formulas):
+        """Whether the formulas can all be true at once."""
+        formulas = list(formulas)
+        engine = self._select_engine(formulas)
+        if engine == "sat":
+            encoder = TseitinEncoder()
+            encoder.add_all(formulas)
+            return self._solve(encoder)
+        roots = [SignedFormula("T", formula) for formula in formulas]
+        if engine == "free_variable":
+            return not FreeVariableTableau().run(roots)
+        return not self._worklist().run(roots)
 
     def is_sound(self, premises, conclusion):
+        return self.prove(premises, conclusion) is ProofResult.PROVED
+
+    def prove(self, premises, conclusion) -> ProofResult:
+        """Try to prove ``conclusion`` from ``premises``.
+
+        ``ProofResult.UNKNOWN`` means the search gave up, for example at the
+        recursive tableau's depth limit, before it found a countermodel.
+        """
+        premises = list(premises)
+        engine = self._select_engine(premises + [conclusion])
+        if tracer.level <= INFO:
+            tracer.emit(INFO, "proof_started", engine=engine, premises=premises, conclusion=conclusion)
+
+        if engine == "sat":
+            encoder = TseitinEncoder()
+            encoder.add_all(premises)
+            encoder.add(Not(conclusion))
+            return ProofResult.REFUTED if self._solve(encoder) else ProofResult.PROVED
+
+        if engine == "worklist":
+            return self._worklist().prove(premises, conclusion)
+
+        if engine == "free_variable":
+            return FreeVariableTableau().prove(premises, conclusion)
+
         # Create a set of signed formulas for the premises with the sign "T"
         tableau_formulas = {SignedFormula("T", premise) for premise in premises}
 
@@ -25,18 +116,17 @@ class TableauProver:
         # Add the negated conclusion to the tableau formulas
         tableau_formulas.add(negated_conclusion)
 
-        # Print statements for debugging
-        print("Premises:", premises)
-        print("Conclusion:", conclusion)
-        print("Negated Conclusion:", negated_conclusion)
-        print("Tableau Formulas:", tableau_formulas)
-
         # Pass the signed formula to your tableau expansion methods and proceed with the tableau method
         initial_node = TableauNode(negated_conclusion)
+        self.depth_limit_reached = False
         result = self.tableau_expansion(initial_node)
 
+        # A cut-off subtree says nothing either way
+        if self.depth_limit_reached:
+            return ProofResult.UNKNOWN
+
         # Check if the tableau is closed
-        return not result
+        return ProofResult.REFUTED if result else ProofResult.PROVED
 
 
     def _handle_and_or(self, param):
@@ -60,82 +150,49 @@ class TableauProver:
                 return [SignedFormula("T", inner_formula.left), SignedFormula("F", inner_formula.right)]
             else:
                 return [SignedFormula("F", inner_formula.left), SignedFormula("T", inner_formula.right)]
-        elif isinstance(formula, And):
-            if signed_formula.sign == "T":
-                return [SignedFormula("T", formula.left), SignedFormula("T", formula.right)]
-            else:
-                return [SignedFormula("F", formula.left), SignedFormula("F", formula.right)]
-        else:
-            rule = AlphaRule(signed_formula)
-            return rule.apply()
+        return self.rules.expand(param if isinstance(param, TableauNode) else None, signed_formula)
 
     def _handle_quantifiers(self, node, signed_formula):
-        if signed_formula.sign == "T" and isinstance(signed_formula.formula, Forall) or signed_formula.sign == "F" and isinstance(signed_formula.formula, Exists):
-            rule = GammaRule(signed_formula)
-        else:
-            rule = DeltaRule(signed_formula)
-        return [child.signed_formula for child in rule.apply(node)]
+        return self.rules.expand(node, signed_formula)
 
     def _handle_modal_operators(self, signed_formula):
-        formula = signed_formula.formula
-        if isinstance(formula, Necessity):
-            rule = ModalBoxTRule(signed_formula) if signed_formula.sign == "T" else ModalBoxFRule(signed_formula)
-        else:  # isinstance(formula, Possibility)
-            rule = ModalDiamondTRule(signed_formula) if signed_formula.sign == "T" else ModalDiamondFRule(signed_formula)
-        return rule.apply()
+        return self.rules.expand(None, signed_formula)
 
     def _handle_not(self, signed_formula):
-        formula = signed_formula.formula
-        new_sign = "T" if signed_formula.sign == "F" else "F"
-        new_signed_formula = SignedFormula(new_sign, formula.expr)
-        return [new_signed_formula]
+        return self.rules.expand(None, signed_formula)
 
     def tableau_expansion(self, node: TableauNode, depth=0, max_depth=1000):
         signed_formula = node.signed_formula
 
-        # Debug: Print the current signed formula and depth
-        print(f"Depth: {depth}, Current signed formula: {signed_formula}")
-
         # Check for termination conditions
         if depth >= max_depth:
             # Maximum depth reached; cannot determine if the tableau is closed
+            self.depth_limit_reached = True
+            return False
+
+        # A formula that was already on the branch has been expanded above,
+        # doing it again would only repeat the subtree.
+        if node.parent is not None and signed_formula in node.parent.branch:
+            if tracer.level <= DEBUG:
+                tracer.emit(DEBUG, "formula_repeated", depth=depth, formula=signed_formula)
             return False
 
         # Check if the tableau is closed
         if self._is_tableau_closed(node):
-            print(f"Tableau closed at depth {depth} with signed formula {signed_formula}")
+            if tracer.level <= INFO:
+                tracer.emit(INFO, "branch_closed", depth=depth, formula=signed_formula)
             return True
 
-        # Apply tableau rules to the signed formula
-        formula = signed_formula.formula
-        if isinstance(formula, And) or isinstance(formula, Or):
-            new_signed_formulas = self._handle_and_or(signed_formula)
-        elif isinstance(formula, Forall) or isinstance(formula, Exists):
-            new_signed_formulas = self._handle_quantifiers(node, signed_formula)
-        elif isinstance(formula, Necessity) or isinstance(formula, Possibility):
-            new_signed_formulas = self._handle_modal_operators(signed_formula)
-        elif isinstance(formula, Not):
-            new_signed_formulas = self._handle_not(signed_formula)
-        else:
-            new_signed_formulas = []
+        # Apply the registered tableau rule to the signed formula
+        expansions = self.rules.expand_branches(node, signed_formula)
 
-        # Debug: Print the new signed formulas generated
-        print(f"New signed formulas: {new_signed_formulas}")
+        if tracer.level <= DEBUG:
+            tracer.emit(DEBUG, "formula_expanded", depth=depth, formula=signed_formula,
+                        result=[new_signed_formula for new_signed_formula, _ in expansions])
 
-        results = [self.tableau_expansion(node.add_child(new_signed_formula), depth + 1, max_depth) for new_signed_formula in new_signed_formulas]
+        results = [self.tableau_expansion(node.add_child(new_signed_formula, branch), depth + 1, max_depth)
+                   for new_signed_formula, branch in expansions]
         return any(results)
 
     def _is_tableau_closed(self, node: TableauNode) -> bool:
-        signed_formulas = [node.signed_formula] + [ancestor.signed_formula for ancestor in node.get_ancestors()]
-
-        print("Signed formulas in the current branch:")
-        for sf in signed_formulas:
-            print(sf)
-
-        for sf1 in signed_formulas:
-            for sf2 in signed_formulas:
-                if sf1.formula == sf2.formula and sf1.sign != sf2.sign:
-                    return True
-
-        return False
-
+        return node.branch.closed
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import json
+import sys
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, IO, Iterator, List, Optional, Union
+
+# Trace levels, ordered like the ``logging`` module. Match attempts are the
+# noisiest events and sit at DEBUG; rule applications, closed branches and
+# proof results are INFO.
+DEBUG = 10
+INFO = 20
+DISABLED = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO"}
+
+
+class TraceEvent:
+    __slots__ = ("level", "name", "fields")
+
+    def __init__(self, level: int, name: str, fields: Dict[str, Any]) -> None:
+        self.level = level
+        self.name = name
+        self.fields = fields
+
+    def __str__(self) -> str:
+        details = ", ".join(f"{key}={value}" for key, value in self.fields.items())
+        return f"[{LEVEL_NAMES.get(self.level, self.level)}] {self.name}: {details}"
+
+    def __repr__(self) -> str:
+        return f"TraceEvent({self.level!r}, {self.name!r}, {self.fields!r})"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"level": LEVEL_NAMES.get(self.level, self.level), "event": self.name,
+                **{key: _jsonable(value) for key, value in self.fields.items()}}
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+class NullSink:
+    def write(self, event: TraceEvent) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class StdoutSink:
+    def __init__(self, stream: Optional[IO[str]] = None) -> None:
+        self.stream = stream
+
+    def write(self, event: TraceEvent) -> None:
+        print(event, file=self.stream if self.stream is not None else sys.stdout)
+
+    def close(self) -> None:
+        pass
+
+
+class RingBufferSink:
+    """Keeps the last ``capacity`` events in memory."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.buffer = deque(maxlen=capacity)
+
+    def write(self, event: TraceEvent) -> None:
+        self.buffer.append(event)
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        return list(self.buffer)
+
+    def names(self) -> List[str]:
+        return [event.name for event in self.buffer]
+
+    def clear(self) -> None:
+        self.buffer.clear()
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlSink:
+    """Writes one JSON object per event to a file path or an open text stream."""
+
+    def __init__(self, target: Union[str, IO[str]]) -> None:
+        if isinstance(target, str):
+            self.stream = open(target, "a", encoding="utf-8")
+            self._owns_stream = True
+        else:
+            self.stream = target
+            self._owns_stream = False
+
+    def write(self, event: TraceEvent) -> None:
+        self.stream.write(json.dumps(event.to_json(), ensure_ascii=False))
+        self.stream.write("\n")
+
+    def close(self) -> None:
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+class Tracer:
+    """Routes trace events to a sink.
+
+    Call sites guard every event with ``if tracer.level <= LEVEL:`` so that
+    no event fields are built unless someone is listening.
+    """
+    __slots__ = ("level", "sink")
+
+    def __init__(self) -> None:
+        self.level = DISABLED
+        self.sink = NullSink()
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def emit(self, level: int, name: str, **fields: Any) -> None:
+        if level >= self.level:
+            self.sink.write(TraceEvent(level, name, fields))
+
+
+tracer = Tracer()
+
+
+def emit_match(pattern: Any, expression: Any, bindings: Optional[Dict[Any, Any]], reason: Optional[str] = None) -> None:
+    """Report the outcome of a ``match()`` call at DEBUG level."""
+    if bindings is None:
+        tracer.emit(DEBUG, "match_failed", pattern=pattern, expression=expression, reason=reason)
+    else:
+        tracer.emit(DEBUG, "match_succeeded", pattern=pattern, expression=expression, bindings=dict(bindings))
+
+
+def configure(sink=None, level: int = INFO) -> Tracer:
+    """Send events of ``level`` and above to ``sink`` (stdout by default)."""
+    tracer.sink = sink if sink is not None else StdoutSink()
+    tracer.level = level if not isinstance(tracer.sink, NullSink) else DISABLED
+    return tracer
+
+
+def disable() -> None:
+    tracer.sink = NullSink()
+    tracer.level = DISABLED
+
+
+@contextmanager
+def tracing(sink=None, level: int = DEBUG) -> Iterator[Any]:
+    """Temporarily route events to ``sink``; yields the sink."""
+    previous_sink, previous_level = tracer.sink, tracer.level
+    configure(sink, level)
+    try:
+        yield tracer.sink
+    finally:
+        tracer.sink, tracer.level = previous_sink, previous_level
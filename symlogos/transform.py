@@ -0,0 +1,403 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Sequence, Set, Tuple
+from symlogos.connectives import And, Conjunction, Disjunction, Not, Or
+from symlogos.expressions_and_terms import Node, Term
+from symlogos.metadata import (_ALL, _BINARY, _CONNECTIVES, _FORMULA, _FORMULAS, _IMPLICATION, _MODAL, _NARY, _NODE,
+                               _NODES, _NOT, _QUANTIFIER, _kind, metadata)
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.quantifiers import Exists, Forall
+
+# Whole-formula rewrites: negation normal form, simplification, term
+# substitution and the n-ary/binary conversions.
+#
+# Each pass visits a formula bottom-up from an explicit stack, so formulas of
+# any depth are fine, and transforms every node once however often it is
+# shared. A node that comes out unchanged is returned as it is, not rebuilt,
+# so a pass that has nothing to do allocates nothing.
+
+
+def _fields(node: Node) -> Iterable[Any]:
+    """The values of ``node``'s fields, with tuple fields spliced in."""
+    for name in node._fields:
+        value = getattr(node, name)
+        if type(value) is tuple:
+            yield from value
+        else:
+            yield value
+
+
+def _new_values(node: Node, results: Iterable[Any], descend: FrozenSet[int],
+                leaf: Callable[[Any], Any] = None) -> Tuple[List[Any], bool]:
+    """The new values of ``node``'s fields, and whether any of them changed.
+
+    ``results`` are the new values of the fields (and tuple items) whose
+    kind is in ``descend``, in order. Other values are passed through
+    ``leaf`` if given and kept otherwise.
+    """
+    results = iter(results)
+
+    def new(value):
+        if _kind(value) in descend:
+            return next(results)
+        return value if leaf is None else leaf(value)
+
+    values, changed = [], False
+    for name in node._fields:
+        value = getattr(node, name)
+        if type(value) is tuple:
+            new_value = tuple(new(item) for item in value)
+            changed = changed or any(a is not b for a, b in zip(new_value, value))
+        else:
+            new_value = new(value)
+            changed = changed or new_value is not value
+        values.append(new_value)
+    return values, changed
+
+
+def _rebuilt(node: Node, results: Iterable[Any], descend: FrozenSet[int], leaf: Callable[[Any], Any] = None) -> Any:
+    """``node`` over the new field values of ``_new_values``; ``node`` itself if nothing changed."""
+    values, changed = _new_values(node, results, descend, leaf)
+    return node._rebuild(*values) if changed else node
+
+
+class Transformation:
+    """A bottom-up rewrite of formulas that does not recurse.
+
+    A pass visits pairs of a node and a context (None unless the subclass
+    uses one, like the polarity in ``NegationNormalForm``). ``children``
+    lists the pairs to transform before a node and ``combine`` builds its
+    result from theirs. Results are memoised by the identity of the node
+    and the context, so a subformula shared by many parents is transformed
+    once per context: the work is linear in the size of the formula DAG,
+    not of the tree it unfolds to.
+    """
+
+    def children(self, node: Any, context: Hashable) -> Sequence[Tuple[Any, Hashable]]:
+        if _kind(node) not in _FORMULAS:
+            return ()
+        return [(child, context) for child in _fields(node) if _kind(child) in _FORMULAS]
+
+    def combine(self, node: Any, context: Hashable, results: List[Any]) -> Any:
+        return _rebuilt(node, results, _FORMULAS) if results else node
+
+    def __call__(self, formula: Any, context: Hashable = None) -> Any:
+        memo: Dict[Tuple[int, Hashable], Any] = {}
+        stack: List[Tuple[Any, Hashable, Any]] = [(formula, context, None)]
+        while stack:
+            node, context, children = stack.pop()
+            key = (id(node), context)
+            if key in memo:
+                continue
+            if children is None:
+                children = self.children(node, context)
+                pending = [(child, child_context, None) for child, child_context in children
+                           if (id(child), child_context) not in memo]
+                if pending:
+                    stack.append((node, context, children))
+                    stack.extend(pending)
+                    continue
+            memo[key] = self.combine(node, context, [memo[id(child), child_context]
+                                                     for child, child_context in children])
+        return memo[id(formula), context]
+
+
+_DUAL = {And: Or, Or: And, Conjunction: Disjunction, Disjunction: Conjunction,
+         Necessity: Possibility, Possibility: Necessity, Forall: Exists, Exists: Forall}
+
+
+class NegationNormalForm(Transformation):
+    """Push negations down to the atoms.
+
+    The context is whether the node is under an odd number of negations.
+    Negated connectives, modal operators and quantifiers become their duals,
+    implications become disjunctions and double negations cancel. Constants
+    are flipped rather than negated.
+    """
+
+    def children(self, node, negated):
+        kind = _kind(node)
+        if kind == _NOT:
+            return [(node.expr, not negated)]
+        if kind == _IMPLICATION:
+            return [(node.antecedent, not negated), (node.consequent, negated)]
+        if kind == _BINARY or kind == _NARY or kind == _MODAL:
+            return [(child, negated) for child in node.args]
+        if kind == _QUANTIFIER:
+            return [(node.predicate, negated)]
+        if kind == _FORMULA and not node.is_atomic():
+            raise NotImplementedError(f"to_nnf is not implemented for the class {type(node)}")
+        return ()
+
+    def combine(self, node, negated, results):
+        kind = _kind(node)
+        if kind == _NOT:
+            [result] = results
+            # ¬p is in negation normal form already: keep the node.
+            if not negated and _kind(result) == _NOT and result.expr is node.expr:
+                return node
+            return result
+        if kind == _IMPLICATION:
+            return (And if negated else Or)(*results)
+        if kind not in _CONNECTIVES:
+            if type(node) is bool:
+                return node is not negated
+            return Not(node) if negated else node
+        old = (node.predicate,) if kind == _QUANTIFIER else node.args
+        if negated:
+            cls = _DUAL[type(node)]
+        elif all(new is value for new, value in zip(results, old)):
+            return node
+        else:
+            cls = type(node)
+        if kind == _QUANTIFIER:
+            return cls(node.variable, results[0])
+        return cls(*results)
+
+
+class Simplification(Transformation):
+    """Fold the constants True and False and cancel double negations."""
+
+    def children(self, node, context):
+        if _kind(node) in _CONNECTIVES:
+            return [(child, context) for child in _fields(node)]
+        return ()
+
+    def combine(self, node, context, results):
+        kind = _kind(node)
+        if kind == _NOT:
+            [inner] = results
+            if _kind(inner) == _NOT:
+                return inner.expr
+            if type(inner) is bool:
+                return not inner
+        elif kind == _BINARY:
+            left, right = results
+            unit = type(node) is And
+            if left is unit:
+                return right
+            if right is unit:
+                return left
+            if left is (not unit) or right is (not unit):
+                return not unit
+        elif kind == _NARY:
+            if len(results) < 2 or any(type(operand) is bool for operand in results):
+                return node._combine(results)
+        elif kind == _IMPLICATION:
+            antecedent, consequent = results
+            if antecedent is True:
+                return consequent
+            if antecedent is False or consequent is True or antecedent == consequent:
+                return True
+        elif kind == _MODAL:
+            [inner] = results
+            if type(inner) is bool:
+                return inner
+        elif kind != _QUANTIFIER:
+            return node
+        return _rebuilt(node, results, _ALL)
+
+
+def _is_term(value: Any) -> bool:
+    return type(value) is str or _kind(value) == _NODE and isinstance(value, Term)
+
+
+def _may_occur(key: Any, node: Any) -> bool:
+    """False if ``metadata`` shows that ``key`` does not occur in ``node``."""
+    if _is_term(key):
+        return key in metadata(node).terms
+    if _kind(key) == _FORMULA and key.is_atomic():
+        return key in metadata(node).atoms
+    return True
+
+
+def _fresh(variable: Any, taken: Set[str]) -> Any:
+    """A variable of the same type as ``variable`` named ``variable_1``, ``variable_2``... but not in ``taken``."""
+    index = 1
+    while f"{variable}_{index}" in taken:
+        index += 1
+    return type(variable)(f"{variable}_{index}")
+
+
+class Substitution(Transformation):
+    """Replace the keys of ``mapping`` by their values, all at once.
+
+    Keys may be terms, variables given as strings, atoms or any other
+    subformula; values are not looked into, so ``{x: y, y: x}`` swaps.
+    With ``capture_avoiding`` set, the variable a quantifier binds, and
+    any key it occurs free in, is not replaced in its scope, and a quantifier whose variable occurs in a
+    value substituted into its scope binds a fresh variable instead
+    (``x_1``, ``x_2`` and so on). Without it, every occurrence of a key is
+    replaced, bound variables included, which is what instantiating a rule
+    schema needs.
+
+    The context is the index of the mapping in force in ``scopes``. A
+    subformula whose ``metadata`` shows none of its keys is returned as it
+    is without being visited. Nodes are looked up after their children,
+    whose hashes are then cached already, so hashing a deep formula does
+    not recurse.
+    """
+
+    def __init__(self, mapping: Dict[Any, Any], capture_avoiding: bool = True) -> None:
+        self.capture_avoiding = capture_avoiding
+        self.scopes: List[Dict[Any, Any]] = []
+        # Per scope: the term keys, the atom keys and whether any other key can only be found by looking.
+        self._keys: List[Tuple[FrozenSet[Any], FrozenSet[Any], bool]] = []
+        # The variable each quantifier binds and the scope of its body, by (id, scope) of the quantifier.
+        self._binders: Dict[Tuple[int, int], Tuple[Any, int]] = {}
+        self._scope(mapping)
+
+    def __call__(self, formula: Any, context: Hashable = 0) -> Any:
+        return super().__call__(formula, context)
+
+    def _scope(self, mapping: Dict[Any, Any]) -> int:
+        terms, atoms, others = set(), set(), False
+        for key in mapping:
+            if _is_term(key):
+                terms.add(key)
+            elif _kind(key) == _FORMULA and key.is_atomic():
+                atoms.add(key)
+            else:
+                others = True
+        self.scopes.append(mapping)
+        self._keys.append((frozenset(terms), frozenset(atoms), others))
+        return len(self.scopes) - 1
+
+    def _untouched(self, node: Any, scope: int) -> bool:
+        terms, atoms, others = self._keys[scope]
+        if others:
+            return False
+        data = metadata(node)
+        return data.terms.isdisjoint(terms) and data.atoms.isdisjoint(atoms)
+
+    def _enter(self, node: Any, scope: int) -> Tuple[Any, int]:
+        """The variable ``node``, a quantifier, binds after substitution, and the scope of its body."""
+        key = (id(node), scope)
+        binder = self._binders.get(key)
+        if binder is None:
+            variable, body = node.variable, node.predicate
+            # Keys that are, or mention, the bound variable are bound in the body and are left alone.
+            # Variables are compared by name: the string "x" and Term("x") are the same variable.
+            name = str(variable)
+            inner = {key: value for key, value in self.scopes[scope].items()
+                     if not (_is_term(key) and str(key) == name)
+                     and all(str(free) != name for free in metadata(key).free_variables) and _may_occur(key, body)}
+            captured = {str(term) for value in inner.values() for term in metadata(value).terms}
+            if name in captured:
+                taken = captured | {str(term) for term in metadata(body).terms}
+                fresh = _fresh(variable, taken)
+                inner[variable] = fresh
+                variable = fresh
+            binder = self._binders[key] = (variable, self._scope(inner))
+        return binder
+
+    def children(self, node, scope):
+        if _kind(node) not in _NODES or self._untouched(node, scope):
+            return ()
+        if self.capture_avoiding and _kind(node) == _QUANTIFIER:
+            return [(node.predicate, self._enter(node, scope)[1])]
+        return [(child, scope) for child in _fields(node) if _kind(child) in _NODES]
+
+    def combine(self, node, scope, results):
+        if _kind(node) not in _NODES:
+            mapping = self.scopes[scope]
+            return mapping.get(node, node)
+        if not results and self._untouched(node, scope):
+            return node
+        mapping = self.scopes[scope]
+        if node in mapping:
+            return mapping[node]
+        if self.capture_avoiding and _kind(node) == _QUANTIFIER:
+            variable = self._enter(node, scope)[0]
+            [body] = results
+            if variable is node.variable and body is node.predicate:
+                return node
+            return type(node)(variable, body)
+        return _rebuilt(node, results, _NODES, lambda value: mapping.get(value, value))
+
+
+def _chain(node: Any) -> List[Any]:
+    """The operands of the tree of ``node``'s binary connective that ``node`` is the root of."""
+    operands, stack = [], [node]
+    while stack:
+        item = stack.pop()
+        if type(item) is type(node):
+            stack.append(item.right)
+            stack.append(item.left)
+        else:
+            operands.append(item)
+    return operands
+
+
+class ToNary(Transformation):
+    """Replace every ``And`` and ``Or`` tree by one ``Conjunction`` or ``Disjunction``."""
+
+    def children(self, node, context):
+        if _kind(node) == _BINARY:
+            return [(operand, context) for operand in _chain(node)]
+        return super().children(node, context)
+
+    def combine(self, node, context, results):
+        if _kind(node) == _BINARY:
+            nary = (Conjunction if type(node) is And else Disjunction)(*results)
+            return nary.operands[0] if len(nary.operands) == 1 else nary
+        return super().combine(node, context, results)
+
+
+class ToBinary(Transformation):
+    """Replace every ``Conjunction`` and ``Disjunction`` by a balanced ``And`` or ``Or`` tree."""
+
+    def combine(self, node, context, results):
+        if _kind(node) != _NARY:
+            return super().combine(node, context, results)
+        [operands] = _new_values(node, results, _FORMULAS)[0]
+        if not operands:
+            return node._unit
+        while len(operands) > 1:
+            paired = [node._binary(operands[i], operands[i + 1]) for i in range(0, len(operands) - 1, 2)]
+            if len(operands) % 2:
+                paired.append(operands[-1])
+            operands = paired
+        return operands[0]
+
+
+def to_nnf(formula: Any) -> Any:
+    """``formula`` in negation normal form: negation only in front of atoms."""
+    return NegationNormalForm()(formula, False)
+
+
+def simplify(formula: Any) -> Any:
+    """``formula`` with constants folded and double negations removed."""
+    return Simplification()(formula)
+
+
+def substitute(formula: Any, mapping: Dict[Any, Any]) -> Any:
+    """``formula`` with the free occurrences of the keys of ``mapping`` replaced by their values, all at once.
+
+    Bound variables are renamed where a value would otherwise be captured.
+    """
+    return Substitution(mapping)(formula)
+
+
+def replace(formula: Any, mapping: Dict[Any, Any]) -> Any:
+    """``formula`` with every occurrence of a key of ``mapping`` replaced by its value, bound or not."""
+    return Substitution(mapping, capture_avoiding=False)(formula)
+
+
+def to_nary(formula: Any) -> Any:
+    """``formula`` with every ``And`` and ``Or`` replaced by its canonical n-ary form.
+
+    Nested conjunctions (disjunctions) become a single ``Conjunction``
+    (``Disjunction``), so a left-deep chain of any length ends up one level
+    deep.
+    """
+    return ToNary()(formula)
+
+
+def to_binary(formula: Any) -> Any:
+    """``formula`` with every ``Conjunction`` and ``Disjunction`` turned back into ``And`` and ``Or``.
+
+    The binary trees are balanced, so they are only logarithmically deep in
+    the number of operands. An empty ``Conjunction`` becomes True and an
+    empty ``Disjunction`` False.
+    """
+    return ToBinary()(formula)
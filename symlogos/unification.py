@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional
+
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+
+
+def _default_is_variable(term: Term) -> bool:
+    return term.is_variable()
+
+
+class Substitution:
+    """A unifier under construction.
+
+    Bindings are triangular: a variable is bound to a term that may itself
+    contain bound variables, and ``resolve`` applies them all. Variables
+    bound to each other are kept in union-find classes, with path compression
+    and union by rank, so a chain of aliased variables is followed in nearly
+    constant time; only the representative of a class is ever bound to a
+    term. ``is_variable`` tells which ``Term`` objects may be bound, by
+    default those ``Term.is_variable`` accepts.
+    """
+    __slots__ = ("parent", "rank", "bindings", "is_variable")
+
+    def __init__(self, is_variable: Optional[Callable[[Term], bool]] = None) -> None:
+        self.parent: Dict[Term, Term] = {}
+        self.rank: Dict[Term, int] = {}
+        self.bindings: Dict[Term, Any] = {}
+        self.is_variable = is_variable if is_variable is not None else _default_is_variable
+
+    def copy(self) -> "Substitution":
+        substitution = Substitution(self.is_variable)
+        substitution.parent = dict(self.parent)
+        substitution.rank = dict(self.rank)
+        substitution.bindings = dict(self.bindings)
+        return substitution
+
+    def _is_variable(self, term: Any) -> bool:
+        return isinstance(term, Term) and self.is_variable(term)
+
+    def find(self, variable: Term) -> Term:
+        """The representative of the class ``variable`` is in."""
+        root = variable
+        parent = self.parent
+        while root in parent:
+            root = parent[root]
+        while variable is not root and variable in parent:
+            parent[variable], variable = root, parent[variable]
+        return root
+
+    def walk(self, term: Any) -> Any:
+        """``term`` with its outermost bindings applied: an unbound representative or a non-variable."""
+        if not self._is_variable(term):
+            return term
+        root = self.find(term)
+        return self.bindings.get(root, root)
+
+    def resolve(self, term: Any) -> Any:
+        """``term`` with every binding applied."""
+        term = self.walk(term)
+        if isinstance(term, FunctionApplication):
+            return FunctionApplication(term.function_symbol, *(self.resolve(argument) for argument in term.arguments))
+        if isinstance(term, Predicate):
+            return Predicate(term.symbol, *(self.resolve(argument) for argument in term.terms))
+        return term
+
+    def occurs(self, variable: Term, term: Any) -> bool:
+        """Whether the unbound representative ``variable`` occurs in ``term``."""
+        stack = [term]
+        while stack:
+            term = self.walk(stack.pop())
+            if term == variable:
+                return True
+            if isinstance(term, FunctionApplication):
+                stack.extend(term.arguments)
+            elif isinstance(term, Predicate):
+                stack.extend(term.terms)
+        return False
+
+    def unify(self, left: Any, right: Any) -> bool:
+        """Extend the substitution so that it unifies ``left`` and ``right``.
+
+        Returns False if they do not unify; the substitution may then be
+        partly extended, see ``unify`` for a version that leaves it alone.
+        """
+        stack = [(left, right)]
+        while stack:
+            left, right = stack.pop()
+            left, right = self.walk(left), self.walk(right)
+            if left is right or left == right:
+                continue
+            left_variable, right_variable = self._is_variable(left), self._is_variable(right)
+            if left_variable and right_variable:
+                self._union(left, right)
+            elif left_variable or right_variable:
+                variable, term = (left, right) if left_variable else (right, left)
+                if self.occurs(variable, term):
+                    return False
+                self.bindings[variable] = term
+            elif isinstance(left, FunctionApplication) and isinstance(right, FunctionApplication):
+                if left.function_symbol != right.function_symbol or len(left.arguments) != len(right.arguments):
+                    return False
+                stack.extend(zip(left.arguments, right.arguments))
+            elif isinstance(left, Predicate) and isinstance(right, Predicate):
+                if left.symbol != right.symbol or len(left.terms) != len(right.terms):
+                    return False
+                stack.extend(zip(left.terms, right.terms))
+            else:
+                return False
+        return True
+
+    def _union(self, left: Term, right: Term) -> None:
+        left_rank, right_rank = self.rank.get(left, 0), self.rank.get(right, 0)
+        if left_rank < right_rank:
+            left, right = right, left
+        self.parent[right] = left
+        if left_rank == right_rank:
+            self.rank[left] = left_rank + 1
+
+    def as_dict(self) -> Dict[Term, Any]:
+        """Every bound variable mapped to its fully resolved value."""
+        return {variable: self.resolve(variable) for variable in list(self.parent) + list(self.bindings)}
+
+    def __len__(self) -> int:
+        return len(self.parent) + len(self.bindings)
+
+    def __contains__(self, variable: Term) -> bool:
+        return variable in self.parent or variable in self.bindings
+
+    def __repr__(self) -> str:
+        return "Substitution({" + ", ".join(f"{variable}: {value}" for variable, value in self.as_dict().items()) + "})"
+
+
+def unify(left: Any, right: Any, substitution: Optional[Substitution] = None) -> Optional[Substitution]:
+    """A most general unifier of ``left`` and ``right`` extending ``substitution``, or None.
+
+    ``substitution`` itself is not changed.
+    """
+    extended = substitution.copy() if substitution is not None else Substitution()
+    return extended if extended.unify(left, right) else None
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable, Iterable, Optional, Tuple
+
+from symlogos.signed_formula import SignedFormula
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+class WorldCache:
+    """Bounded memo of which world labels are satisfiable.
+
+    A label is the set of signed formulas a new world starts with. Labels
+    recur across branches and across proofs of related goals, and in K, T
+    and D whether a world can be completed depends on nothing else, so the
+    answer can be reused wherever the same label comes up again. Keys are
+    frozensets of ``(sign, formula)`` pairs, which makes them independent of
+    the order the formulas arrived in. When the cache is full the least
+    recently used label is dropped.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("WorldCache needs room for at least one entry")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, bool]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(logic: str, label: Iterable[SignedFormula]) -> Tuple[str, frozenset]:
+        return logic, frozenset((signed_formula.sign, signed_formula.formula) for signed_formula in label)
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        """True or False if the label is known to be satisfiable or not, None if unknown."""
+        satisfiable = self._entries.get(key)
+        if satisfiable is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return satisfiable
+
+    def put(self, key: Hashable, satisfiable: bool) -> None:
+        self._entries[key] = satisfiable
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return f"WorldCache({len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,77 @@
+import io
+import itertools
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from symlogos.batch_eval import BatchEvaluator, all_assignments, read_assignments
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+from tests.test_bdd import ATOMS, evaluate, random_formula, truth_table
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_agrees_with_truth_tables(seed):
+    formula = random_formula(random.Random(seed), 5)
+    evaluator = BatchEvaluator(formula, ATOMS)
+    rows = np.array(list(itertools.product([False, True], repeat=len(ATOMS))))
+
+    assert evaluator.evaluate(rows).tolist() == truth_table(formula)
+    streamed = np.concatenate([results for _, results in evaluator.evaluate_all(chunk_size=7)])
+    assert streamed.tolist() == truth_table(formula)
+    assert evaluator.count_models(chunk_size=10) == sum(truth_table(formula))
+
+
+def test_shared_subformulas_are_computed_once():
+    shared = Or(p, q)
+    formula = shared
+    for _ in range(50):
+        formula = And(formula, formula)
+    evaluator = BatchEvaluator(formula)
+    assert evaluator.num_operations == 51
+    assert evaluator.evaluate([[True, False], [False, False]]).tolist() == [True, False]
+
+
+def test_decision_queries():
+    assert BatchEvaluator(Implication(And(p, Implication(p, q)), q)).is_tautology()
+    assert BatchEvaluator(And(p, Not(q))).is_satisfiable()
+    assert not BatchEvaluator(And(p, Not(p))).is_satisfiable()
+    evaluator = BatchEvaluator(Implication(q, p), atoms=[p, q])
+    assert evaluator.counterexample() == {p: False, q: True}
+    assert BatchEvaluator(Or(p, Not(p))).counterexample() is None
+    assert BatchEvaluator(And(True, Or(False, p))).count_models() == 1
+
+
+def test_all_assignments_chunks():
+    chunks = list(all_assignments(3, chunk_size=3))
+    assert [start for start, _ in chunks] == [0, 3, 6]
+    rows = np.concatenate([chunk for _, chunk in chunks])
+    assert rows.tolist() == [list(row) for row in itertools.product([False, True], repeat=3)]
+
+
+def test_read_assignments_from_text_and_npy(tmp_path):
+    evaluator = BatchEvaluator(Implication(And(p, q), r), atoms=[p, q, r])
+    text = io.StringIO("# p q r\n110\n\n1 1 1\n0,1,0\n")
+    chunks = list(read_assignments(text, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    results = np.concatenate(list(evaluator.evaluate_chunks(chunks)))
+    assert results.tolist() == [False, True, True]
+
+    rows = np.array(list(itertools.product([False, True], repeat=3)))
+    np.save(tmp_path / "rows.npy", rows)
+    results = np.concatenate(list(evaluator.evaluate_chunks(read_assignments(tmp_path / "rows.npy", chunk_size=3))))
+    assert results.tolist() == [evaluate(evaluator.formula, dict(zip([p, q, r], row))) for row in rows.tolist()]
+
+
+def test_invalid_input():
+    with pytest.raises(TypeError):
+        BatchEvaluator(Necessity(p))
+    with pytest.raises(ValueError):
+        BatchEvaluator(And(p, q), atoms=[p])
+    with pytest.raises(ValueError):
+        BatchEvaluator(And(p, q)).evaluate([[True, False, True]])
@@ -0,0 +1,174 @@
+import itertools
+import random
+
+import pytest
+from symlogos.bdd import BDD, ComputedTable, count_models, equivalent, is_satisfiable, is_tautology, variable_order
+from symlogos.classical_propositional_logic import ClassicalPropositionalLogic
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+ATOMS = [Proposition(f"x{i}") for i in range(6)]
+
+
+def evaluate(formula, valuation):
+    if isinstance(formula, Proposition):
+        return valuation[formula]
+    if isinstance(formula, Not):
+        return not evaluate(formula.expr, valuation)
+    left, right = (evaluate(arg, valuation) for arg in formula.args)
+    if isinstance(formula, And):
+        return left and right
+    if isinstance(formula, Or):
+        return left or right
+    return not left or right
+
+
+def random_formula(rng, depth):
+    if depth == 0:
+        return rng.choice(ATOMS)
+    connective = rng.choice([And, Or, Implication, Not])
+    if connective is Not:
+        return Not(random_formula(rng, depth - 1))
+    return connective(random_formula(rng, depth - 1), random_formula(rng, depth - 1))
+
+
+def truth_table(formula):
+    return [evaluate(formula, dict(zip(ATOMS, values))) for values in itertools.product([False, True], repeat=len(ATOMS))]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_agrees_with_truth_tables(seed):
+    rng = random.Random(seed)
+    first, second = random_formula(rng, 5), random_formula(rng, 4)
+    bdd = BDD(ATOMS)
+    f, g = bdd.from_formula(first), bdd.from_formula(second)
+
+    assert f.count() == sum(truth_table(first))
+    assert (f == g) == (truth_table(first) == truth_table(second))
+    model = f.satisfy()
+    if model is None:
+        assert f.is_false
+    else:
+        valuation = dict.fromkeys(ATOMS, False)
+        valuation.update(model)
+        assert evaluate(first, valuation)
+
+    bdd.reorder()
+    assert f.count() == sum(truth_table(first))
+    assert bdd.from_formula(first) == f
+
+
+@pytest.mark.parametrize("rule", [
+    ClassicalPropositionalLogic.commutativity_and(),
+    ClassicalPropositionalLogic.commutativity_or(),
+    ClassicalPropositionalLogic.associativity_and(),
+    ClassicalPropositionalLogic.associativity_or(),
+    ClassicalPropositionalLogic.idempotency_and(),
+    ClassicalPropositionalLogic.idempotency_or(),
+    ClassicalPropositionalLogic.double_negation_elimination(),
+    ClassicalPropositionalLogic.distribution_and_over_or(),
+    ClassicalPropositionalLogic.distribution_or_over_and(),
+    ClassicalPropositionalLogic.absorption_and(),
+    ClassicalPropositionalLogic.absorption_or(),
+    ClassicalPropositionalLogic.negation_and_to_or(),
+    ClassicalPropositionalLogic.negation_or_to_and(),
+    ClassicalPropositionalLogic.implication_to_or(),
+], ids=lambda rule: rule.name)
+def test_rewrite_rules_preserve_meaning(rule):
+    assert equivalent(rule.premises[0], rule.conclusion)
+
+
+def test_tautology_satisfiability_and_counting():
+    assert is_tautology(Implication(And(p, Implication(p, q)), q))
+    assert not is_tautology(Implication(q, p))
+    assert is_satisfiable(And(p, Not(q)))
+    assert not is_satisfiable(And(p, Not(p)))
+    assert count_models(Or(p, q)) == 3
+    assert count_models(Or(p, q), variables=[r]) == 6
+    assert count_models(And(True, Or(False, p))) == 1
+
+
+def test_complement_edges_make_negation_free():
+    bdd = BDD()
+    f = bdd.from_formula(Or(And(p, q), r))
+    nodes = len(bdd)
+    assert (~f).edge == f.edge ^ 1
+    assert bdd.from_formula(Not(Or(And(p, q), r))) == ~f
+    assert len(bdd) == nodes
+    assert f | ~f == bdd.true
+    assert f & ~f == bdd.false
+
+
+def test_function_operators():
+    bdd = BDD()
+    P, Q = bdd.var(p), bdd.var(q)
+    assert (P & Q) == bdd.from_formula(And(q, p))
+    assert P.implies(Q) == bdd.from_formula(Or(Not(p), q))
+    assert P.ite(Q, ~Q) == bdd.from_formula(And(Implication(p, q), Implication(q, p)))
+    with pytest.raises(ValueError):
+        P & BDD().var(p)
+
+
+def test_sifting_recovers_a_good_order():
+    n = 8
+    xs = [Proposition(f"a{i}") for i in range(n)]
+    ys = [Proposition(f"b{i}") for i in range(n)]
+    formula = And(xs[0], ys[0])
+    for i in range(1, n):
+        formula = Or(formula, And(xs[i], ys[i]))
+
+    bdd = BDD(xs + ys)
+    f = bdd.from_formula(formula)
+    bdd.collect()
+    assert len(bdd) == 2 ** (n + 1) - 2
+    models = f.count()
+
+    bdd.reorder()
+    assert len(bdd) <= 3 * n
+    assert f.count() == models
+    assert bdd.from_formula(formula) == f
+
+
+def test_automatic_reordering():
+    n = 8
+    xs = [Proposition(f"a{i}") for i in range(n)]
+    ys = [Proposition(f"b{i}") for i in range(n)]
+    formula = And(xs[0], ys[0])
+    for i in range(1, n):
+        formula = Or(formula, And(xs[i], ys[i]))
+    bdd = BDD(xs + ys, auto_reorder=True, reorder_threshold=100)
+    bdd.from_formula(formula)
+    assert bdd.reorderings == 1
+    assert len(bdd) <= 3 * n
+
+
+def test_collect_frees_unreferenced_nodes():
+    bdd = BDD()
+    kept = bdd.from_formula(And(p, q))
+    dropped = bdd.from_formula(Or(Not(p), r))
+    del dropped
+    assert bdd.collect() > 0
+    assert kept == bdd.from_formula(And(q, p))
+
+
+def test_variable_order_heuristics():
+    formula = And(Or(p, q), Or(r, Implication(r, q)))
+    assert variable_order([formula]) == [p, q, r]
+    assert variable_order([formula], "frequency") == [q, r, p]
+    with pytest.raises(ValueError):
+        variable_order([formula], "random")
+
+
+def test_computed_table_evicts_on_collision():
+    table = ComputedTable(4)
+    for i in range(100):
+        table.put((i, i), i)
+    assert sum(table.get((i, i)) is not None for i in range(100)) <= 4
+    assert table.hits + table.misses == 100
+
+
+def test_non_propositional_input_is_rejected():
+    with pytest.raises(TypeError):
+        BDD().from_formula(Necessity(p))
@@ -0,0 +1,73 @@
+import pytest
+from symlogos.connectives import Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proof_result import ProofResult
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import WorklistTableau
+from symlogos.tableau_node import TableauNode
+from symlogos.tableau_prover import TableauProver
+
+p, q = Proposition("p"), Proposition("q")
+x = Term("x")
+
+
+def test_s4_cycles_are_blocked():
+    engine = WorklistTableau("S4")
+    premises = [Necessity(Possibility(p)), Necessity(Possibility(Not(p)))]
+    assert engine.prove(premises, q) is ProofResult.REFUTED
+    assert engine.blocked > 0
+    assert engine.worlds_created <= 3
+    assert not engine.truncated
+
+
+@pytest.mark.parametrize("conclusion", [
+    Implication(Necessity(Possibility(Necessity(Possibility(p)))), Necessity(Possibility(p))),
+    Implication(Necessity(Possibility(p)), Necessity(Possibility(Necessity(Possibility(p))))),
+    Implication(Possibility(Possibility(p)), Possibility(p)),
+])
+def test_s4_theorems_with_nested_modalities(conclusion):
+    engine = WorklistTableau("S4")
+    assert engine.prove([], conclusion) is ProofResult.PROVED
+
+
+def test_s4_non_theorem_terminates():
+    # □◇p → ◇□p holds in S4.2 but not in S4.
+    engine = WorklistTableau("S4")
+    assert engine.prove([], Implication(Necessity(Possibility(p)), Possibility(Necessity(p)))) is ProofResult.REFUTED
+    assert not engine.truncated
+
+
+def test_world_bound_is_unknown_not_refuted():
+    formula = Possibility(Possibility(Possibility(Possibility(p))))
+    assert WorklistTableau("K", max_worlds=3).prove([formula], q) is ProofResult.UNKNOWN
+    assert WorklistTableau("K").prove([formula], q) is ProofResult.REFUTED
+
+
+def test_open_branch_after_a_single_instance_is_unknown():
+    engine = WorklistTableau()
+    assert engine.prove([Forall(x, Predicate("P", x))], q) is ProofResult.UNKNOWN
+    assert engine.prove([Exists(x, Predicate("P", x))], q) is ProofResult.REFUTED
+    # A conclusive open branch wins over an inconclusive one.
+    assert engine.prove([Implication(Not(q), Forall(x, Predicate("P", x)))], p) is ProofResult.REFUTED
+    assert engine.run([SignedFormula("T", Forall(x, Predicate("P", x))), SignedFormula("F", q)]) is False
+    assert engine.unknown
+
+
+def test_prover_reports_three_valued_results():
+    assert TableauProver().prove([p, Implication(p, q)], q) is ProofResult.PROVED
+    assert TableauProver().prove([], q) is ProofResult.REFUTED
+    assert TableauProver(logic="S4").prove([], Implication(Necessity(p), Necessity(Necessity(p)))) is ProofResult.PROVED
+    assert str(ProofResult.UNKNOWN) == "unknown"
+
+
+def test_recursive_depth_limit_is_unknown():
+    prover = TableauProver(engine="recursive")
+    formula = Not(Not(Not(Not(p))))
+    prover.tableau_expansion(TableauNode(SignedFormula("T", formula)), max_depth=2)
+    assert prover.depth_limit_reached
+    assert prover.prove([], formula) is not ProofResult.UNKNOWN
+    assert not prover.depth_limit_reached
@@ -0,0 +1,70 @@
+import random
+
+from symlogos.clause_simplifier import ClauseSimplifier
+from symlogos.connectives import And, Implication, Or
+from symlogos.proposition import Proposition
+from symlogos.tableau_prover import TableauProver
+from tests.test_sat_solver import brute_force, pigeonhole
+
+
+def simplify(clauses):
+    simplifier = ClauseSimplifier(clauses)
+    return simplifier, simplifier.simplify()
+
+
+def test_unit_propagation():
+    simplifier, clauses = simplify([[1], [-1, 2], [-2, 3, 4], [-4, 5, -3]])
+    assert {1, 2} <= simplifier.assignment
+    assert all(1 not in map(abs, clause) and 2 not in map(abs, clause) for clause in clauses)
+    simplifier, clauses = simplify([[1], [-1, 2], [-2]])
+    assert simplifier.unsatisfiable and clauses == [[]]
+
+
+def test_pure_literals():
+    simplifier, clauses = simplify([[1, 2], [1, -3], [2, 3], [-2, 3]])
+    assert clauses == []
+    assert 1 in simplifier.assignment
+
+
+def test_equivalent_literals():
+    # 1 <-> 2 through two binary clauses, and 2 <-> -3.
+    simplifier, _ = simplify([[-1, 2], [1, -2], [2, 3], [-2, -3], [1, 3, 4], [-1, -4, 5], [-5, 4]])
+    assert simplifier.equivalences[2] == 1 and simplifier.equivalences[3] == -1
+    simplifier, clauses = simplify([[-1, 2], [-2, -1], [1, 2], [-2, 1]])
+    assert simplifier.unsatisfiable
+
+
+def test_subsumption():
+    simplifier = ClauseSimplifier([[1, 2], [1, 2, 3], [-1, -2], [-1, -2, 3], [-3, 1, -2]])
+    assert simplifier._subsume()
+    assert sorted(map(sorted, simplifier.clauses)) == [[-3, -2, 1], [-2, -1], [1, 2]]
+    assert simplifier.subsumed == 2
+
+
+def test_satisfiability_is_preserved():
+    rng = random.Random(7)
+    for _ in range(500):
+        num_vars = rng.randint(1, 7)
+        clauses = [[rng.choice((-1, 1)) * rng.randint(1, num_vars) for _ in range(rng.randint(1, 3))]
+                   for _ in range(rng.randint(0, 20))]
+        _, simplified = simplify(clauses)
+        assert brute_force(simplified, num_vars) == brute_force(clauses, num_vars)
+
+
+def test_hard_instances_are_left_alone():
+    clauses = pigeonhole(3)
+    simplifier, simplified = simplify(clauses)
+    assert not simplifier.unsatisfiable
+    assert len(simplified) == len(clauses)
+
+
+def test_prover_reports_the_reduction():
+    p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+    premises = [p, Implication(p, q), Implication(p, q), And(Or(q, r), Or(q, r)), Or(r, Proposition("s"))]
+    prover = TableauProver()
+    assert prover.is_sound(premises, q)
+    assert prover.simplifier.unsatisfiable
+    assert not prover.is_sound(premises, r)
+    assert prover.simplifier.literals_after < prover.simplifier.literals_before
+    assert prover.simplifier.reduction > 1
+    assert TableauProver(simplify=False).is_sound(premises, q) and TableauProver(simplify=False).simplifier is None
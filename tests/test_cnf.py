@@ -0,0 +1,121 @@
+import io
+import itertools
+
+import pytest
+from symlogos.cnf import BOTH, NEGATIVE, POSITIVE, TseitinEncoder, iter_dimacs, read_dimacs, write_dimacs
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.hash_consing import hash_consing
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+from symlogos.sat_solver import SATSolver
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+
+FORMULAS = [
+    And(p, Not(p)),
+    Or(And(p, q), Not(Or(q, r))),
+    Not(Implication(Implication(p, q), Implication(Not(q), Not(p)))),
+    Implication(Or(p, Not(And(q, r))), And(Not(p), r)),
+    Not(Not(And(Implication(p, q), Implication(q, r)))),
+    And(True, Or(False, p)),
+]
+
+
+def evaluate(formula, valuation):
+    if isinstance(formula, bool):
+        return formula
+    if isinstance(formula, Proposition):
+        return valuation[formula]
+    if isinstance(formula, Not):
+        return not evaluate(formula.expr, valuation)
+    left, right = (evaluate(arg, valuation) for arg in formula.args)
+    if isinstance(formula, And):
+        return left and right
+    if isinstance(formula, Or):
+        return left or right
+    return not left or right
+
+
+def satisfiable(formula):
+    return any(evaluate(formula, dict(zip((p, q, r), values))) for values in itertools.product([False, True], repeat=3))
+
+
+@pytest.mark.parametrize("polarity_aware", [True, False])
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_encoding_is_equisatisfiable(formula, polarity_aware):
+    encoder = TseitinEncoder(polarity_aware)
+    encoder.add(formula)
+    solver = SATSolver(encoder.clauses)
+    assert solver.solve() == satisfiable(formula)
+    if satisfiable(formula):
+        valuation = {atom: False for atom in (p, q, r)}
+        valuation.update(encoder.decode(solver.model()))
+        assert evaluate(formula, valuation)
+
+
+def test_shared_subformulas_get_one_variable():
+    encoder = TseitinEncoder()
+    assert encoder.literal(Not(And(p, q))) == -encoder.literal(And(p, q))
+    assert encoder.formulas[encoder.variables[And(p, q)]] == And(p, q)
+    assert encoder.num_vars == 3
+
+
+def test_polarity_keeps_only_needed_clauses():
+    full = TseitinEncoder(polarity_aware=False)
+    positive = TseitinEncoder()
+    full.literal(Or(And(p, q), r))
+    positive.literal(Or(And(p, q), r), POSITIVE)
+    assert len(full.clauses) == 6
+    assert len(positive.clauses) == 3
+
+    negative = TseitinEncoder()
+    negative.literal(Or(And(p, q), r), NEGATIVE)
+    negative.literal(Or(And(p, q), r), BOTH)
+    assert sorted(map(sorted, negative.clauses)) == sorted(map(sorted, full.clauses))
+
+
+def test_implication_chain_costs_one_clause_per_link():
+    atoms = [Proposition(f"p{i}") for i in range(50000)]
+    encoder = TseitinEncoder()
+    encoder.add_all(Implication(atoms[i], atoms[i + 1]) for i in range(len(atoms) - 1))
+    assert len(encoder.clauses) == len(atoms) - 1
+    assert encoder.num_vars == len(atoms)
+
+
+def test_deep_formula_does_not_recurse():
+    # Interning hashes every node as it is built, so hashing the root does
+    # not recurse either.
+    with hash_consing():
+        formula = p
+        for i in range(20000):
+            formula = And(Proposition(f"p{i}"), Not(formula))
+    encoder = TseitinEncoder()
+    encoder.literal(formula)
+    assert encoder.num_vars == 40001
+
+
+def test_non_propositional_input_is_rejected():
+    with pytest.raises(TypeError):
+        TseitinEncoder().add(Implication(Necessity(p), q))
+
+
+def test_dimacs_round_trip(tmp_path):
+    encoder = TseitinEncoder()
+    encoder.add(Or(And(p, q), Not(r)))
+    path = tmp_path / "problem.cnf"
+    encoder.to_dimacs(path)
+
+    text = path.read_text()
+    assert "c 2 p\nc 3 q\nc 4 r\n" in text
+    assert f"p cnf {encoder.num_vars} {len(encoder.clauses)}" in text
+    assert read_dimacs(path) == (encoder.num_vars, encoder.clauses)
+    assert list(iter_dimacs(str(path))) == encoder.clauses
+
+
+def test_read_dimacs_from_stream():
+    stream = io.StringIO("c comment\np cnf 5 2\n1 -2\n 3 0 -1\n0\n%\n0\n")
+    assert read_dimacs(stream) == (5, [[1, -2, 3], [-1]])
+
+    out = io.StringIO()
+    write_dimacs(out, [[1, -2], [3]])
+    assert out.getvalue() == "p cnf 3 2\n1 -2 0\n3 0\n"
@@ -0,0 +1,81 @@
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.free_variable_tableau import FreeVariableTableau
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.modal_operators import Necessity
+from symlogos.proof_result import ProofResult
+from symlogos.quantifiers import Exists, Forall
+from symlogos.tableau_prover import TableauProver
+
+x, y = Term("x"), Term("y")
+a, b = Term("a"), Term("b")
+
+
+def P(term):
+    return Predicate("P", term)
+
+
+def Q(term):
+    return Predicate("Q", term)
+
+
+def R(left, right):
+    return Predicate("R", left, right)
+
+
+def f(term):
+    return FunctionApplication("f", term)
+
+
+THEOREMS = [
+    ([Forall(x, P(x))], P(a)),
+    ([Forall(x, Implication(P(x), Q(x))), P(a)], Q(a)),
+    ([Forall(x, P(x))], And(P(a), P(b))),
+    ([Exists(x, Forall(y, R(x, y)))], Forall(y, Exists(x, R(x, y)))),
+    ([Forall(x, Implication(P(x), P(f(x)))), P(a)], P(f(f(a)))),
+    ([], Exists(x, Implication(P(x), Forall(y, P(y))))),
+    ([Forall(x, Or(P(x), Q(x)))], Or(Forall(x, P(x)), Exists(x, Q(x)))),
+]
+
+
+@pytest.mark.parametrize("premises, conclusion", THEOREMS, ids=str)
+def test_theorems_close_by_unification(premises, conclusion):
+    tableau = FreeVariableTableau()
+    assert tableau.prove(premises, conclusion) is ProofResult.PROVED
+    assert tableau.substitution is not None
+
+
+def test_closing_substitution():
+    tableau = FreeVariableTableau()
+    assert tableau.is_closed([Forall(x, Implication(P(x), Q(x))), P(a)], Q(a))
+    assert set(tableau.substitution.as_dict().values()) == {a}
+
+
+def test_the_old_tableau_needs_luck():
+    # A fresh "v_0" never matches "a", so the worklist tableau cannot close this.
+    premises, conclusion = [Forall(x, P(x))], P(a)
+    assert TableauProver(engine="worklist").prove(premises, conclusion) is ProofResult.UNKNOWN
+    assert TableauProver(engine="free_variable").prove(premises, conclusion) is ProofResult.PROVED
+    assert not TableauProver(engine="free_variable").is_satisfiable([Forall(x, P(x)), Not(P(b))])
+
+
+def test_non_theorems():
+    assert FreeVariableTableau().prove([P(a)], Q(a)) is ProofResult.REFUTED
+    assert FreeVariableTableau().prove([Exists(x, P(x))], P(a)) is ProofResult.REFUTED
+    # Needs infinitely many instances; never reported as refuted.
+    tableau = FreeVariableTableau(max_instances=3)
+    assert tableau.prove([Forall(y, Exists(x, R(x, y)))], Exists(x, Forall(y, R(x, y)))) is ProofResult.UNKNOWN
+    assert tableau.instances == 3
+
+
+def test_skolem_terms_depend_on_rigid_variables():
+    # ∀x ∃y R(x, y) does not give one y for every x.
+    tableau = FreeVariableTableau(max_instances=2)
+    assert tableau.prove([Forall(x, Exists(y, R(x, y)))], Exists(y, Forall(x, R(x, y)))) is not ProofResult.PROVED
+    assert FreeVariableTableau().prove([Forall(x, Exists(y, R(x, y)))], Exists(y, R(a, y))) is ProofResult.PROVED
+
+
+def test_modal_input_is_rejected():
+    with pytest.raises(ValueError):
+        FreeVariableTableau().prove([Necessity(P(a))], P(a))
@@ -0,0 +1,82 @@
+import gc
+
+from symlogos import hash_consing
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Forall, Exists
+
+
+def build(p, q):
+    x = Term("x")
+    return And(Implication(Necessity(p), Possibility(Not(q))),
+               Or(Forall(x, Predicate("P", x)), Exists(x, Predicate("Q", [x]))))
+
+
+def test_hash_consing_is_off_by_default():
+    assert not hash_consing.is_enabled()
+    p = Proposition("p")
+    assert And(p, p) is not And(p, p)
+    assert And(p, p) == And(p, p)
+
+
+def test_structurally_equal_formulas_are_the_same_object():
+    with hash_consing.hash_consing() as table:
+        first = build(Proposition("p"), Proposition("q"))
+        second = build(Proposition("p"), Proposition("q"))
+        different = build(Proposition("p"), Proposition("r"))
+
+        assert first is second
+        assert first == second
+        assert first != different
+        assert first.left.antecedent.expr is different.left.antecedent.expr
+        assert table.hits > 0
+
+    assert not hash_consing.is_enabled()
+
+
+def test_interned_formulas_compare_with_plain_formulas():
+    p = Proposition("p")
+    plain = And(p, Not(p))
+    with hash_consing.hash_consing():
+        interned = And(Proposition("p"), Not(Proposition("p")))
+    assert plain == interned
+    assert interned == plain
+    assert hash(plain) == hash(interned)
+
+
+def test_separate_tables_do_not_confuse_equality():
+    with hash_consing.hash_consing():
+        first = Or(Proposition("p"), Proposition("q"))
+    with hash_consing.hash_consing():
+        second = Or(Proposition("p"), Proposition("q"))
+    assert first is not second
+    assert first == second
+
+
+def test_nodes_from_before_clear_still_compare_equal():
+    with hash_consing.hash_consing() as table:
+        first = And(Proposition("p"), Proposition("q"))
+        table.clear()
+        second = And(Proposition("p"), Proposition("q"))
+    assert first is not second
+    assert first == second and hash(first) == hash(second)
+
+
+def test_repeated_subformulas_are_stored_once():
+    with hash_consing.hash_consing() as table:
+        atoms = [Proposition(f"p{i % 10}") for i in range(1000)]
+        conjunctions = [And(atoms[i], atoms[i + 1]) for i in range(len(atoms) - 1)]
+        assert len(set(map(id, conjunctions))) == 10
+        assert len(table) == 20
+
+
+def test_unused_nodes_are_released():
+    with hash_consing.hash_consing() as table:
+        formula = And(Proposition("a"), Proposition("b"))
+        assert len(table) == 3
+        del formula
+        gc.collect()
+        assert len(table) == 0
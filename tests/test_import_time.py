@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+from benchmarks.bench_import import MODULES, measure
+
+
+def test_prover_import_does_not_load_sympy():
+    _, sympy_loaded = measure(MODULES)
+    assert not sympy_loaded
+
+
+def test_bridge_loads_sympy_on_first_use():
+    code = ("import sys\n"
+            "from symlogos.proposition import Proposition\n"
+            "from symlogos.sympy_bridge import to_sympy\n"
+            "assert 'sympy' not in sys.modules\n"
+            "to_sympy(Proposition('p'))\n"
+            "assert 'sympy' in sys.modules\n")
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.kripke import Frame, Model, random_model
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Forall
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+
+p, q = Proposition("p"), Proposition("q")
+
+
+def holds(model, formula, world):
+    """Reference semantics, one world at a time."""
+    if isinstance(formula, bool):
+        return formula
+    if isinstance(formula, Proposition):
+        vector = model.valuation.get(formula)
+        return vector is not None and bool(vector[world])
+    if isinstance(formula, Not):
+        return not holds(model, formula.expr, world)
+    if isinstance(formula, Necessity):
+        return all(holds(model, formula.expr, v) for v in model.frame.successors(world))
+    if isinstance(formula, Possibility):
+        return any(holds(model, formula.expr, v) for v in model.frame.successors(world))
+    left, right = (holds(model, arg, world) for arg in formula.args)
+    if isinstance(formula, And):
+        return left and right
+    if isinstance(formula, Or):
+        return left or right
+    return not left or right
+
+
+def random_modal_formula(rng, depth):
+    if depth == 0:
+        return rng.choice([p, q])
+    connective = rng.choice([And, Or, Implication, Not, Necessity, Possibility])
+    if connective in (Not, Necessity, Possibility):
+        return connective(random_modal_formula(rng, depth - 1))
+    return connective(random_modal_formula(rng, depth - 1), random_modal_formula(rng, depth - 1))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_agrees_with_per_world_semantics(seed):
+    model = random_model(30, 60, [p, q], seed=seed)
+    formula = random_modal_formula(random.Random(seed), 5)
+    assert model.evaluate(formula).tolist() == [holds(model, formula, w) for w in range(30)]
+
+
+def test_small_model():
+    # 0 -> 1, 0 -> 2, 1 -> 1; world 2 is a dead end.
+    frame = Frame(3, [(0, 1), (0, 2), (1, 1), (0, 1)])
+    model = Model(frame, {"p": {1, 2}, q: [False, True, False]})
+    assert frame.num_edges == 3
+    assert model.worlds(Necessity(p)).tolist() == [0, 1, 2]
+    assert model.worlds(Possibility(q)).tolist() == [0, 1]
+    assert model.worlds(Necessity(q)).tolist() == [1, 2]
+    assert model.worlds(Possibility(True)).tolist() == [0, 1]
+    assert model.holds(Necessity(False), 2)
+    assert not model.is_valid(Implication(Necessity(p), p))
+
+
+def test_k_axiom_holds_in_every_model():
+    model = random_model(1000, 5000, [p, q], seed=1)
+    assert model.is_valid(Implication(Necessity(Implication(p, q)), Implication(Necessity(p), Necessity(q))))
+    assert model.is_valid(Implication(Possibility(p), Not(Necessity(Not(p)))))
+
+
+def test_frame_properties():
+    chain = Frame(3, [(0, 1), (1, 2)])
+    assert not chain.is_reflexive() and not chain.is_serial() and not chain.is_transitive()
+    closure = Frame.from_matrix(np.array([[1, 1, 1], [0, 1, 1], [0, 0, 1]]))
+    assert closure.is_reflexive() and closure.is_transitive() and not closure.is_symmetric()
+    equivalence = Frame(4, [(u, v) for u in range(2) for v in range(2)] + [(2, 2), (3, 3), (2, 3), (3, 2)])
+    assert equivalence.is_reflexive() and equivalence.is_symmetric() and equivalence.is_transitive()
+    assert equivalence.successors(2).tolist() == [2, 3]
+
+
+def test_large_model():
+    model = random_model(10 ** 5, 10 ** 6, [p, q], seed=0)
+    formula = Or(Possibility(Necessity(And(p, Not(q)))), Necessity(Possibility(Or(q, Necessity(p)))))
+    assert model.evaluate(formula).shape == (10 ** 5,)
+    assert model.is_valid(Implication(Necessity(And(p, q)), Necessity(p)))
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        Frame(2, [(0, 2)])
+    with pytest.raises(ValueError):
+        Model(Frame(2), {p: [True]})
+    x = Term("x")
+    with pytest.raises(TypeError):
+        Model(Frame(1)).evaluate(Forall(x, Predicate("P", x)))
@@ -0,0 +1,90 @@
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.modal_rules import ModalBoxTRule, ModalDiamondTRule
+from symlogos.proposition import Proposition
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_branch import Branch
+from symlogos.tableau_engine import LOGICS, WorklistTableau
+from symlogos.tableau_prover import TableauProver
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+
+# Each schema together with the logics in which it is valid.
+SCHEMAS = [
+    (Implication(Necessity(Implication(p, q)), Implication(Necessity(p), Necessity(q))), {"K", "T", "D", "S4", "S5"}),
+    (Implication(Possibility(p), Not(Necessity(Not(p)))), {"K", "T", "D", "S4", "S5"}),
+    (Implication(And(Possibility(p), Necessity(q)), Possibility(And(p, q))), {"K", "T", "D", "S4", "S5"}),
+    (Implication(Necessity(p), p), {"T", "S4", "S5"}),
+    (Implication(Necessity(p), Possibility(p)), {"T", "D", "S4", "S5"}),
+    (Implication(Necessity(p), Necessity(Necessity(p))), {"S4", "S5"}),
+    (Implication(p, Necessity(Possibility(p))), {"S5"}),
+    (Implication(Possibility(p), Necessity(Possibility(p))), {"S5"}),
+    (Implication(Possibility(Necessity(p)), Necessity(p)), {"S5"}),
+    (Implication(Possibility(p), Necessity(p)), set()),
+]
+
+
+@pytest.mark.parametrize("logic", LOGICS)
+@pytest.mark.parametrize("schema, valid_in", SCHEMAS, ids=str)
+def test_schemas(logic, schema, valid_in):
+    engine = WorklistTableau(logic)
+    assert engine.is_closed([], schema) == (logic in valid_in)
+    assert not engine.truncated
+
+
+def test_boxes_only_reach_accessible_worlds():
+    # The old rules stripped the operators, which closed this satisfiable set.
+    prover = TableauProver(logic="K")
+    assert prover.is_satisfiable([Possibility(p), Possibility(Not(p))])
+    assert not prover.is_satisfiable([Possibility(p), Necessity(Not(p))])
+    assert prover.is_satisfiable([Necessity(p), Necessity(Not(p))])
+    assert not TableauProver(logic="D").is_satisfiable([Necessity(p), Necessity(Not(p))])
+
+
+def test_existing_witness_is_reused():
+    engine = WorklistTableau("S5")
+    assert not engine.run([SignedFormula("T", And(Possibility(And(p, q)), Possibility(p)))])
+    assert engine.worlds_created == 1
+
+
+def test_s5_never_duplicates_witnesses():
+    roots = [SignedFormula("T", formula) for formula in (Necessity(Possibility(p)), Possibility(q), Possibility(r))]
+    k, s5 = WorklistTableau("K"), WorklistTableau("S5")
+    assert not k.run(roots)
+    assert not s5.run(roots)
+    # K decides the world for ◇p below the q-world and the r-world once.
+    assert k.worlds_created == 3
+    assert k.cache.hits == 1
+    assert s5.worlds_created == 3
+
+
+def test_world_bound():
+    engine = WorklistTableau("K", max_worlds=3)
+    assert not engine.run([SignedFormula("T", Possibility(Possibility(Possibility(Possibility(p)))))])
+    assert engine.truncated
+
+
+def test_prover_routes_modal_input_to_the_chosen_logic():
+    conclusion = Implication(Necessity(p), p)
+    assert not TableauProver(logic="K").is_sound([], conclusion)
+    assert TableauProver(logic="T").is_sound([], conclusion)
+    assert TableauProver(logic="S4").is_sound([Necessity(p)], Necessity(Or(p, q)))
+    assert TableauProver(logic="K").is_sound([Or(p, q), Not(p)], q)
+    with pytest.raises(ValueError):
+        TableauProver(logic="GL")
+    with pytest.raises(ValueError):
+        WorklistTableau("S3")
+
+
+def test_signed_formulas_are_labelled():
+    assert SignedFormula("T", p, 2) != SignedFormula("T", p)
+    assert SignedFormula("T", p).at(2) == SignedFormula("T", p, 2)
+    assert str(SignedFormula("F", p, 3)) == "3: F p"
+
+    branch = Branch().extend(SignedFormula("T", p, 1))
+    assert not branch.extend(SignedFormula("F", p)).closed
+    assert branch.extend(SignedFormula("F", p, 1)).closed
+
+    assert ModalBoxTRule(SignedFormula("T", Necessity(p), 1)).apply(2) == [SignedFormula("T", p, 2)]
+    assert ModalDiamondTRule(SignedFormula("T", Possibility(p), 1)).apply() == [SignedFormula("T", p, 1)]
@@ -0,0 +1,93 @@
+import sys
+
+from symlogos.connectives import And, Implication, Not, Or
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import HigherOrderFunction, Predicate
+from symlogos.matching import Matcher, match
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.rules import Rule
+
+x, y = Term("x"), Term("y")
+a, b = Term("A"), Term("B")
+
+
+def test_match_binds_variables():
+    assert match(Predicate("P", x, y), Predicate("P", a, b)) == {x: a, y: b}
+    assert match(Predicate("P", x), Predicate("Q", a)) is None
+    assert match(Predicate("P", x), Predicate("P", a, b)) is None
+    assert match(Forall(x, Predicate("P", x)), Forall(y, Predicate("P", y))) == {x: y}
+
+
+def test_bindings_are_consistent():
+    assert match(Predicate("P", x, x), Predicate("P", a, a)) == {x: a}
+    assert match(Predicate("P", x, x), Predicate("P", a, b)) is None
+    assert match(Predicate("P", x), Predicate("P", b), {x: a}) is None
+    # A bound variable does not match itself, as a separate node or as the same one.
+    assert match(And(Predicate("P", x), Predicate("Q", x)), And(Predicate("P", y), Predicate("Q", x))) is None
+    shared = Predicate("Q", x)
+    assert match(And(Predicate("P", x), shared), And(Predicate("P", y), shared)) is None
+    # A variable that matched itself is bound to itself, whichever side comes first.
+    assert match(Predicate("P", x), Predicate("P", x)) == {x: x}
+    assert match(And(Predicate("P", x), Predicate("Q", x)), And(Predicate("P", x), Predicate("Q", y))) is None
+    assert match(And(Predicate("P", x), shared), And(shared, Predicate("Q", y))) is None
+    assert match(And(shared, Predicate("P", x)), And(Predicate("Q", y), shared)) is None
+    assert match(And(shared, Predicate("P", x)), And(shared, Predicate("P", y))) is None
+    assert Rule("Same", [Predicate("P", x), Predicate("Q", x)], Predicate("R", x)).apply(
+        Predicate("P", x), Predicate("Q", y)) is None
+    assert Rule("Same", [Predicate("P", x), Predicate("Q", x)], Predicate("R", x)).apply(
+        Predicate("P", x), Predicate("Q", x)) == Predicate("R", x)
+
+
+def test_higher_order_functions():
+    g, h = HigherOrderFunction("g"), HigherOrderFunction("h")
+    pattern = HigherOrderFunction("f", g, None, x)
+    # The return function the pattern leaves out matches any.
+    assert pattern.match(HigherOrderFunction("f", g, h, a)) == {x: a}
+    assert pattern.match(HigherOrderFunction("f", h, h, a)) is None
+    assert pattern.match(HigherOrderFunction("f", None, h, a)) is None
+    assert pattern.match(HigherOrderFunction("k", g, h, a)) is None
+    assert pattern.match(HigherOrderFunction("f", g, h, a, b)) is None
+    assert pattern.match(Predicate("f", a)) is None
+    assert HigherOrderFunction("f", None, None, x, x).match(HigherOrderFunction("f", None, None, a, b)) is None
+    assert pattern.match(HigherOrderFunction("f", g, None, b), {x: a}) is None
+
+
+def test_operators_only_match_their_own_type():
+    p, q = Proposition("p"), Proposition("q")
+    assert match(And(p, q), And(p, q)) == {}
+    assert match(And(p, q), Or(p, q)) is None
+    assert match(Not(Predicate("P", x)), Predicate("P", a)) is None
+    assert match(Exists(x, Predicate("P", x)), Exists(a, Predicate("P", b))) is None
+    assert match(p, q) is None
+    assert match(Implication(Predicate("P", x), Necessity(Predicate("Q", x))),
+                 Implication(Predicate("P", a), Necessity(Predicate("Q", a)))) == {x: a}
+
+
+def test_failed_match_undoes_its_bindings():
+    matcher = Matcher()
+    assert matcher.match(Predicate("P", x), Predicate("P", a))
+    assert not matcher.match(Predicate("Q", y, x), Predicate("Q", b, b))
+    assert matcher.bindings == {x: a}
+
+    mark = matcher.mark()
+    assert matcher.match(Predicate("Q", y), Predicate("Q", b))
+    assert matcher.bindings == {x: a, y: b}
+    matcher.undo(mark)
+    assert matcher.bindings == {x: a}
+    assert matcher.trail == [x]
+
+
+def test_rule_bindings_agree_across_premises():
+    rule = Rule("Same", [Predicate("P", x), Predicate("Q", x)], Predicate("R", x))
+    assert rule.apply(Predicate("P", a), Predicate("Q", a)) == Predicate("R", a)
+    assert rule.apply(Predicate("P", a), Predicate("Q", b)) is None
+
+
+def test_match_deeper_than_the_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    pattern, instance = Predicate("P", x), Predicate("P", a)
+    for _ in range(depth):
+        pattern, instance = Not(pattern), Not(instance)
+    assert match(pattern, instance) == {x: a}
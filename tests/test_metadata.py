@@ -0,0 +1,85 @@
+import sys
+
+from symlogos.connectives import And, Conjunction, Implication, Not, Or
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.metadata import hash_bottom_up, metadata
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.transform import substitute
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+x, y, a = Term("x"), Term("y"), Term("A")
+
+
+def test_propositional_metadata():
+    formula = Implication(And(p, Not(q)), Or(q, Necessity(Possibility(r))))
+    data = formula.metadata
+    assert data.size == 10 and data.height == 5
+    assert data.atoms == {p, q, r}
+    assert data.positive_atoms == {q, r} and data.negative_atoms == {p}
+    assert data.modal_depth == 2 and data.quantifier_depth == 0
+    assert metadata(Conjunction(p, True)).size == 3
+    assert metadata(True).size == 1
+
+
+def test_first_order_metadata():
+    Pxy = Predicate("P", x, FunctionApplication("f", y, a))
+    formula = Forall(x, Exists("z", And(Pxy, Predicate("Q", "z"))))
+    data = formula.metadata
+    assert data.free_variables == {y}
+    assert data.terms == {x, y, a, "z"}
+    assert data.quantifier_depth == 2
+    assert Pxy.metadata.size == 5 and Pxy.metadata.free_variables == {x, y}
+    assert Or(Pxy, p).variables() == {x, y}
+    assert FunctionApplication("f", y, a).variables() == {y}
+    assert Forall(x, Predicate("P", "x", y)).metadata.free_variables == {y}
+    assert Exists("y", Predicate("P", x, y)).metadata.free_variables == {x}
+
+
+def test_metadata_is_computed_once_and_shared():
+    shared = p
+    for _ in range(100):
+        shared = And(shared, Not(shared))
+    data = shared.metadata
+    assert data.size > 2 ** 100 and data.height == 201
+    assert shared.metadata is data
+    assert shared.left.metadata.atoms is data.atoms
+
+
+def test_deep_formulas():
+    formula = p
+    for i in range(2 * sys.getrecursionlimit()):
+        formula = Implication(Proposition(f"a{i % 10}"), formula)
+    assert formula.metadata.height == 2 * sys.getrecursionlimit() + 1
+    assert formula.metadata.positive_atoms == {p}
+
+
+def test_sets_of_long_chains_are_computed_lazily():
+    atoms = [Proposition(f"a{i}") for i in range(2 * sys.getrecursionlimit())]
+    formula = atoms[0]
+    for atom in atoms[1:]:
+        formula = And(formula, Not(atom))
+    data = formula.metadata
+    assert data._sets is None
+    assert data.atoms == set(atoms) and data.positive_atoms == {atoms[0]}
+    assert data.negative_atoms == set(atoms[1:]) and data.negative_atoms - {atoms[1]} == set(atoms[2:])
+    assert formula.left.metadata._sets is not None
+
+
+def test_hash_bottom_up_hashes_deep_formulas_without_recursing():
+    formula = p
+    for i in range(2 * sys.getrecursionlimit()):
+        formula = Not(And(Proposition(f"a{i % 10}"), formula))
+    hash_bottom_up(formula)
+    assert formula._hash is not None and formula._metadata is None
+    assert hash(formula) == formula._hash
+
+
+def test_substitution_skips_subformulas_without_the_terms():
+    left = Forall(y, Predicate("P", y))
+    formula = And(left, Predicate("Q", x))
+    result = substitute(formula, {x: a})
+    assert result == And(left, Predicate("Q", a))
+    assert result.left is left
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+from symlogos import hash_consing
+from symlogos.batch_eval import BatchEvaluator
+from symlogos.bdd import BDD
+from symlogos.connectives import And, Conjunction, Disjunction, Implication, Not, Or
+from symlogos.proposition import Proposition
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import WorklistTableau, expand_formula
+from symlogos.tableau_prover import TableauProver
+from symlogos.transform import to_binary, to_nary
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+
+
+def chain(length):
+    formula = p
+    for i in range(length):
+        formula = And(formula, Proposition(f"a{i}"))
+    return formula
+
+
+def test_canonical_form():
+    assert Conjunction(p, q) == Conjunction(q, p)
+    assert hash(Conjunction(p, q)) == hash(Conjunction(q, p))
+    assert Conjunction(p, Conjunction(q, r), p) == Conjunction(r, q, p)
+    assert len(Conjunction(p, p, q).operands) == 2
+    assert Conjunction(p, q) != Disjunction(p, q)
+    with hash_consing.hash_consing():
+        assert Disjunction(p, q, r) is Disjunction(r, Disjunction(q, p))
+
+
+def test_conversions():
+    formula = Implication(And(And(p, q), Or(r, Or(q, r))), Not(And(q, p)))
+    nary = to_nary(formula)
+    assert nary == Implication(Conjunction(p, q, Disjunction(q, r)), Not(Conjunction(p, q)))
+    assert to_nary(to_binary(nary)) == nary
+    assert to_nary(And(p, p)) == p
+    assert to_binary(Conjunction()) is True and to_binary(Disjunction(p)) == p
+
+
+def test_long_chains_without_recursion():
+    length = 2 * sys.getrecursionlimit()
+    nary = to_nary(chain(length))
+    assert isinstance(nary, Conjunction) and len(nary.operands) == length + 1
+    assert nary == to_nary(chain(length))
+    binary = to_binary(nary)
+    depth, node = 0, binary
+    while isinstance(node, And):
+        node, depth = node.left, depth + 1
+    assert depth <= length.bit_length()
+
+
+def test_alpha_rule_takes_every_operand_at_once():
+    kind, results = expand_formula(SignedFormula("T", Conjunction(p, q, r)), 0)
+    assert kind == "alpha" and {result.formula for result in results} == {p, q, r}
+    kind, results = expand_formula(SignedFormula("F", Conjunction(p, q, r)), 0)
+    assert kind == "beta" and len(results) == 3
+
+    nary, binary = WorklistTableau(), WorklistTableau()
+    assert nary.is_closed([to_nary(chain(50))], p)
+    assert binary.is_closed([chain(50)], p)
+    assert nary.expansions["alpha"] == 1 and binary.expansions["alpha"] == 50
+
+
+def test_nary_formulas_everywhere():
+    formula = Disjunction(Conjunction(p, q), Not(r), Conjunction())
+    assert Not(formula).to_nnf() == Conjunction(Disjunction(Not(p), Not(q)), r, Disjunction())
+    assert Conjunction(p, True, q).simplify() == Conjunction(p, q)
+    assert Disjunction(p, True).simplify() is True
+
+    prover = TableauProver()
+    assert prover.is_sound([Conjunction(p, Implication(p, q))], Disjunction(q, r))
+    assert not prover.is_sound([Disjunction(p, q)], p)
+
+    atoms = [p, q, r]
+    binary = to_binary(formula)
+    rows = np.array([[bool(row >> shift & 1) for shift in (2, 1, 0)] for row in range(8)])
+    assert (BatchEvaluator(formula, atoms).evaluate(rows) == BatchEvaluator(binary, atoms).evaluate(rows)).all()
+    manager = BDD()
+    assert manager.from_formula(formula) == manager.from_formula(binary)
+
+
+def test_canonical_order_does_not_depend_on_the_hash_seed():
+    script = ("from symlogos.connectives import Conjunction, Not\n"
+              "from symlogos.proposition import Proposition\n"
+              "print(Conjunction(*(Proposition(name) for name in 'pqrstuvw'), Not(Proposition('a'))))")
+    outputs = {subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                              env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+               for seed in ("1", "2", "3")}
+    assert len(outputs) == 1
@@ -73,3 +73,20 @@ def test_rule_to_nnf():
     assert nnf_rule.premises[1] == p.to_nnf()
     assert nnf_rule.conclusion == q.to_nnf()
 
+
+def test_negated_connectives_to_nnf():
+    p = Proposition("p")
+    q = Proposition("q")
+    assert Not(And(p, q)).to_nnf() == Or(Not(p), Not(q))
+    assert Not(Or(p, Not(q))).to_nnf() == And(Not(p), q)
+    assert Not(Implication(p, q)).to_nnf() == And(p, Not(q))
+    assert Not(Not(Implication(p, q))).to_nnf() == Or(Not(p), q)
+
+def test_negated_modal_and_quantified_to_nnf():
+    from symlogos.modal_operators import Necessity, Possibility
+    p = Proposition("p")
+    Px = Predicate("P", "x")
+    assert Not(Necessity(And(p, p))).to_nnf() == Possibility(Or(Not(p), Not(p)))
+    assert Not(Possibility(p)).to_nnf() == Necessity(Not(p))
+    assert Not(Forall("x", Px)).to_nnf() == Exists("x", Not(Px))
+    assert Not(Exists("x", Px)).to_nnf() == Forall("x", Not(Px))
@@ -0,0 +1,84 @@
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.first_order_rules import AlphaRule, DeltaRule, GammaRule, NegationRule
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.modal_rules import ModalBoxTRule, ModalDiamondFRule
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.rule_registry import RuleRegistry, default_registry
+from symlogos.rules import TableauRule
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_node import TableauNode
+from symlogos.tableau_prover import TableauProver
+
+A, B = Proposition("A"), Proposition("B")
+x = Term("x")
+
+
+@pytest.mark.parametrize("signed_formula, rule", [
+    (SignedFormula("T", And(A, B)), AlphaRule),
+    (SignedFormula("F", Or(A, B)), AlphaRule),
+    (SignedFormula("F", Not(A)), NegationRule),
+    (SignedFormula("F", Exists(x, Predicate("P", x))), GammaRule),
+    (SignedFormula("F", Forall(x, Predicate("P", x))), DeltaRule),
+    (SignedFormula("T", Necessity(A)), ModalBoxTRule),
+    (SignedFormula("F", Possibility(A)), ModalDiamondFRule),
+    (SignedFormula("T", A), None),
+    (SignedFormula("T", Implication(A, B)), None),
+])
+def test_builtin_rules(signed_formula, rule):
+    assert default_registry.rule_for(signed_formula) is rule
+
+
+def test_expansions_match_the_rules():
+    for signed_formula in (SignedFormula("T", And(A, B)), SignedFormula("F", Or(A, B)), SignedFormula("T", Not(A)),
+                           SignedFormula("F", Necessity(A), 2), SignedFormula("T", Possibility(A))):
+        rule = default_registry.rule_for(signed_formula)
+        assert default_registry.expand(None, signed_formula) == rule(signed_formula).apply()
+    assert default_registry.expand(None, SignedFormula("T", A)) == []
+
+    signed_formula = SignedFormula("F", Exists(x, Predicate("P", x)))
+    node = TableauNode(signed_formula)
+    assert default_registry.expand(node, signed_formula) == [SignedFormula("T", Predicate("P", Term("v_0")))]
+
+
+class ImplicationRule(TableauRule):
+    expands = (("T", Implication), ("F", Implication))
+
+    def is_applicable(self):
+        return isinstance(self.signed_formula.formula, Implication)
+
+    def apply(self):
+        formula = self.signed_formula.formula
+        if self.signed_formula.sign == "T":
+            return [SignedFormula("F", formula.antecedent), SignedFormula("T", formula.consequent)]
+        return [SignedFormula("T", formula.antecedent), SignedFormula("F", formula.consequent)]
+
+
+def test_third_party_rules_register_without_touching_the_prover():
+    registry = default_registry.copy()
+    assert registry.register(ImplicationRule) is ImplicationRule
+    assert registry.rule_for(SignedFormula("F", Implication(A, B))) is ImplicationRule
+    assert ("T", Implication) not in default_registry
+
+    for rules, expected in ((default_registry, []), (registry, [SignedFormula("F", A), SignedFormula("T", B)])):
+        node = TableauNode(SignedFormula("T", Implication(A, B)))
+        TableauProver(engine="recursive", rules=rules).tableau_expansion(node)
+        assert [child.signed_formula for child in node.children] == expected
+
+    registry.unregister("T", Implication)
+    assert registry.expand(None, SignedFormula("T", Implication(A, B))) == []
+    assert registry.expand(None, SignedFormula("F", Implication(A, B))) == [SignedFormula("T", A), SignedFormula("F", B)]
+
+
+def test_registration_needs_keys():
+    registry = RuleRegistry()
+    with pytest.raises(ValueError):
+        registry.register(TableauRule)
+    with pytest.raises(ValueError):
+        registry.register(AlphaRule, "X", And)
+    registry.register(AlphaRule, "T", And)
+    assert len(registry) == 1
+    assert registry.rule_for(SignedFormula("F", And(A, B))) is None
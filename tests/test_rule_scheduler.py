@@ -0,0 +1,59 @@
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import LOGICS, RULE_CLASSES, WorklistTableau, rule_class
+from symlogos.tracing import DEBUG, RingBufferSink, tracing
+from tests.test_labelled_tableau import SCHEMAS
+
+p, q = Proposition("p"), Proposition("q")
+x = Term("x")
+P = Predicate("P", x)
+
+
+@pytest.mark.parametrize("signed_formula, expected", [
+    (SignedFormula("T", And(p, q)), "alpha"),
+    (SignedFormula("F", And(p, q)), "beta"),
+    (SignedFormula("T", Or(p, q)), "beta"),
+    (SignedFormula("F", Implication(p, q)), "alpha"),
+    (SignedFormula("T", Not(p)), "alpha"),
+    (SignedFormula("T", p), "alpha"),
+    (SignedFormula("T", Exists(x, P)), "delta"),
+    (SignedFormula("F", Forall(x, P)), "delta"),
+    (SignedFormula("T", Forall(x, P)), "gamma"),
+    (SignedFormula("F", Exists(x, P)), "gamma"),
+    (SignedFormula("F", Necessity(p), 2), "modal"),
+    (SignedFormula("T", Possibility(p)), "modal"),
+])
+def test_rule_class(signed_formula, expected):
+    assert rule_class(signed_formula) == expected
+
+
+def test_alpha_before_beta_avoids_splits():
+    premises = [Or(Proposition(f"a{i}"), Proposition(f"b{i}")) for i in range(6)]
+    premises.append(And(Not(Proposition("a0")), Not(Proposition("b0"))))
+    scheduled, derived = WorklistTableau(), WorklistTableau(schedule=False)
+    assert scheduled.is_closed(premises, q) and derived.is_closed(premises, q)
+    assert scheduled.branches == 1
+    assert scheduled.expansions["beta"] == 1
+    assert derived.branches > 100
+    assert set(scheduled.expansions) == set(RULE_CLASSES)
+
+
+def test_delta_before_gamma():
+    engine = WorklistTableau()
+    with tracing(RingBufferSink(), level=DEBUG) as sink:
+        engine.is_closed([Forall(x, P), Exists(x, Not(P))], q)
+    expanded = [event.fields["formula"].formula for event in sink.events if event.name == "formula_expanded"]
+    assert expanded.index(Exists(x, Not(P))) < expanded.index(Forall(x, P))
+    assert engine.expansions["delta"] == engine.expansions["gamma"] == 1
+
+
+@pytest.mark.parametrize("logic", LOGICS)
+def test_order_does_not_change_verdicts(logic):
+    for schema, valid_in in SCHEMAS:
+        assert WorklistTableau(logic, schedule=False).is_closed([], schema) == (logic in valid_in)
@@ -0,0 +1,113 @@
+import itertools
+import random
+
+import pytest
+from symlogos.cnf import TseitinEncoder, is_propositional
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.modal_operators import Necessity
+from symlogos.proposition import Proposition
+from symlogos.sat_solver import SATSolver, luby, solve
+from symlogos.tableau_prover import TableauProver
+from tests.test_tableau_engine import INVALID_ARGUMENTS, VALID_ARGUMENTS
+
+
+def brute_force(clauses, num_vars):
+    for values in itertools.product([False, True], repeat=num_vars):
+        if all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses):
+            return True
+    return False
+
+
+def satisfies(model, clauses):
+    return all(any(model[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+def pigeonhole(holes):
+    def var(pigeon, hole):
+        return pigeon * holes + hole + 1
+    clauses = [[var(p, h) for h in range(holes)] for p in range(holes + 1)]
+    for h in range(holes):
+        for p, q in itertools.combinations(range(holes + 1), 2):
+            clauses.append([-var(p, h), -var(q, h)])
+    return clauses
+
+
+def test_luby_sequence():
+    assert [luby(i) for i in range(15)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_trivial_instances():
+    assert solve([]) == {}
+    assert solve([[1], [-1]]) is None
+    assert solve([[1, -1]]) is not None
+    assert solve([[1], [-1, 2], [-2, 3]]) == {1: True, 2: True, 3: True}
+    with pytest.raises(ValueError):
+        SATSolver([[0]])
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_3sat_agrees_with_brute_force(seed):
+    rng = random.Random(seed)
+    num_vars = 10
+    clauses = [[rng.choice([-1, 1]) * rng.randint(1, num_vars) for _ in range(3)] for _ in range(43)]
+    solver = SATSolver(clauses)
+    result = solver.solve()
+    assert result == brute_force(clauses, num_vars)
+    if result:
+        assert satisfies(solver.model(), clauses)
+
+
+def test_pigeonhole_is_unsatisfiable():
+    solver = SATSolver(pigeonhole(5))
+    assert not solver.solve()
+    assert solver.conflicts > 0
+
+
+def test_incremental_clauses():
+    solver = SATSolver([[1, 2]])
+    assert solver.solve()
+    solver.add_clause([-1])
+    assert solver.solve()
+    assert solver.value(2)
+    solver.add_clause([-2])
+    assert not solver.solve()
+
+
+def test_tens_of_thousands_of_clauses():
+    rng = random.Random(7)
+    num_vars = 10000
+    clauses = [[rng.choice([-1, 1]) * rng.randint(1, num_vars) for _ in range(3)] for _ in range(3 * num_vars)]
+    atoms = [Proposition(f"p{i}") for i in range(20000)]
+    encoder = TseitinEncoder()
+    encoder.add_all([atoms[0]] + [Implication(atoms[i], atoms[i + 1]) for i in range(len(atoms) - 1)])
+    encoder.add(Not(atoms[-1]))
+    assert not SATSolver(encoder.clauses).solve()
+
+    assert len(clauses) == 30000
+    solver = SATSolver(clauses)
+    assert solver.solve()
+    assert satisfies(solver.model(), clauses)
+
+
+@pytest.mark.parametrize("premises, conclusion", VALID_ARGUMENTS)
+def test_sat_engine_proves_valid_arguments(premises, conclusion):
+    assert TableauProver(engine="sat").is_sound(premises, conclusion)
+
+
+@pytest.mark.parametrize("premises, conclusion", INVALID_ARGUMENTS)
+def test_sat_engine_rejects_invalid_arguments(premises, conclusion):
+    assert not TableauProver(engine="sat").is_sound(premises, conclusion)
+    assert TableauProver().is_sound(premises, conclusion) == TableauProver(engine="worklist").is_sound(premises, conclusion)
+
+
+def test_routing():
+    p, q = Proposition("p"), Proposition("q")
+    assert is_propositional(Implication(And(p, True), Not(q)))
+    assert not is_propositional(Implication(Necessity(p), q))
+
+    prover = TableauProver()
+    assert prover.is_satisfiable([Or(p, q), Not(p)])
+    assert not prover.is_satisfiable([And(p, Not(p))])
+    assert prover.is_satisfiable([Necessity(p), Not(q)])
+    with pytest.raises(ValueError):
+        TableauProver(engine="sat").is_sound([], Necessity(p))
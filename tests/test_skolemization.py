@@ -0,0 +1,96 @@
+import sys
+
+import pytest
+from symlogos.connectives import And, Implication, Not, Or
+from symlogos.expressions_and_terms import Term
+from symlogos.free_variable_tableau import FreeVariableTableau
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.modal_operators import Necessity
+from symlogos.proof_result import ProofResult
+from symlogos.quantifiers import Exists, Forall
+from symlogos.skolemization import Skolemizer, skolemize
+
+x, y, z = Term("x"), Term("y"), Term("z")
+a = Term("a")
+
+
+def P(term):
+    return Predicate("P", term)
+
+
+def Q(term):
+    return Predicate("Q", term)
+
+
+def R(left, right):
+    return Predicate("R", left, right)
+
+
+def quantifiers(formula):
+    stack, found = [formula], []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (Forall, Exists)):
+            found.append(node)
+        stack.extend(value for value in getattr(node, "args", ()) if not isinstance(value, tuple))
+    return found
+
+
+def test_existentials_become_skolem_terms():
+    [result] = skolemize([Forall(x, Exists(y, R(x, y)))])
+    assert isinstance(result, Forall)
+    term = result.predicate.terms[1]
+    assert isinstance(term, FunctionApplication) and term.arguments == (result.variable,)
+    assert all(isinstance(quantifier, Forall) for quantifier in quantifiers(result))
+
+
+def test_skolem_terms_only_take_the_universals_they_use():
+    [result] = skolemize([Forall(x, Exists(y, And(P(x), Q(y))))])
+    # ∀x P(x) ∧ Q(c): miniscoping moved ∃y out of the scope of ∀x.
+    assert isinstance(result, And)
+    assert isinstance(result.left, Forall)
+    assert isinstance(result.right.terms[0], Term)
+
+
+def test_miniscoping():
+    [result] = skolemize([Forall(x, Or(P(x), Q(a)))])
+    assert isinstance(result, Or) and result.right == Q(a)
+    [result] = skolemize([Forall(x, And(P(x), Q(x)))])
+    assert isinstance(result, And)
+    assert result.left.variable != result.right.variable
+    assert skolemize([Forall(x, P(a))]) == [P(a)]
+
+
+def test_negation_is_pushed_through_quantifiers():
+    [result] = skolemize([Not(Exists(x, Forall(y, R(x, y))))])
+    assert isinstance(result, Forall) and isinstance(result.predicate, Not)
+    assert isinstance(result.predicate.expr.terms[1], FunctionApplication)
+
+
+def test_names_are_fresh_across_formulas():
+    sk0 = Term("sk0")
+    results = skolemize([Exists(x, P(x)), P(sk0)])
+    assert results[0] != P(sk0)
+    assert results[1] == P(sk0)
+
+
+def test_modal_formulas_are_rejected():
+    with pytest.raises(ValueError):
+        Skolemizer().preprocess(Exists(x, Necessity(P(x))))
+
+
+def test_preprocessing_saves_instantiations():
+    conclusion = Exists(x, Forall(y, Forall(z, Implication(Implication(P(y), Q(z)), Implication(P(x), Q(x))))))
+    raw, preprocessed = FreeVariableTableau(preprocess=False), FreeVariableTableau()
+    assert raw.prove([], conclusion) is ProofResult.PROVED
+    assert preprocessed.prove([], conclusion) is ProofResult.PROVED
+    assert preprocessed.instantiations < raw.instantiations
+
+
+def test_long_conjunctions_do_not_recurse():
+    body = P(x)
+    for i in range(2 * sys.getrecursionlimit()):
+        body = And(body, Predicate(f"P{i}", x))
+    [result] = skolemize([Exists(y, Forall(x, body))])
+    assert isinstance(result, And)
+    assert FreeVariableTableau().prove([Forall(x, body)], Predicate("P3", a)) is ProofResult.PROVED
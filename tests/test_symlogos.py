@@ -61,8 +61,10 @@ def test_forall_substitution():
     c = Term("c")
     P = Predicate("P", x)
     forall_px = Forall(x, P)
-    result = forall_px.substitute({x: c})
-    assert result == Forall(c, Predicate("P", c))
+    # x is bound, so substituting for it changes nothing; only free occurrences are replaced.
+    assert forall_px.substitute({x: c}) is forall_px
+    assert forall_px.subs({x: c}) == Forall(c, Predicate("P", c))
+    assert forall_px.predicate.substitute({x: c}) == Predicate("P", c)
 
 def test_exists():
     y = symbols("y")
@@ -0,0 +1,58 @@
+import pytest
+import sympy
+
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Symbol, Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Forall, Exists
+from symlogos.sympy_bridge import from_sympy, to_sympy
+
+
+p, q = Proposition("p"), Proposition("q")
+x, a = Term("x"), Term("a")
+
+
+@pytest.mark.parametrize("formula", [
+    Implication(p, Not(q)),
+    Necessity(Possibility(p)),
+    Forall(x, Predicate("P", x)),
+    Exists(x, Predicate("Q", x, a)),
+    Or(p, And(p, q)),
+    FunctionApplication("f", x, a),
+])
+def test_round_trip(formula):
+    assert from_sympy(to_sympy(formula)) == formula
+
+
+def test_connectives_map_to_sympy_boolean_functions():
+    P, Q = sympy.symbols("p q")
+    assert to_sympy(Implication(p, Not(q))) == sympy.Implies(P, sympy.Not(Q))
+    assert to_sympy(And(p, q)) == sympy.And(P, Q)
+    assert from_sympy(P & (Q | ~P)) == And(p, Or(q, Not(p)))
+
+
+def test_unknown_objects_are_rejected():
+    with pytest.raises(TypeError):
+        to_sympy(object())
+    with pytest.raises(TypeError):
+        from_sympy(sympy.Integer(3))
+
+
+def test_nodes_have_no_instance_dict():
+    for node in (p, x, Not(p), And(p, q), Necessity(p), Forall(x, Predicate("P", x))):
+        assert not hasattr(node, "__dict__")
+
+
+def test_symbols_are_interned():
+    assert Symbol("p") is Symbol("p")
+    assert p.name is Proposition("p").name
+    assert Symbol("x") == sympy.Symbol("x")
+
+
+def test_subs_replaces_inside_predicates():
+    formula = Implication(Predicate("P", x), q)
+    assert formula.subs({x: a}) == Implication(Predicate("P", a), q)
+    assert formula.subs({q: p}) == Implication(Predicate("P", x), p)
+    assert formula.subs({}) is formula
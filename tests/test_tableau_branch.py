@@ -0,0 +1,130 @@
+from symlogos.connectives import And, Not
+from symlogos.expressions_and_terms import Term
+from symlogos.first_order_rules import GammaRule
+from symlogos.functions_and_predicates import Predicate
+from symlogos.persistent_set import PersistentSet
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_branch import Branch
+from symlogos.tableau_node import TableauNode
+from symlogos.tableau_prover import TableauProver
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+    def __hash__(self):
+        return 42
+
+
+def test_persistent_set_shares_and_does_not_mutate():
+    empty = PersistentSet()
+    numbers = empty
+    for i in range(1000):
+        numbers = numbers.add(i)
+
+    assert len(empty) == 0
+    assert len(numbers) == 1000
+    assert all(i in numbers for i in range(1000))
+    assert 1000 not in numbers
+    assert set(numbers) == set(range(1000))
+
+    more = numbers.add(1000)
+    assert 1000 in more and 1000 not in numbers
+    assert numbers.add(5) is numbers
+
+
+def test_persistent_set_hash_collisions():
+    keys = [CollidingKey(i) for i in range(5)]
+    collisions = PersistentSet()
+    for key in keys:
+        collisions = collisions.add(key)
+
+    assert len(collisions) == 5
+    assert all(CollidingKey(i) in collisions for i in range(5))
+    assert CollidingKey(7) not in collisions
+    fewer = collisions.discard(CollidingKey(2))
+    assert len(fewer) == 4 and CollidingKey(2) not in fewer and CollidingKey(2) in collisions
+    assert fewer.discard(CollidingKey(2)) is fewer
+
+
+def test_persistent_set_discard():
+    numbers = PersistentSet()
+    for i in range(1000):
+        numbers = numbers.add(i)
+    evens = numbers
+    for i in range(1, 1000, 2):
+        evens = evens.discard(i)
+    assert len(evens) == 500 and evens == set(range(0, 1000, 2))
+    assert len(numbers) == 1000 and 1 in numbers
+    assert evens.discard(1) is evens
+    empty = evens
+    for i in range(0, 1000, 2):
+        empty = empty.discard(i)
+    assert len(empty) == 0 and empty == set() and 0 not in empty
+
+
+def test_branch_closes_on_insertion():
+    A = Proposition("A")
+    B = Proposition("B")
+    branch = Branch().extend(SignedFormula("T", A)).extend(SignedFormula("T", B))
+    assert not branch.closed
+    assert branch.depth == 2
+    assert SignedFormula("T", A) in branch
+
+    closed = branch.extend(SignedFormula("F", A))
+    assert closed.closed
+    assert not branch.closed
+
+
+def test_branch_siblings_are_independent():
+    A = Proposition("A")
+    parent = Branch().extend(SignedFormula("T", And(A, A)))
+    left = parent.extend(SignedFormula("T", A))
+    right = parent.extend(SignedFormula("F", A))
+
+    assert SignedFormula("T", A) in left
+    assert SignedFormula("T", A) not in right
+    assert not left.closed and not right.closed
+
+
+def test_tableau_node_tracks_closure():
+    A = Proposition("A")
+    root = TableauNode(SignedFormula("T", A))
+    child = root.add_child(SignedFormula("T", Proposition("B")))
+    grandchild = child.add_child(SignedFormula("F", A))
+
+    prover = TableauProver()
+    assert not prover._is_tableau_closed(child)
+    assert prover._is_tableau_closed(grandchild)
+
+
+def test_fresh_variables_are_counted_per_branch():
+    x = Term("x")
+    sf = SignedFormula("F", Exists(x, Predicate("P", x)))
+    node = TableauNode(sf)
+
+    first = GammaRule(sf).apply(node)[0]
+    second = GammaRule(sf).apply(first)[0]
+
+    assert first.signed_formula.formula == Predicate("P", Term("v_0"))
+    assert second.signed_formula.formula == Predicate("P", Term("v_1"))
+    assert second.get_next_fresh_variable_index() == 2
+
+
+def test_expansion_uses_a_new_fresh_variable_at_each_step():
+    x, y = Term("x"), Term("y")
+    root = TableauNode(SignedFormula("F", Forall(x, Not(Forall(y, Predicate("Q", x, y))))))
+    TableauProver().tableau_expansion(root)
+
+    formulas, node = [], root
+    while node.children:
+        assert len(node.children) == 1
+        node = node.children[0]
+        formulas.append(node.signed_formula)
+    assert formulas[-1] == SignedFormula("T", Predicate("Q", Term("v_0"), Term("v_1")))
@@ -0,0 +1,91 @@
+import sys
+
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.modal_operators import Necessity
+from symlogos.proof_result import ProofResult
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import WorklistTableau
+from symlogos.tableau_prover import TableauProver
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+
+VALID_ARGUMENTS = [
+    ([], Implication(A, Implication(B, A))),
+    ([Implication(A, B), A], B),
+    ([Implication(A, B), Implication(B, C), A], C),
+    ([A, Implication(A, B), Implication(B, C)], C),
+    ([], Implication(And(A, B), And(B, A))),
+    ([], Implication(Or(A, B), Or(B, A))),
+    ([], Or(A, Not(A))),
+    ([Or(A, B), Not(A)], B),
+]
+
+INVALID_ARGUMENTS = [
+    ([], A),
+    ([Implication(A, B), B], A),
+    ([Or(A, B)], And(A, B)),
+    ([], Implication(Or(A, B), And(A, B))),
+]
+
+
+@pytest.mark.parametrize("premises, conclusion", VALID_ARGUMENTS)
+def test_worklist_engine_agrees_with_recursive_engine(premises, conclusion):
+    assert TableauProver(engine="worklist").is_sound(premises, conclusion)
+    assert TableauProver(engine="recursive").is_sound(premises, conclusion)
+
+
+@pytest.mark.parametrize("premises, conclusion", INVALID_ARGUMENTS)
+def test_worklist_engine_rejects_invalid_arguments(premises, conclusion):
+    assert not TableauProver(engine="worklist").is_sound(premises, conclusion)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        TableauProver(engine="magic")
+
+
+def test_long_implication_chain_does_not_recurse():
+    atoms = [Proposition(f"p{i}") for i in range(20000)]
+    premises = [atoms[0]] + [Implication(atoms[i], atoms[i + 1]) for i in range(len(atoms) - 1)]
+
+    engine = WorklistTableau()
+    assert engine.is_closed(premises, atoms[-1])
+    assert engine.max_depth >= len(atoms)
+
+
+def test_deeply_nested_formula_does_not_recurse():
+    depth = 2 * sys.getrecursionlimit()
+    formula = Proposition("p")
+    for i in range(depth):
+        formula = Implication(Proposition(f"p{i}"), formula)
+    assert not WorklistTableau().run([SignedFormula("F", formula)])
+    assert TableauProver(engine="worklist").prove([], formula) == ProofResult.REFUTED
+
+
+def test_open_branch_after_backtracking():
+    # The first alternative of every split closes, the last branch stays open.
+    atoms = [Proposition(f"q{i}") for i in range(50)]
+    premises = [Or(B, atom) for atom in atoms]
+    assert not WorklistTableau().is_closed([Not(B)] + premises, A)
+
+
+def test_quantified_formula_is_instantiated():
+    x = Term("x")
+    premises = [Forall(x, Predicate("P", x))]
+    assert WorklistTableau().is_closed(premises, Predicate("P", Term("v_0")))
+
+
+@pytest.mark.parametrize("logic", ["K", "T", "D", "S4", "S5"])
+def test_successor_worlds_do_not_reuse_fresh_names(logic):
+    # The witness for ∃x and the one for ¬∀y in the successor world must differ.
+    x, y = Term("x"), Term("y")
+    premises = [Exists(x, Necessity(Predicate("P", x)))]
+    conclusion = Necessity(Forall(y, Predicate("P", y)))
+    assert TableauProver(logic=logic).prove(premises, conclusion) != ProofResult.PROVED
@@ -0,0 +1,40 @@
+import sys
+
+from symlogos.connectives import And, Not
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import WorklistTableau
+from symlogos.world_cache import WorldCache
+
+p, q = Proposition("p"), Proposition("q")
+
+
+def nested(depth, formula, operator=Possibility):
+    for _ in range(depth):
+        formula = operator(formula)
+    return formula
+
+
+def test_nesting_deeper_than_the_python_stack():
+    depth = sys.getrecursionlimit() * 2
+    formula = nested(depth, p)
+    engine = WorklistTableau("K", max_worlds=2 * depth)
+    assert not engine.run([SignedFormula("T", formula)])
+    assert engine.worlds_created == depth
+    assert engine.max_nesting == depth
+    assert engine.run([SignedFormula("T", And(formula, nested(depth, Not(p), Necessity)))])
+
+
+def test_nesting_follows_modal_depth_not_worlds_explored():
+    # Every conjunct asks for its own world at depth two; only one chain of
+    # worlds is held at a time.
+    conjuncts = [Possibility(Possibility(Proposition(f"p{i}"))) for i in range(50)]
+    formula = conjuncts[0]
+    for conjunct in conjuncts[1:]:
+        formula = And(formula, conjunct)
+    for logic in ("K", "T", "D"):
+        engine = WorklistTableau(logic, cache=WorldCache(maxsize=1))
+        assert not engine.run([SignedFormula("T", formula)])
+        assert engine.worlds_created >= 100
+        assert engine.max_nesting == 2
@@ -0,0 +1,77 @@
+import io
+import json
+
+from symlogos import tracing
+from symlogos.connectives import Implication, Not
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import Predicate
+from symlogos.proposition import Proposition
+from symlogos.rules import Rule
+from symlogos.tableau_prover import TableauProver
+from symlogos.tracing import DEBUG, INFO, JsonlSink, RingBufferSink, StdoutSink
+
+
+def test_tracing_is_silent_by_default(capsys):
+    A = Proposition("A")
+    B = Proposition("B")
+    assert TableauProver().is_sound([Implication(A, B), A], B)
+    Predicate("P", Term("x")).match(Predicate("P", Term("a")))
+
+    assert capsys.readouterr().out == ""
+    assert tracing.tracer.level == tracing.DISABLED
+
+
+def test_ring_buffer_records_structured_events():
+    x = Term("x")
+    a = Term("a")
+    with tracing.tracing(RingBufferSink(capacity=100)) as sink:
+        Predicate("P", x).match(Predicate("P", a))
+        Predicate("P", x).match(Predicate("Q", a))
+
+    assert sink.names()[-2:] == ["match_succeeded", "match_failed"]
+    succeeded = sink.events[-2]
+    assert succeeded.fields["bindings"] == {x: a}
+    assert tracing.tracer.level == tracing.DISABLED
+
+
+def test_level_gating_drops_debug_events():
+    p = Proposition("p")
+    q = Proposition("q")
+    rule = Rule("Modus Tollens", [Implication(p, q), Not(q)], Not(p))
+    with tracing.tracing(RingBufferSink(), level=INFO) as sink:
+        rule.apply(Implication(p, q), Not(q))
+
+    assert sink.names() == ["rule_fired"]
+    assert sink.events[0].fields["rule"] == "Modus Tollens"
+
+
+def test_ring_buffer_keeps_only_latest_events():
+    sink = RingBufferSink(capacity=3)
+    with tracing.tracing(sink, level=DEBUG):
+        for i in range(10):
+            tracing.tracer.emit(INFO, "tick", index=i)
+    assert [event.fields["index"] for event in sink.events] == [7, 8, 9]
+
+
+def test_branch_events_from_worklist_engine():
+    A = Proposition("A")
+    B = Proposition("B")
+    with tracing.tracing(RingBufferSink(), level=INFO) as sink:
+        TableauProver(engine="worklist").is_sound([Implication(A, B), A], B)
+    assert sink.names()[0] == "proof_started"
+    assert "branch_closed" in sink.names()
+
+
+def test_jsonl_sink_writes_one_object_per_line():
+    stream = io.StringIO()
+    with tracing.tracing(JsonlSink(stream), level=DEBUG):
+        Term("x").match(Term("a"))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records == [{"level": "DEBUG", "event": "match_succeeded", "pattern": "x", "expression": "a", "bindings": {"x": "a"}}]
+
+
+def test_stdout_sink(capsys):
+    with tracing.tracing(StdoutSink(), level=INFO):
+        tracing.tracer.emit(INFO, "branch_closed", depth=3)
+    assert capsys.readouterr().out == "[INFO] branch_closed: depth=3\n"
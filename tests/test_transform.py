@@ -0,0 +1,130 @@
+import random
+import sys
+
+from symlogos.bdd import BDD
+from symlogos.connectives import And, Conjunction, Disjunction, Implication, Not, Or
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.quantifiers import Exists, Forall
+from symlogos.transform import replace, simplify, substitute, to_nnf
+
+p, q, r = Proposition("p"), Proposition("q"), Proposition("r")
+x, a = Term("x"), Term("a")
+
+
+def random_formula(rng, depth):
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice((p, q, r))
+    kind = rng.randrange(5)
+    if kind == 0:
+        return Not(random_formula(rng, depth - 1))
+    if kind == 4:
+        return Conjunction(*(random_formula(rng, depth - 1) for _ in range(3)))
+    cls = (And, Or, Implication)[kind - 1]
+    return cls(random_formula(rng, depth - 1), random_formula(rng, depth - 1))
+
+
+def in_nnf(formula):
+    stack = [formula]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Not):
+            if not isinstance(node.expr, Proposition):
+                return False
+        elif isinstance(node, Implication):
+            return False
+        elif not isinstance(node, Proposition):
+            stack.extend(node.args)
+    return True
+
+
+def test_nnf_is_equivalent():
+    rng = random.Random(3)
+    manager = BDD()
+    for _ in range(200):
+        formula = random_formula(rng, 5)
+        for candidate in (formula, Not(formula)):
+            nnf = to_nnf(candidate)
+            assert in_nnf(nnf)
+            assert manager.from_formula(nnf) == manager.from_formula(candidate)
+
+
+def test_nnf_of_modal_and_quantified_formulas():
+    Px = Predicate("P", x)
+    formula = Not(Necessity(Forall(x, Implication(Px, Possibility(p)))))
+    assert to_nnf(formula) == Possibility(Exists(x, And(Px, Necessity(Not(p)))))
+    assert to_nnf(Not(Not(Exists(x, Px)))) == Exists(x, Px)
+    assert to_nnf(Not(Disjunction(p, True))) == Conjunction(Not(p), False)
+
+
+def test_unchanged_formulas_are_returned_as_they_are():
+    formula = Forall(x, And(Not(Predicate("P", x)), Necessity(Or(p, Not(q)))))
+    assert to_nnf(formula) is formula
+    assert simplify(formula) is formula
+    assert substitute(formula, {a: x}) is formula
+    changed = to_nnf(Or(Not(Not(p)), Not(q)))
+    assert changed == Or(p, Not(q))
+
+
+def test_simplify():
+    assert simplify(Or(False, Not(Not(p)))) == p
+    assert simplify(Or(q, And(p, True))) == Or(q, p)
+    assert simplify(Implication(And(p, q), And(p, q))) is True
+    assert simplify(Implication(Not(False), p)) == p
+    assert simplify(Forall(x, Not(Not(Predicate("P", x))))) == Forall(x, Predicate("P", x))
+    assert simplify(Conjunction(p, Not(True))) is False
+
+
+def test_substitution():
+    f = FunctionApplication("f", x)
+    formula = Exists("x", And(Predicate("P", "x"), Predicate("Q", f)))
+    assert replace(formula, {"x": a, x: a}) == Exists(a, And(Predicate("P", a), Predicate("Q", FunctionApplication("f", a))))
+    # "x" and Term("x") are one variable, bound by the quantifier.
+    assert substitute(formula, {"x": a, x: a}) is formula
+    assert substitute(Predicate("P", f), {f: x, x: a}) == Predicate("P", x)
+    assert substitute(Implication(p, q), {Implication(p, q): r}) == r
+
+
+def test_deep_and_shared_formulas():
+    depth = 2 * sys.getrecursionlimit()
+    formula = p
+    for i in range(depth):
+        formula = Implication(Proposition(f"a{i}"), Not(formula))
+    nnf = to_nnf(formula)
+    assert isinstance(nnf, Or) and in_nnf(nnf)
+    assert simplify(formula) is formula
+    node = substitute(formula, {p: q})
+    for _ in range(depth):
+        node = node.consequent.expr
+    assert node is q
+
+    # 2 ** 200 paths through 200 distinct nodes.
+    shared = p
+    for _ in range(200):
+        shared = And(shared, shared)
+    negated = to_nnf(Not(shared))
+    assert isinstance(negated, Or) and negated.left is negated.right
+    replaced = substitute(shared, {p: q})
+    assert replaced.left is replaced.right
+
+
+def test_substitution_is_simultaneous_and_avoids_capture():
+    y, z = Term("y"), Term("z")
+    assert substitute(Predicate("P", x, y), {x: y, y: x}) == Predicate("P", y, x)
+    formula = Forall(x, Predicate("P", x, y))
+    renamed = substitute(formula, {y: x})
+    x1 = Term("x_1")
+    assert renamed == Forall(x1, Predicate("P", x1, x))
+    # x_1 is taken, so the binder becomes x_2.
+    assert substitute(Exists(x, Predicate("P", x, y, x1)), {y: x}) == Exists(Term("x_2"), Predicate("P", Term("x_2"), x, x1))
+    assert substitute(Forall(x, Predicate("P", x, y)), {y: z}) == Forall(x, Predicate("P", x, z))
+    assert Exists(x, Predicate("P", x)).substitute({x: a}) == Exists(x, Predicate("P", x))
+    bound = Forall(x, Predicate("P", x))
+    assert bound.substitute({Predicate("P", x): q}) is bound
+    assert And(Predicate("P", x), bound).substitute({Predicate("P", x): q}) == And(q, bound)
+    assert replace(bound, {Predicate("P", x): q}) == Forall(x, q)
+    untouched = Necessity(Predicate("Q", z))
+    result = And(untouched, Predicate("P", y)).substitute(y, a)
+    assert result == And(untouched, Predicate("P", a)) and result.left is untouched
@@ -0,0 +1,65 @@
+from symlogos.expressions_and_terms import Term
+from symlogos.functions_and_predicates import FunctionApplication, Predicate
+from symlogos.unification import Substitution, unify
+
+x, y, z, w = Term("x"), Term("y"), Term("z"), Term("w")
+a, b = Term("A"), Term("B")
+
+
+def f(*args):
+    return FunctionApplication("f", *args)
+
+
+def g(*args):
+    return FunctionApplication("g", *args)
+
+
+def test_unify_terms():
+    assert unify(a, a).as_dict() == {}
+    assert unify(a, b) is None
+    assert unify(x, a).as_dict() == {x: a}
+    assert unify(f(x, b), f(a, y)).as_dict() == {x: a, y: b}
+    assert unify(f(x), g(x)) is None
+    assert unify(f(x), f(x, y)) is None
+
+
+def test_unify_predicates():
+    substitution = unify(Predicate("P", x, f(y)), Predicate("P", a, f(x)))
+    assert substitution.resolve(Predicate("P", x, f(y))) == Predicate("P", a, f(a))
+    assert unify(Predicate("P", x), Predicate("Q", x)) is None
+
+
+def test_occurs_check():
+    assert unify(x, f(x)) is None
+    assert unify(f(x, y), f(y, g(x))) is None
+
+
+def test_bindings_are_triangular():
+    substitution = unify(f(x, y, z), f(g(y), g(z), a))
+    # x is bound to g(y), not to the fully resolved g(g(A)).
+    assert substitution.walk(x) == g(y)
+    assert substitution.resolve(x) == g(g(a))
+
+
+def test_aliased_variables_share_one_representative():
+    substitution = Substitution()
+    assert substitution.unify(x, y) and substitution.unify(z, w) and substitution.unify(y, w)
+    assert len({substitution.find(variable) for variable in (x, y, z, w)}) == 1
+    assert substitution.unify(x, a)
+    assert {variable: substitution.resolve(variable) for variable in (x, y, z, w)} == dict.fromkeys((x, y, z, w), a)
+    assert not substitution.unify(z, b)
+
+
+def test_unify_leaves_its_argument_alone():
+    substitution = unify(x, a)
+    assert unify(y, f(x), substitution).resolve(y) == f(a)
+    assert y not in substitution
+    assert unify(x, b, substitution) is None
+    assert substitution.resolve(x) == a
+
+
+def test_custom_variables():
+    rigid = Term("?X")
+    substitution = unify(Predicate("P", rigid, x), Predicate("P", a, x), Substitution({rigid}.__contains__))
+    assert substitution.as_dict() == {rigid: a}
+    assert unify(x, a, Substitution({rigid}.__contains__)) is None
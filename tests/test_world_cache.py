@@ -0,0 +1,58 @@
+import pytest
+from symlogos.connectives import And, Or, Not, Implication
+from symlogos.modal_operators import Necessity, Possibility
+from symlogos.proposition import Proposition
+from symlogos.signed_formula import SignedFormula
+from symlogos.tableau_engine import WorklistTableau
+from symlogos.tableau_prover import TableauProver
+from symlogos.world_cache import WorldCache
+
+p, q, r, s = (Proposition(name) for name in "pqrs")
+
+
+def test_keys_ignore_order_and_duplicates():
+    first = WorldCache.key("K", [SignedFormula("T", p), SignedFormula("F", q)])
+    second = WorldCache.key("K", [SignedFormula("F", q), SignedFormula("T", p), SignedFormula("T", p)])
+    assert first == second
+    assert first != WorldCache.key("T", [SignedFormula("T", p), SignedFormula("F", q)])
+
+
+def test_least_recently_used_label_is_evicted():
+    cache = WorldCache(maxsize=2)
+    cache.put("a", True)
+    cache.put("b", False)
+    assert cache.get("a") is True
+    cache.put("c", True)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    with pytest.raises(ValueError):
+        WorldCache(0)
+
+
+def test_label_is_decided_once_across_branches():
+    # Both branches of the split need a world satisfying {p, ¬p}; it is
+    # searched once and the second branch closes on the cached answer.
+    engine = WorklistTableau("K")
+    formula = And(Or(r, s), And(Possibility(p), Necessity(Not(p))))
+    assert engine.run([SignedFormula("T", formula)])
+    assert engine.worlds_created == 1
+    assert engine.cache.hits == 1
+    key = WorldCache.key("K", [SignedFormula("T", p), SignedFormula("T", Not(p))])
+    assert engine.cache.get(key) is False
+
+
+def test_prover_shares_its_cache_between_proofs():
+    prover = TableauProver(logic="K")
+    axiom = Implication(Necessity(Implication(p, q)), Implication(Necessity(p), Necessity(q)))
+    assert prover.is_sound([], axiom)
+    misses = prover.world_cache.misses
+    assert prover.is_sound([], axiom)
+    assert prover.world_cache.misses == misses
+    assert prover.world_cache.hits > 0
+
+
+def test_bounded_cache_still_decides_correctly():
+    engine = WorklistTableau("T", cache=WorldCache(maxsize=1))
+    assert engine.is_closed([], Implication(Necessity(Necessity(p)), Possibility(Possibility(p))))
+    assert len(engine.cache) <= 1